@@ -18,58 +18,114 @@ cf/CONFIG.md for the authoritative per-var source map + edit/apply recipes.
 """
 
 import os
+import re
 import subprocess
 import sys
 import shlex
-import hashlib
+from collections.abc import Callable, Mapping, Sequence
 from pathlib import Path
+from types import MappingProxyType
 from typing import Optional
-import argparse
+
+# Repo layout — fixed for the process lifetime, so resolved once at import.
+CF_DIR = Path(__file__).resolve().parent
+PROJECT_ROOT = CF_DIR.parent
+API_BINARY_PATH = PROJECT_ROOT / "target" / "x86_64-unknown-linux-gnu" / "release" / "api-server"
+DC_SECRETS_PATH = PROJECT_ROOT / "scripts" / "dc-secrets"
+
+# Local docker-compose stack (dev only — see get_env_config). Read-only so the
+# config can be handed out without a defensive copy per command.
+DEV_ENV_VARS: Mapping[str, str] = MappingProxyType({"ENVIRONMENT": "dev", "NETWORK_NAME": "decent-cloud-dev"})
+DEV_COMPOSE_FILES: tuple[str, ...] = (str(CF_DIR / "docker-compose.dev.yml"),)
+
+
+def _hash_file(path: Path) -> str:
+    """Content hash of `path`, hex-encoded (see calculate_binary_hash for the algorithm)."""
+    import hashlib
+    import mmap
+
+    try:
+        from blake3 import blake3 as new_hasher
+    except ImportError:
+        new_hasher = hashlib.sha256
+
+    with open(path, "rb") as f:
+        try:
+            # One update over a read-only mapping: the OS pages the binary in on
+            # demand and no per-chunk bytes objects are allocated.
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                hasher = new_hasher(mapped)
+        except (ValueError, OSError):  # empty or unmappable file
+            if hasattr(hashlib, "file_digest"):  # Python 3.11+: streams through a C-side buffer
+                hasher = hashlib.file_digest(f, new_hasher)
+            else:
+                hasher = new_hasher()
+                # 1 MiB chunks: memory-bounded without per-4KiB interpreter overhead
+                for chunk in iter(lambda: f.read(1 << 20), b""):
+                    hasher.update(chunk)
+
+    return hasher.hexdigest()
 
 
 def calculate_binary_hash() -> str:
-    """Calculate SHA256 hash of API binary for Docker cache invalidation.
+    """Calculate a content hash of the API binary for Docker cache invalidation.
 
     This ensures Docker rebuilds when the binary changes for ANY reason:
     - Migration changes (embedded via sqlx::migrate!)
     - Code changes (bug fixes, features)
     - Dependency updates
+
+    The hash is only a cache key (no security property), so BLAKE3 is used
+    when the optional ``blake3`` package is installed — roughly an order of
+    magnitude faster than SHA256 — with stdlib SHA256 as the fallback. The key
+    is 16 hex chars either way, so BINARY_HASH keeps its width.
+
+    The result is cached in a sidecar next to the binary, keyed on the binary's
+    (mtime, size, inode): re-deploying after a no-op ``cargo build`` costs one
+    stat instead of a full rehash.
     """
-    cf_dir = Path(__file__).parent
-    binary_path = cf_dir.parent / "target" / "x86_64-unknown-linux-gnu" / "release" / "api-server"
+    import json
 
-    if not binary_path.exists():
+    if not API_BINARY_PATH.exists():
         # The build step should have produced this. If it didn't, the Docker
         # cache key becomes a constant ("no-binary") and stale images may ship —
         # be loud so the operator notices the path/build mismatch instead of
         # silently building from a stale cache.
         print_warning(
-            f"API binary not found at {binary_path} — Docker cache key will be 'no-binary' "
+            f"API binary not found at {API_BINARY_PATH} — Docker cache key will be 'no-binary' "
             f"(stale-cache risk). Ensure build_rust_binaries_natively() ran first."
         )
         return "no-binary"
 
-    hasher = hashlib.sha256()
+    st = API_BINARY_PATH.stat()
+    stat_key = [st.st_mtime_ns, st.st_size, st.st_ino]
+    sidecar = API_BINARY_PATH.with_name(f".{API_BINARY_PATH.name}.hash.json")
+    try:
+        cached = json.loads(sidecar.read_text())
+        if cached.get("stat") == stat_key:
+            return cached["hash"][:16]
+    except (OSError, ValueError, AttributeError, KeyError, TypeError):
+        pass  # no usable sidecar yet — rehash below
 
-    # Hash the binary content
-    with open(binary_path, "rb") as f:
-        # Read in chunks for memory efficiency (binary can be large)
-        for chunk in iter(lambda: f.read(4096), b""):
-            hasher.update(chunk)
+    digest = _hash_file(API_BINARY_PATH)
+    try:
+        sidecar.write_text(json.dumps({"stat": stat_key, "hash": digest}))
+    except OSError as e:
+        print_warning(f"Could not write binary hash cache {sidecar}: {e} — next deploy will rehash")
 
-    return hasher.hexdigest()[:16]  # Short hash for readability
+    return digest[:16]  # Short hash for readability
 
 
-def get_env_config(environment: str) -> tuple[dict[str, str], list[str]]:
+def get_env_config(environment: str) -> tuple[Mapping[str, str], Sequence[str]]:
     """Get environment-specific configuration for the local docker-compose stack.
 
     Only ``dev`` is supported here: production deploys via the k8s cluster
     (ArgoCD, namespace dc-prod), not docker-compose. Selecting ``prod`` fails
     loud so no deploy subcommand silently starts a retired compose-prod stack.
     (Read-only `config prod` is handled separately by show_config.)
-    """
-    cf_dir = Path(__file__).parent
 
+    Returns the shared read-only config; callers that mutate it copy first.
+    """
     if environment == "prod":
         print_error(
             "prod is deployed via k8s (ArgoCD, namespace dc-prod); docker-compose is dev-only. "
@@ -77,23 +133,26 @@ def get_env_config(environment: str) -> tuple[dict[str, str], list[str]]:
         )
         sys.exit(1)
 
-    env_vars = {"ENVIRONMENT": "dev", "NETWORK_NAME": "decent-cloud-dev"}
-    compose_files = [str(cf_dir / "docker-compose.dev.yml")]
+    return DEV_ENV_VARS, DEV_COMPOSE_FILES
 
-    return env_vars, compose_files
+
+def compose_project_name(environment: str) -> str:
+    """docker-compose project name isolating one environment's stack."""
+    return f"decent-cloud-{environment}"
 
 
 def deploy_environment(environment: str) -> int:
     """Deploy to specified environment."""
     env_vars, compose_files = get_env_config(environment)
 
-    return deploy(environment, env_vars, compose_files)
+    # deploy() merges secrets into env_vars in place: give it its own copy.
+    return deploy(environment, dict(env_vars), list(compose_files))
 
 
 def stop_environment(environment: str) -> int:
     """Stop services for specified environment."""
     env_vars, compose_files = get_env_config(environment)
-    project_name = f"decent-cloud-{environment}"
+    project_name = compose_project_name(environment)
 
     print_header(f"Stopping {environment} services")
 
@@ -108,7 +167,7 @@ def stop_environment(environment: str) -> int:
 def show_logs(environment: str, follow: bool = False, service: Optional[str] = None) -> int:
     """Show logs for specified environment."""
     env_vars, compose_files = get_env_config(environment)
-    project_name = f"decent-cloud-{environment}"
+    project_name = compose_project_name(environment)
 
     print_header(f"{environment.title()} logs")
 
@@ -128,16 +187,29 @@ def show_logs(environment: str, follow: bool = False, service: Optional[str] = N
 def show_status(environment: str) -> int:
     """Show status for specified environment."""
     env_vars, compose_files = get_env_config(environment)
-    project_name = f"decent-cloud-{environment}"
+    project_name = compose_project_name(environment)
+
+    from concurrent.futures import ThreadPoolExecutor
 
     print_header(f"{environment.title()} status")
 
-    if not run_docker_compose(compose_files, ["ps"], env_vars, project_name):
-        print_error(f"Failed to get status for {environment}")
-        return 1
+    # One Engine API listing answers both the table and the tunnel health; the
+    # compose CLI is only the fallback when the daemon socket is not usable.
+    containers = _engine_containers(project_name)
+    if containers is not None:
+        _print_containers(containers)
+        status = check_tunnel_status(compose_files, environment, health=[
+            c["Health"] for c in containers if c["Service"] == "cloudflared" and c["State"] == "running"
+        ])
+    else:
+        # The tunnel check is an independent compose call: run it alongside `ps`.
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            tunnel_status = pool.submit(check_tunnel_status, compose_files, environment)
+            if not run_docker_compose(compose_files, ["ps"], env_vars, project_name):
+                print_error(f"Failed to get status for {environment}")
+                return 1
+        status = tunnel_status.result()
 
-    # Check tunnel status if running
-    status = check_tunnel_status(compose_files, environment)
     print()
     if status == "connected":
         print_success("Tunnel connection: Active")
@@ -149,10 +221,98 @@ def show_status(environment: str) -> int:
     return 0
 
 
+def _docker_socket() -> Optional[str]:
+    """Path of the Engine API socket the docker CLI would talk to, if it is local.
+
+    None when DOCKER_HOST or the active docker context may point elsewhere, so
+    a status listing never silently comes from a different daemon than the CLI.
+    """
+    import json
+
+    if os.environ.get("DOCKER_CONTEXT", "default") != "default":
+        return None
+    host = os.environ.get("DOCKER_HOST")
+    if host is not None:
+        return host.removeprefix("unix://") if host.startswith("unix://") else None
+    config = Path(os.environ.get("DOCKER_CONFIG", Path.home() / ".docker")) / "config.json"
+    try:
+        context = json.loads(config.read_text()).get("currentContext") or "default"
+    except FileNotFoundError:
+        context = "default"
+    except (OSError, ValueError, AttributeError):
+        return None
+    return "/var/run/docker.sock" if context == "default" else None
+
+
+_HEALTH_IN_STATUS_RE = re.compile(r"\((healthy|unhealthy|health: starting)\)")
+
+
+def _engine_containers(project_name: str) -> Optional[list[dict[str, str]]]:
+    """Containers of a compose project, read from the Engine API socket.
+
+    Saves the `docker compose ps` process (CLI start + plugin lookup) per status
+    call. Returns None when the socket is not usable; callers fall back to the
+    compose CLI, which reports its own errors.
+    """
+    import http.client
+    import json
+    import socket
+    import urllib.parse
+
+    path = _docker_socket()
+    if path is None:
+        return None
+
+    class UnixHTTPConnection(http.client.HTTPConnection):
+        def connect(self) -> None:
+            self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            self.sock.settimeout(self.timeout)
+            self.sock.connect(path)
+
+    filters = json.dumps({"label": [f"com.docker.compose.project={project_name}"]})
+    conn = UnixHTTPConnection("localhost", timeout=5)
+    try:
+        conn.request("GET", f"/containers/json?all=1&filters={urllib.parse.quote(filters)}")
+        response = conn.getresponse()
+        if response.status != 200:
+            return None
+        raw = json.loads(response.read())
+    except (OSError, http.client.HTTPException, ValueError):
+        return None
+    finally:
+        conn.close()
+
+    containers = []
+    for c in raw:
+        health = _HEALTH_IN_STATUS_RE.search(c.get("Status", ""))
+        containers.append({
+            "Name": (c.get("Names") or ["?"])[0].lstrip("/"),
+            "Service": c.get("Labels", {}).get("com.docker.compose.service", ""),
+            "State": c.get("State", ""),
+            "Status": c.get("Status", ""),
+            # Same vocabulary as `docker compose ps` (starting/healthy/unhealthy, "" = no healthcheck)
+            "Health": health.group(1).removeprefix("health: ") if health else "",
+            "Ports": ", ".join(
+                f"{p['IP']}:{p['PublicPort']}->{p['PrivatePort']}/{p['Type']}" if p.get("PublicPort")
+                else f"{p['PrivatePort']}/{p['Type']}"
+                for p in c.get("Ports", [])
+            ),
+        })
+    return sorted(containers, key=lambda c: c["Service"])
+
+
+def _print_containers(containers: list[dict[str, str]]) -> None:
+    """Print a `docker compose ps`-style table."""
+    columns = ("Name", "Service", "Status", "Ports")
+    widths = [max([len(col), *(len(c[col]) for c in containers)]) for col in columns]
+    for row in [{col: col.upper() for col in columns}, *containers]:
+        print("   ".join(row[col].ljust(w) for col, w in zip(columns, widths)).rstrip())
+
+
 def restart_environment(environment: str) -> int:
     """Restart services for specified environment."""
     env_vars, compose_files = get_env_config(environment)
-    project_name = f"decent-cloud-{environment}"
+    project_name = compose_project_name(environment)
 
     print_header(f"Restarting {environment} services")
 
@@ -227,17 +387,37 @@ def setup_telegram_webhook(env_vars: dict[str, str], is_prod: bool) -> bool:
         return False
 
 
-def check_docker() -> bool:
-    """Check if Docker and Docker Compose are installed."""
+def _probe(argv: list[str], cwd: Optional[Path] = None) -> Optional[subprocess.CompletedProcess]:
+    """Run a tool probe; the completed process on success, None if absent or failing.
+
+    A failing probe is the expected negative path: test the return code rather
+    than paying for a CalledProcessError. Safe to call from worker threads.
+    """
     try:
-        subprocess.run(["docker", "--version"], check=True, capture_output=True)
-        subprocess.run(["docker", "compose", "version"], check=True, capture_output=True)
-        print_success("Docker and Docker Compose are installed")
-        return True
-    except (subprocess.CalledProcessError, FileNotFoundError):
+        result = subprocess.run(argv, capture_output=True, text=True, cwd=cwd)
+    except FileNotFoundError:
+        return None
+    return result if result.returncode == 0 else None
+
+
+def check_docker() -> bool:
+    """Check if Docker and Docker Compose are installed.
+
+    The docker CLI is located with an in-process PATH lookup. Compose is a CLI
+    plugin that PATH cannot reveal, so it is the one probe that spawns a process.
+    """
+    import shutil
+
+    if shutil.which("docker") is None or _probe(["docker", "compose", "version"]) is None:
         print_error("Docker or Docker Compose is not installed")
         print_info("Install Docker: https://docs.docker.com/get-docker/")
         return False
+    print_success("Docker and Docker Compose are installed")
+    return True
+
+
+# One `KEY=value` line of `dc-secrets export` output; the first `=` splits.
+_EXPORT_LINE_RE = re.compile(r"^([^=\n]*)=(.*)$", re.MULTILINE)
 
 
 def load_secrets_from_sops(environment: str) -> Optional[dict[str, str]]:
@@ -247,7 +427,7 @@ def load_secrets_from_sops(environment: str) -> Optional[dict[str, str]]:
     common layer. It MUST match the deploy target so a prod deploy never reads
     dev credentials (or vice versa).
     """
-    dc_secrets = Path(__file__).parent.parent / "scripts" / "dc-secrets"
+    dc_secrets = DC_SECRETS_PATH
     if not dc_secrets.exists():
         print_error(f"dc-secrets not found at {dc_secrets}")
         return None
@@ -261,12 +441,8 @@ def load_secrets_from_sops(environment: str) -> Optional[dict[str, str]]:
         print_error(f"dc-secrets export {environment} failed: {e.stderr.strip()}")
         return None
 
-    env_vars: dict[str, str] = {}
-    for line in result.stdout.splitlines():
-        if not line or "=" not in line:
-            continue
-        key, _, value = line.partition("=")
-        env_vars[key] = value
+    # Later lines win (env layer over common), matching `eval "$(dc-secrets export)"`.
+    env_vars = dict(_EXPORT_LINE_RE.findall(result.stdout))
 
     if not env_vars:
         print_error("dc-secrets export returned no credentials")
@@ -423,50 +599,165 @@ def show_config(environment: str) -> int:
     return 0
 
 
-def run_docker_compose(
-    compose_files: list[str], command: list[str], env_vars: dict[str, str], project_name: Optional[str] = None
-) -> bool:
-    """Run docker compose with specified files and environment."""
+def _compose_cmd(compose_files: Sequence[str], project_name: Optional[str] = None) -> list[str]:
+    """`docker compose [-p <project>] -f <file>...` prefix shared by every compose call."""
     cmd = ["docker", "compose"]
     if project_name:
         cmd.extend(["-p", project_name])
     for file in compose_files:
         cmd.extend(["-f", file])
-    cmd.extend(command)
+    return cmd
+
 
+def compose_env(env_vars: Mapping[str, str]) -> Optional[dict[str, str]]:
+    """Full subprocess environment: os.environ overlaid with `env_vars`.
+
+    None (inherit the parent environment as-is) when there is nothing to
+    overlay.
+    """
+    if not env_vars:
+        return None
+    env = os.environ.copy()
+    env.update(env_vars)
+    return env
+
+
+def run_docker_compose(
+    compose_files: Sequence[str],
+    command: list[str],
+    env_vars: Mapping[str, str],
+    project_name: Optional[str] = None,
+) -> bool:
+    """Run docker compose with specified files and environment."""
+    return run_compose_argv([*_compose_cmd(compose_files, project_name), *command], env_vars)
+
+
+def run_compose_argv(cmd: list[str], env_vars: Mapping[str, str]) -> bool:
+    """Run a full, prebuilt `docker compose …` argv (see _compose_cmd)."""
     try:
-        print_info(f"$ {' '.join(shlex.quote(arg) for arg in cmd)}")
-        subprocess.run(cmd, check=True, env={**os.environ, **env_vars})
+        print_info(f"$ {shlex.join(cmd)}")
+        subprocess.run(cmd, check=True, env=compose_env(env_vars))
         return True
     except subprocess.CalledProcessError:
         return False
 
 
-def check_tunnel_status(compose_files: list[str], env_name: str) -> str:
-    """Check tunnel connection status from logs."""
-    try:
-        project_name = f"decent-cloud-{env_name[:4]}"  # dev -> dev, prod -> prod
+# Upper bound (seconds) on reading the cloudflared log tail (_scan_tunnel_logs).
+TUNNEL_LOG_SCAN_TIMEOUT = 5.0
 
-        cmd = ["docker", "compose", "-p", project_name]
-        for f in compose_files:
-            cmd.extend(["-f", f])
-        cmd.extend(["logs", "cloudflared"])
+# Both cloudflared log markers in one compiled alternation: one scan per line.
+_TUNNEL_LOG_RE = re.compile(r"Registered tunnel connection connIndex=|Unauthorized")
 
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            env=os.environ,
-            check=False,
-        )
-        logs = result.stdout + result.stderr
 
-        if "Registered tunnel connection connIndex=" in logs:
+def _tunnel_health(cmd: list[str]) -> list[str]:
+    """Healthcheck status per cloudflared container ("" if it has no healthcheck).
+
+    Empty if no container is running.
+
+    One `docker compose ps --format json` call reports the health directly, so
+    no separate `docker inspect` process is needed.
+    """
+    import json
+
+    out = subprocess.run(
+        [*cmd, "ps", "--format", "json", "cloudflared"],
+        capture_output=True,
+        text=True,
+        check=False,
+    ).stdout.strip()
+    if not out:
+        return []
+    # Compose >= 2.21 prints one JSON object per line; older releases one array.
+    containers = json.loads(out) if out.startswith("[") else [json.loads(ln) for ln in out.splitlines() if ln.strip()]
+    return [c.get("Health") or "" for c in containers]
+
+
+def _scan_tunnel_logs(cmd: list[str], logs_can_connect: bool) -> str:
+    """Classify the cloudflared log tail: "unauthorized", "connected" or "unclear".
+
+    Scans only the recent tail, line by line, and stops at the first decisive
+    match instead of buffering the tunnel's whole log history. A watchdog kills
+    the reader if the daemon stalls, so callers never hang on the logs. A
+    registered connection line only counts when `logs_can_connect`; a rejected
+    token counts either way.
+    """
+    import threading
+
+    with subprocess.Popen(
+        [*cmd, "logs", "--tail=200", "--no-color", "cloudflared"],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+    ) as proc:
+        watchdog = threading.Timer(TUNNEL_LOG_SCAN_TIMEOUT, proc.kill)
+        watchdog.start()
+        saw_unauthorized = False
+        try:
+            for line in proc.stdout:
+                match = _TUNNEL_LOG_RE.search(line)
+                if match is None:
+                    continue
+                if match.group() == "Unauthorized":
+                    if not logs_can_connect:
+                        return "unauthorized"
+                    saw_unauthorized = True
+                elif logs_can_connect:
+                    return "connected"  # a registered connection wins, as before
+        finally:
+            watchdog.cancel()
+            proc.terminate()
+    return "unauthorized" if saw_unauthorized else "unclear"
+
+
+def wait_for_tunnel(compose_files: Sequence[str], env_name: str, timeout: float = 45.0) -> None:
+    """Poll the cloudflared healthcheck until it settles or `timeout` elapses.
+
+    Returns as soon as the tunnel is healthy or unhealthy, so a fast boot is not
+    held back and a slow one is not misreported. While the healthcheck is still
+    starting (or the container is crash-looping) the log tail is scanned too, so
+    a rejected token ends the wait instead of running out the start period. A
+    container without a healthcheck has nothing to wait on. Errors end the wait
+    early; check_tunnel_status (called next) surfaces them.
+    """
+    import time
+
+    cmd = _compose_cmd(compose_files, compose_project_name(env_name))
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            health = _tunnel_health(cmd)
+            if health and ("unhealthy" in health or all(h in ("healthy", "") for h in health)):
+                return
+            if _scan_tunnel_logs(cmd, logs_can_connect=False) == "unauthorized":
+                return
+        except Exception:
+            return
+        time.sleep(1.0)  # matches the healthcheck's start_interval
+
+
+def check_tunnel_status(
+    compose_files: Sequence[str], env_name: str, health: Optional[list[str]] = None
+) -> str:
+    """Check tunnel connection status from the cloudflared healthcheck.
+
+    The container health (cloudflared's /ready endpoint) is one short string per
+    container, so a healthy tunnel never reads the log stream. Otherwise the log
+    tail is scanned: to tell a rejected token apart from other failures (tunnel
+    unhealthy, still starting, or no running container), or to decide for a
+    container created before the healthcheck existed.
+    `health` may be passed in by a caller that already listed the containers.
+    """
+    try:
+        cmd = _compose_cmd(compose_files, compose_project_name(env_name))
+        if health is None:
+            health = _tunnel_health(cmd)
+
+        if health and all(h == "healthy" for h in health):
             return "connected"
-        elif "Unauthorized" in logs:
-            return "unauthorized"
-        else:
-            return "unclear"
+        # A past connection line only proves a connection when no healthcheck
+        # says otherwise (and a container is running at all).
+        logs_can_connect = bool(health) and all(h in ("healthy", "") for h in health)
+        return _scan_tunnel_logs(cmd, logs_can_connect)
     except Exception as e:
         # Don't swallow the cause: surface WHY the status check blew up (docker
         # missing, compose file unreadable, etc.) so the operator can fix it.
@@ -475,85 +766,177 @@ def check_tunnel_status(compose_files: list[str], env_name: str) -> str:
 
 
 def check_prerequisites() -> bool:
-    """Check if required build tools are installed."""
+    """Check if required build tools are installed.
+
+    Tool presence is an in-process PATH lookup; only the rustup target list,
+    whose output is needed, spawns a process.
+    """
+    import shutil
+
     print_header("Checking prerequisites")
 
     # Check Rust toolchain
-    try:
-        subprocess.run(["rustc", "--version"], check=True, capture_output=True)
-        print_success("Rust toolchain found")
-    except (subprocess.CalledProcessError, FileNotFoundError):
+    if shutil.which("rustc") is None:
         print_error("Rust not found. Please install Rust: https://rustup.rs/")
         return False
+    print_success("Rust toolchain found")
 
     # Check Node.js
-    try:
-        subprocess.run(["node", "--version"], check=True, capture_output=True)
-        print_success("Node.js found")
-    except (subprocess.CalledProcessError, FileNotFoundError):
+    if shutil.which("node") is None:
         print_error("Node.js not found. Please install Node.js: https://nodejs.org/")
         return False
+    print_success("Node.js found")
 
     # Check Rust target for cross-compilation
-    try:
-        result = subprocess.run(["rustup", "target", "list"], check=True, capture_output=True, text=True)
-        if "x86_64-unknown-linux-musl" not in result.stdout:
+    target_list = _probe(["rustup", "target", "list"])
+    if target_list is None:
+        print_warning("rustup not found. Cross-compilation may fail")
+    elif "x86_64-unknown-linux-musl" not in target_list.stdout:
+        try:
             print_info("Adding Rust target for cross-compilation...")
             subprocess.run(["rustup", "target", "add", "x86_64-unknown-linux-musl"], check=True)
             print_success("Added x86_64-unknown-linux-musl target")
-    except (subprocess.CalledProcessError, FileNotFoundError):
-        print_warning("rustup not found. Cross-compilation may fail")
+        except (subprocess.CalledProcessError, FileNotFoundError):
+            print_warning("rustup not found. Cross-compilation may fail")
 
     return True
 
 
-def build_rust_binaries_natively() -> bool:
-    """Build API server binary natively before Docker build."""
-    cf_dir = Path(__file__).parent
-    api_dir = cf_dir.parent / "api"
+# Native build inputs, relative to PROJECT_ROOT: the crates behind `api-server`
+# and `dc` with their path dependencies, the offline sqlx query data the build
+# compiles against (SQLX_OFFLINE), and the website sources.
+_RUST_BUILD_INPUTS = (
+    "Cargo.toml", "Cargo.lock", "rust-toolchain.toml", ".cargo", ".sqlx",
+    "api", "cli", "common", "ic-canister", "ledger-map",
+)
+_WEBSITE_BUILD_INPUTS = ("website",)
+# Never hashed as inputs: VCS data and dependency trees at any depth...
+_BUILD_INPUT_SKIP = frozenset({".git", "node_modules"})
+# ...and build outputs, only directly under an input root (a source dir that
+# happens to be called `build` deeper down is still an input).
+_BUILD_OUTPUT_SKIP = frozenset({".svelte-kit", ".env.local", "build", "target"})
+
+_CARGO_BUILD_ARGV = (
+    "cargo", "build", "--release",
+    "--bin", "api-server", "--bin", "dc",
+    "--target", "x86_64-unknown-linux-gnu",
+)
+
+
+def _inputs_fingerprint(roots: Sequence[str], salt: str = "") -> str:
+    """Digest of (path, size, mtime) for every file under `roots`, plus `salt`.
+
+    Only metadata is hashed (one stat per file, no reads), walking with
+    os.scandir whose directory entries already carry the stat on Linux.
+    """
+    import hashlib
+
+    hasher = hashlib.blake2b(salt.encode(), digest_size=16)
+    stack = [(PROJECT_ROOT / root, True) for root in reversed(roots)]
+    while stack:
+        path, is_root = stack.pop()
+        if path.is_file():
+            st = path.stat()
+            hasher.update(f"{path}\0{st.st_size}\0{st.st_mtime_ns}\n".encode())
+            continue
+        if not path.is_dir():
+            continue  # optional input (e.g. no .cargo/) — absence is part of the key
+        skip = _BUILD_INPUT_SKIP | _BUILD_OUTPUT_SKIP if is_root else _BUILD_INPUT_SKIP
+        with os.scandir(path) as it:
+            entries = sorted((e for e in it if e.name not in skip), key=lambda e: e.name)
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                stack.append((Path(entry.path), False))
+            elif entry.is_file():
+                st = entry.stat()
+                hasher.update(f"{entry.path}\0{st.st_size}\0{st.st_mtime_ns}\n".encode())
+    return hasher.hexdigest()
+
+
+def _rust_build_salt(build_env: dict[str, str]) -> str:
+    """Non-file inputs of the cargo build: its argv, RUSTFLAGS and the exact toolchain.
+
+    `rustc -vV` runs in PROJECT_ROOT so rust-toolchain.toml picks the toolchain,
+    which catches a rustup update that keeps the same channel name.
+    """
+    rustc = _probe(["rustc", "-vV"], cwd=PROJECT_ROOT)
+    toolchain = rustc.stdout if rustc else "unknown rustc"
+    return "\0".join([*_CARGO_BUILD_ARGV, build_env.get("RUSTFLAGS", ""), toolchain])
+
+
+def _build_stamp(kind: str) -> Path:
+    return PROJECT_ROOT / "target" / f".deploy-{kind}.lastbuild"
+
+
+def _inputs_unchanged(kind: str, fingerprint: str) -> bool:
+    """True if the last successful `kind` build saw exactly these inputs."""
+    try:
+        return _build_stamp(kind).read_text() == fingerprint
+    except OSError:
+        return False
+
+
+def _record_build(kind: str, fingerprint: str) -> None:
+    stamp = _build_stamp(kind)
+    try:
+        stamp.parent.mkdir(parents=True, exist_ok=True)
+        stamp.write_text(fingerprint)
+    except OSError as e:
+        print_warning(f"Could not write build stamp {stamp}: {e} — next deploy will rebuild")
 
-    print_header("Building API server natively")
+
+def build_rust_binaries_natively(capture: bool = False) -> bool:
+    """Build API server binary natively before Docker build.
+
+    Runs with an explicit ``cwd`` (never ``os.chdir``) so it can build
+    concurrently with the website. Cargo output streams to the terminal unless
+    ``capture`` is set (concurrent builds), in which case it is printed only on
+    failure and the section header is left to the caller.
+
+    Skipped when the sources are unchanged since the last successful build and
+    the binaries are still in place (delete the stamp to force a rebuild).
+    """
+    api_dir = PROJECT_ROOT / "api"
+
+    if not capture:
+        print_header("Building API server natively")
 
     if not api_dir.exists():
         print_error("API directory not found")
         return False
 
-    try:
-        # Change to project root and build API binary
-        project_root = cf_dir.parent
-        os.chdir(project_root)
+    # SQLX_OFFLINE=true uses pre-prepared .sqlx queries instead of live DB
+    build_env = {**os.environ, "SQLX_OFFLINE": "true"}
+    fingerprint = _inputs_fingerprint(_RUST_BUILD_INPUTS, salt=_rust_build_salt(build_env))
+    binaries_present = API_BINARY_PATH.exists() and API_BINARY_PATH.with_name("dc").exists()
+    if binaries_present and _inputs_unchanged("rust", fingerprint):
+        print_info(f"Skipping cargo build, inputs unchanged (stamp: {_build_stamp('rust')})")
+        return True
 
+    try:
         # Build for linux/amd64 target (required for Docker)
-        # SQLX_OFFLINE=true uses pre-prepared .sqlx queries instead of live DB
-        build_env = {**os.environ, "SQLX_OFFLINE": "true"}
         subprocess.run(
-            [
-                "cargo",
-                "build",
-                "--release",
-                "--bin",
-                "api-server",
-                "--bin",
-                "dc",
-                "--target",
-                "x86_64-unknown-linux-gnu",
-            ],
+            list(_CARGO_BUILD_ARGV),
             check=True,
             env=build_env,
+            cwd=PROJECT_ROOT,
+            capture_output=capture,
+            text=True,
         )
 
         # Verify binary was created
-        binary_path = project_root / "target" / "x86_64-unknown-linux-gnu" / "release" / "api-server"
-        if not binary_path.exists():
-            print_error(f"API binary not found at {binary_path}")
+        if not API_BINARY_PATH.exists():
+            print_error(f"API binary not found at {API_BINARY_PATH}")
             return False
 
-        print_success(f"API server built successfully: {binary_path}")
+        _record_build("rust", fingerprint)
+        print_success(f"API server built successfully: {API_BINARY_PATH}")
         return True
     except subprocess.CalledProcessError as e:
         print_error(f"API build failed: {e}")
-        print_error(f"stdout: {e.stdout}")
-        print_error(f"stderr: {e.stderr}")
+        if capture:
+            print_error(f"stdout: {e.stdout}")
+            print_error(f"stderr: {e.stderr}")
         return False
     except FileNotFoundError:
         print_error("Cargo not found. Please install Rust")
@@ -563,18 +946,19 @@ def build_rust_binaries_natively() -> bool:
         return False
 
 
-def build_website_natively(environment: str, env_vars: dict[str, str]) -> bool:
+def build_website_natively(environment: str, env_vars: dict[str, str], capture: bool = False) -> bool:
     """Build SvelteKit website natively before Docker build.
 
     Args:
         environment: 'dev' or 'prod' - determines API endpoint configuration
         env_vars: Environment variables from dc-secrets (contains Stripe keys)
+        capture: Capture npm output (printed only on failure) and leave the
+            section header to the caller; set when building concurrently
     """
-    cf_dir = Path(__file__).parent
-    project_root = cf_dir.parent
-    website_dir = project_root / "website"
+    website_dir = PROJECT_ROOT / "website"
 
-    print_header(f"Building SvelteKit website for {environment}")
+    if not capture:
+        print_header(f"Building SvelteKit website for {environment}")
 
     if not website_dir.exists():
         print_error("Website directory not found")
@@ -594,80 +978,105 @@ def build_website_natively(environment: str, env_vars: dict[str, str]) -> bool:
             print()
             # Don't fail - allow deployment without Stripe (DCT payments still work)
 
-        with open(env_local_file, "w") as f:
-            f.write("# Auto-generated by deploy.py - DO NOT EDIT\n")
-            f.write(f"# Environment: {environment}\n")
-            f.write("\n")
-
-            if environment == "dev":
-                f.write("# Development/staging API endpoint\n")
-                f.write("VITE_DECENT_CLOUD_API_URL=https://dev-api.decent-cloud.org\n")
-            else:  # prod
-                f.write("# Production API endpoint (uses default from .env)\n")
-                f.write("VITE_DECENT_CLOUD_API_URL=https://api.decent-cloud.org\n")
-
-            f.write("\n")
-
-            if stripe_key:
-                f.write("# Stripe publishable key (safe to embed in client-side code)\n")
-                key_type = "TEST" if stripe_key.startswith("pk_test_") else "LIVE"
-                f.write(f"# Key type: {key_type}\n")
-                f.write(f"VITE_STRIPE_PUBLISHABLE_KEY={stripe_key}\n")
-                print_success(f"Configured Stripe {key_type} key for website build")
-            else:
-                f.write("# Stripe not configured - credit card payments disabled\n")
-                f.write("# VITE_STRIPE_PUBLISHABLE_KEY=pk_test_...\n")
-
-            # Chatwoot widget configuration. Require BOTH the token and the
-            # base URL: the website widget only renders when both are present
-            # (see ChatwootWidget.svelte). Never default to a hardcoded host —
-            # a dead/misconfigured host causes 404 + X-Frame-Options console
-            # errors on every page.
-            f.write("\n")
-            chatwoot_token = env_vars.get("CHATWOOT_WEBSITE_TOKEN")
-            chatwoot_base_url = env_vars.get("CHATWOOT_BASE_URL")
-            if chatwoot_token and chatwoot_base_url:
-                f.write("# Chatwoot support widget\n")
-                f.write(f"VITE_CHATWOOT_WEBSITE_TOKEN={chatwoot_token}\n")
-                f.write(f"VITE_CHATWOOT_BASE_URL={chatwoot_base_url}\n")
-                print_success("Configured Chatwoot widget for website build")
-            elif chatwoot_token and not chatwoot_base_url:
-                # Token set but no base URL: emit the token but leave the URL
-                # commented so the widget stays gated OFF (no dead-host fetch).
-                f.write("# Chatwoot token present but CHATWOOT_BASE_URL missing — widget DISABLED\n")
-                f.write(f"VITE_CHATWOOT_WEBSITE_TOKEN={chatwoot_token}\n")
-                f.write("# VITE_CHATWOOT_BASE_URL=https://your-chatwoot.example.org\n")
-                print_warning("CHATWOOT_WEBSITE_TOKEN is set but CHATWOOT_BASE_URL is missing")
-                print_warning("Support widget will NOT render until CHATWOOT_BASE_URL is set")
-            else:
-                f.write("# Chatwoot not configured — support widget disabled\n")
-                f.write("# VITE_CHATWOOT_WEBSITE_TOKEN=your_token\n")
-                f.write("# VITE_CHATWOOT_BASE_URL=https://your-chatwoot.example.org\n")
-
-            # Telegram bot username for UI display
-            f.write("\n")
-            telegram_bot_username = env_vars.get("TELEGRAM_BOT_USERNAME", "DecentCloudBot")
-            print_info(f"Telegram bot username: {telegram_bot_username}")
-            f.write(f"VITE_TELEGRAM_BOT_USERNAME={telegram_bot_username}\n")
+        lines = [
+            "# Auto-generated by deploy.py - DO NOT EDIT",
+            f"# Environment: {environment}",
+            "",
+        ]
+        if environment == "dev":
+            lines += [
+                "# Development/staging API endpoint",
+                "VITE_DECENT_CLOUD_API_URL=https://dev-api.decent-cloud.org",
+            ]
+        else:  # prod
+            lines += [
+                "# Production API endpoint (uses default from .env)",
+                "VITE_DECENT_CLOUD_API_URL=https://api.decent-cloud.org",
+            ]
+        lines.append("")
+
+        if stripe_key:
+            key_type = "TEST" if stripe_key.startswith("pk_test_") else "LIVE"
+            lines += [
+                "# Stripe publishable key (safe to embed in client-side code)",
+                f"# Key type: {key_type}",
+                f"VITE_STRIPE_PUBLISHABLE_KEY={stripe_key}",
+            ]
+            print_success(f"Configured Stripe {key_type} key for website build")
+        else:
+            lines += [
+                "# Stripe not configured - credit card payments disabled",
+                "# VITE_STRIPE_PUBLISHABLE_KEY=pk_test_...",
+            ]
+
+        # Chatwoot widget configuration. Require BOTH the token and the
+        # base URL: the website widget only renders when both are present
+        # (see ChatwootWidget.svelte). Never default to a hardcoded host —
+        # a dead/misconfigured host causes 404 + X-Frame-Options console
+        # errors on every page.
+        lines.append("")
+        chatwoot_token = env_vars.get("CHATWOOT_WEBSITE_TOKEN")
+        chatwoot_base_url = env_vars.get("CHATWOOT_BASE_URL")
+        if chatwoot_token and chatwoot_base_url:
+            lines += [
+                "# Chatwoot support widget",
+                f"VITE_CHATWOOT_WEBSITE_TOKEN={chatwoot_token}",
+                f"VITE_CHATWOOT_BASE_URL={chatwoot_base_url}",
+            ]
+            print_success("Configured Chatwoot widget for website build")
+        elif chatwoot_token and not chatwoot_base_url:
+            # Token set but no base URL: emit the token but leave the URL
+            # commented so the widget stays gated OFF (no dead-host fetch).
+            lines += [
+                "# Chatwoot token present but CHATWOOT_BASE_URL missing — widget DISABLED",
+                f"VITE_CHATWOOT_WEBSITE_TOKEN={chatwoot_token}",
+                "# VITE_CHATWOOT_BASE_URL=https://your-chatwoot.example.org",
+            ]
+            print_warning("CHATWOOT_WEBSITE_TOKEN is set but CHATWOOT_BASE_URL is missing")
+            print_warning("Support widget will NOT render until CHATWOOT_BASE_URL is set")
+        else:
+            lines += [
+                "# Chatwoot not configured — support widget disabled",
+                "# VITE_CHATWOOT_WEBSITE_TOKEN=your_token",
+                "# VITE_CHATWOOT_BASE_URL=https://your-chatwoot.example.org",
+            ]
+
+        # Telegram bot username for UI display
+        lines.append("")
+        telegram_bot_username = env_vars.get("TELEGRAM_BOT_USERNAME", "DecentCloudBot")
+        print_info(f"Telegram bot username: {telegram_bot_username}")
+        lines.append(f"VITE_TELEGRAM_BOT_USERNAME={telegram_bot_username}")
+
+        # One write of the whole file instead of a write per line.
+        env_local = "\n".join(lines) + "\n"
+        env_local_file.write_text(env_local)
 
         print_success(f"Created .env.local for {environment} build")
         print()
 
-        # Change to website directory and run build
-        os.chdir(website_dir)
-        subprocess.run(["npm", "run", "build"], check=True)
+        # .env.local is baked into the bundle, so its content is part of the key.
+        build_dir = website_dir / "build"
+        fingerprint = _inputs_fingerprint(_WEBSITE_BUILD_INPUTS, salt=env_local)
+        if build_dir.exists() and _inputs_unchanged("website", fingerprint):
+            print_info(f"Skipping npm build, inputs unchanged (stamp: {_build_stamp('website')})")
+            return True
+
+        subprocess.run(["npm", "run", "build"], check=True, cwd=website_dir, capture_output=capture, text=True)
         print_success("Website built successfully")
 
         # Verify build output exists
-        build_dir = website_dir / "build"
         if not build_dir.exists():
             print_error(f"Build directory not found at {build_dir}")
             return False
 
+        _record_build("website", fingerprint)
         print_success(f"Build output verified at {build_dir}")
         return True
     except subprocess.CalledProcessError as e:
         print_error(f"Website build failed: {e}")
+        if capture:
+            print_error(f"stdout: {e.stdout}")
+            print_error(f"stderr: {e.stderr}")
         return False
     except FileNotFoundError:
         print_error("Node.js not found. Please install Node.js")
@@ -679,18 +1088,24 @@ def build_website_natively(environment: str, env_vars: dict[str, str]) -> bool:
 
 def deploy(env_name: str, env_vars: dict[str, str], compose_files: list[str]) -> int:
     """Shared deployment logic for dev and prod environments."""
+    from concurrent.futures import ThreadPoolExecutor
+
     is_prod = env_name == "prod"
 
     # Header
     print_header(f"Decent Cloud - {env_name.title()} Deployment")
 
-    # Check Docker
-    if not check_docker():
-        return 1
-    print()
-
     # Load all secrets from dc-secrets (SOPS-encrypted store) for THIS env layer.
-    secrets = load_secrets_from_sops(env_name)
+    # The decrypt is independent of the Docker check, so it runs alongside it.
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        pending_secrets = pool.submit(load_secrets_from_sops, env_name)
+
+        # Check Docker
+        if not check_docker():
+            return 1
+        print()
+
+        secrets = pending_secrets.result()
     if not secrets:
         print_error("Failed to load secrets from dc-secrets. Run: scripts/dc-secrets init")
         return 1
@@ -701,8 +1116,9 @@ def deploy(env_name: str, env_vars: dict[str, str], compose_files: list[str]) ->
     # Merge secrets into env_vars (secrets take precedence)
     env_vars.update(secrets)
 
-    # Verify tunnel token exists
-    if not env_vars.get("TUNNEL_TOKEN"):
+    # Verify tunnel token exists (read once; gates the tunnel check after startup)
+    tunnel_token = env_vars.get("TUNNEL_TOKEN")
+    if not tunnel_token:
         if is_prod:
             print_error("TUNNEL_TOKEN not found in dc-secrets")
             print()
@@ -728,14 +1144,17 @@ def deploy(env_name: str, env_vars: dict[str, str], compose_files: list[str]) ->
         print_warning("Google OAuth not configured (optional)")
         print()
 
-    # Build website natively first with environment-specific API configuration and Stripe keys
-    if not build_website_natively(env_name, env_vars):
+    # Build website (environment-specific API configuration and Stripe keys) and
+    # API server natively. They touch disjoint trees, so they run concurrently.
+    print_header(f"Building SvelteKit website for {env_name} and API server natively")
+    print_info("Builds run concurrently; their output is shown on failure")
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        website_built = pool.submit(build_website_natively, env_name, env_vars, capture=True)
+        api_built = pool.submit(build_rust_binaries_natively, capture=True)
+    if not website_built.result():
         print_error("Failed to build website")
         return 1
-    print()
-
-    # Build API server natively first
-    if not build_rust_binaries_natively():
+    if not api_built.result():
         print_error("Failed to build API server")
         return 1
     print()
@@ -752,15 +1171,17 @@ def deploy(env_name: str, env_vars: dict[str, str], compose_files: list[str]) ->
     print()
 
     # Use a specific project name to isolate dev and prod environments
-    project_name = f"decent-cloud-{env_name}"  # dev -> dev, prod -> prod
+    project_name = compose_project_name(env_name)
+    # The `docker compose -p … -f …` argv, built once: it runs the stack and,
+    # shell-quoted, prefixes every operator hint below.
+    compose_argv = _compose_cmd(compose_files, project_name)
+    compose_cli = shlex.join(compose_argv)
 
-    if not run_docker_compose(compose_files, ["up", "-d", "--build", "--remove-orphans"], env_vars, project_name):
+    if not run_compose_argv([*compose_argv, "up", "-d", "--build", "--remove-orphans"], env_vars):
         print()
         print_error(f"{env_name.title()} deployment failed")
         print()
-        compose_args = " ".join(f"-f {f}" for f in compose_files)
-        project_args = f"-p {project_name}"
-        print(f"Check logs: {BLUE}docker compose {project_args} {compose_args} logs{NC}")
+        print(f"Check logs: {BLUE}{compose_cli} logs{NC}")
         print()
         return 1
 
@@ -783,11 +1204,9 @@ def deploy(env_name: str, env_vars: dict[str, str], compose_files: list[str]) ->
     print()
 
     # Check tunnel connection (both dev and prod now use tunnels)
-    if env_vars.get("TUNNEL_TOKEN"):
+    if tunnel_token:
         print_warning("Verifying tunnel connection...")
-        import time
-
-        time.sleep(5)
+        wait_for_tunnel(compose_files, env_name)
 
         status = check_tunnel_status(compose_files, env_name)
 
@@ -823,24 +1242,20 @@ def deploy(env_name: str, env_vars: dict[str, str], compose_files: list[str]) ->
         else:
             msg = "Could not verify tunnel status" if status == "error" else "Tunnel status unclear"
             print_warning(msg)
-            compose_args = " ".join(f"-f {f}" for f in compose_files)
-            project_args = f"-p {project_name}"
-            print(f"  {BLUE}docker compose {project_args} {compose_args} logs cloudflared{NC}")
+            print(f"  {BLUE}{compose_cli} logs cloudflared{NC}")
             print()
 
     # Management commands
     print("Useful commands:" if not is_prod else "Management commands:")
-    compose_args = " ".join(f"-f {f}" for f in compose_files)
-    project_args = f"-p {project_name}"
     if is_prod:
-        print(f"  View logs:    {BLUE}docker compose {project_args} {compose_args} logs -f{NC}")
-        print(f"  Check status: {BLUE}docker compose {project_args} {compose_args} ps{NC}")
-        print(f"  Restart:      {BLUE}docker compose {project_args} {compose_args} restart{NC}")
-        print(f"  Stop:         {BLUE}docker compose {project_args} {compose_args} down{NC}")
+        print(f"  View logs:    {BLUE}{compose_cli} logs -f{NC}")
+        print(f"  Check status: {BLUE}{compose_cli} ps{NC}")
+        print(f"  Restart:      {BLUE}{compose_cli} restart{NC}")
+        print(f"  Stop:         {BLUE}{compose_cli} down{NC}")
     else:
-        print(f"  {BLUE}docker compose {project_args} {compose_args} logs -f{NC}")
-        print(f"  {BLUE}docker compose {project_args} {compose_args} ps{NC}")
-        print(f"  {BLUE}docker compose {project_args} {compose_args} down{NC}")
+        print(f"  {BLUE}{compose_cli} logs -f{NC}")
+        print(f"  {BLUE}{compose_cli} ps{NC}")
+        print(f"  {BLUE}{compose_cli} down{NC}")
     print()
 
     return 0
@@ -873,8 +1288,7 @@ def _nuc_k3s_dir() -> Path:
     override = os.environ.get("NUC_K3S_DIR")
     if override:
         return Path(override).expanduser().resolve()
-    cf_dir = Path(__file__).resolve().parent
-    return (cf_dir.parent.parent / "third_party" / "k8s").resolve()
+    return (PROJECT_ROOT.parent / "third_party" / "k8s").resolve()
 
 
 def _update_stage_image_tag(kustomization_path: Path, new_tag: str) -> bool:
@@ -1000,7 +1414,6 @@ def deploy_stage(tag: str) -> int:
     print_info(f"API binary hash: {binary_hash}")
     print()
 
-    project_root = Path(__file__).resolve().parent.parent
     full_image = f"{STAGE_API_IMAGE}:{tag}"
 
     # 2-3. docker build directly to the registry tag (BINARY_HASH busts the
@@ -1017,7 +1430,7 @@ def deploy_stage(tag: str) -> int:
     ]
     print_info(f"$ {' '.join(shlex.quote(c) for c in build_cmd)}")
     try:
-        subprocess.run(build_cmd, check=True, cwd=project_root)
+        subprocess.run(build_cmd, check=True, cwd=PROJECT_ROOT)
     except subprocess.CalledProcessError as e:
         print_error(f"docker build failed (rc={e.returncode})")
         return 1
@@ -1101,95 +1514,140 @@ def deploy_stage(tag: str) -> int:
     return 0
 
 
-def main() -> int:
-    """Main entry point."""
-    parser = argparse.ArgumentParser(
-        description="Deploy and manage Decent Cloud environments",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
+# CLI surface: command -> accepted environment names (aliases normalized below).
+# `dev` = local docker-compose; `stage` = build+push image + bump the k8s overlay
+# (k8s/ArgoCD); `prod` fails loud on deploy subcommands (GitOps-only).
+_COMPOSE_ENVS = ("dev", "development", "prod", "production")
+_COMMAND_ENVS: dict[str, tuple[str, ...]] = {
+    "deploy": (*_COMPOSE_ENVS, "stage"),
+    "stop": _COMPOSE_ENVS,
+    "logs": _COMPOSE_ENVS,
+    "status": _COMPOSE_ENVS,
+    "restart": _COMPOSE_ENVS,
+    "config": (*_COMPOSE_ENVS, "stage"),
+}
+_COMMAND_ALIASES = {"start": "deploy", "up": "deploy"}
+_ENV_ALIASES = {"dev": "dev", "development": "dev", "prod": "prod", "production": "prod", "stage": "stage"}
+LOG_SERVICES = ("website", "api-serve", "api-sync", "cloudflared")
+
+USAGE = "usage: deploy.py {deploy,start,up,stop,logs,status,restart,config} <environment> [options]"
+
+HELP = f"""{USAGE}
+
+Deploy and manage Decent Cloud environments
+
+Commands:
+  deploy <env> [--tag TAG]        Deploy to environment (aliases: start, up; env: dev, prod, stage)
+                                  --tag: image tag for `deploy stage` (default: {STAGE_DEFAULT_TAG}, the floating tag)
+  stop <env>                      Stop environment services
+  logs <env> [-f] [service]       Show environment logs (service: {", ".join(LOG_SERVICES)})
+  status <env>                    Show environment status
+  restart <env>                   Restart environment services
+  config <env>                    Show config vars + sources for an env (read-only audit; env: dev, prod, stage)
+
+Environments: dev (development), prod (production), stage
+
 Examples:
-  %(prog)s deploy dev                 # Deploy the local dev stack (docker-compose)
-  %(prog)s deploy stage               # Ship the stage api image + bump k8s overlay (k8s)
-  %(prog)s deploy stage --tag <sha>   # Ship a pinned stage image instead of the floating :stage
-  %(prog)s stop dev                  # Stop dev services
-  %(prog)s logs dev -f website       # Follow dev website logs
-  %(prog)s status dev                # Show dev status
-  %(prog)s restart dev               # Restart dev services
-  %(prog)s config dev                # Audit dev config vars + sources (read-only)
-  %(prog)s config prod               # Audit prod config (reads live cluster)
-  %(prog)s config stage              # Audit stage config (reads live dc-stage cluster)
+  deploy.py deploy dev                 # Deploy the local dev stack (docker-compose)
+  deploy.py deploy stage               # Ship the stage api image + bump k8s overlay (k8s)
+  deploy.py deploy stage --tag <sha>   # Ship a pinned stage image instead of the floating :stage
+  deploy.py stop dev                  # Stop dev services
+  deploy.py logs dev -f website       # Follow dev website logs
+  deploy.py status dev                # Show dev status
+  deploy.py restart dev               # Restart dev services
+  deploy.py config dev                # Audit dev config vars + sources (read-only)
+  deploy.py config prod               # Audit prod config (reads live cluster)
+  deploy.py config stage              # Audit stage config (reads live dc-stage cluster)
 
 Prod + stage deploy via k8s (ArgoCD, namespaces dc-prod / dc-stage); see cf/CONFIG.md
 and docs/MIGRATION-CUTOVER.md. `deploy dev` is the legacy local docker-compose stack,
 retained until the stage cutover retires it.
-        """,
-    )
-
-    subparsers = parser.add_subparsers(dest="command", help="Available commands")
-
-    # Deploy command. `dev` = local docker-compose; `stage` = build+push image +
-    # bump the k8s overlay (k8s/ArgoCD); `prod` fails loud (GitOps-only).
-    deploy_parser = subparsers.add_parser("deploy", aliases=["start", "up"], help="Deploy to environment")
-    deploy_parser.add_argument("environment", choices=["dev", "development", "prod", "production", "stage"], help="Target environment")
-    deploy_parser.add_argument("--tag", default=STAGE_DEFAULT_TAG,
-                               help=f"Image tag for `deploy stage` (default: {STAGE_DEFAULT_TAG}, the floating tag)")
-
-    # Stop command
-    stop_parser = subparsers.add_parser("stop", help="Stop environment services")
-    stop_parser.add_argument("environment", choices=["dev", "development", "prod", "production"], help="Target environment")
-
-    # Logs command
-    logs_parser = subparsers.add_parser("logs", help="Show environment logs")
-    logs_parser.add_argument("environment", choices=["dev", "development", "prod", "production"], help="Target environment")
-    logs_parser.add_argument("-f", "--follow", action="store_true", help="Follow log output")
-    logs_parser.add_argument(
-        "service",
-        nargs="?",
-        choices=["website", "api-serve", "api-sync", "cloudflared"],
-        help="Specific service to show logs for",
-    )
-
-    # Status command
-    status_parser = subparsers.add_parser("status", help="Show environment status")
-    status_parser.add_argument("environment", choices=["dev", "development", "prod", "production"], help="Target environment")
-
-    # Restart command
-    restart_parser = subparsers.add_parser("restart", help="Restart environment services")
-    restart_parser.add_argument("environment", choices=["dev", "development", "prod", "production"], help="Target environment")
-
-    # Config command (read-only introspection; works for dev, prod, AND stage)
-    config_parser = subparsers.add_parser("config", help="Show config vars + sources for an env (read-only audit)")
-    config_parser.add_argument("environment", choices=["dev", "development", "prod", "production", "stage"], help="Target environment")
-
-    args = parser.parse_args()
-
-    if not args.command:
-        parser.print_help()
+"""
+
+
+def parse_cli(argv: list[str]) -> dict:
+    """Parse `<command> <environment> [options]` for this fixed-shape CLI.
+
+    A hand-rolled dispatcher: the CLI has six commands and three flags, so
+    building argparse parsers on every start is pure overhead. Returns
+    ``{command, environment, tag, follow, service}`` with aliases normalized.
+    Raises ValueError with an operator-facing message on any invalid input.
+    """
+    if not argv:
+        raise ValueError("missing command")
+    command = _COMMAND_ALIASES.get(argv[0], argv[0])
+    if command not in _COMMAND_ENVS:
+        raise ValueError(f"unknown command: {argv[0]}")
+
+    args: dict = {"command": command, "tag": STAGE_DEFAULT_TAG, "follow": False, "service": None}
+    positionals: list[str] = []
+    rest = iter(argv[1:])
+    for arg in rest:
+        if command == "deploy" and arg == "--tag":
+            args["tag"] = next(rest, None)
+            if not args["tag"]:
+                raise ValueError("--tag expects a value")
+        elif command == "deploy" and arg.startswith("--tag="):
+            args["tag"] = arg.partition("=")[2]
+        elif command == "logs" and arg in ("-f", "--follow"):
+            args["follow"] = True
+        elif arg.startswith("-"):
+            raise ValueError(f"{command}: unrecognized option: {arg}")
+        else:
+            positionals.append(arg)
+
+    if not positionals:
+        raise ValueError(f"{command}: missing environment")
+    max_positionals = 2 if command == "logs" else 1
+    if len(positionals) > max_positionals:
+        raise ValueError(f"{command}: unexpected argument: {positionals[max_positionals]}")
+
+    environment = positionals[0]
+    if environment not in _COMMAND_ENVS[command]:
+        raise ValueError(
+            f"{command}: invalid environment {environment!r} (choose from {', '.join(_COMMAND_ENVS[command])})"
+        )
+    args["environment"] = _ENV_ALIASES[environment]
+
+    if len(positionals) == 2:
+        if positionals[1] not in LOG_SERVICES:
+            raise ValueError(f"logs: invalid service {positionals[1]!r} (choose from {', '.join(LOG_SERVICES)})")
+        args["service"] = positionals[1]
+    return args
+
+
+# Command -> handler over the parse_cli result; keys mirror _COMMAND_ENVS.
+_COMMANDS: dict[str, Callable[[dict], int]] = {
+    "deploy": lambda a: deploy_stage(a["tag"]) if a["environment"] == "stage" else deploy_environment(a["environment"]),
+    "stop": lambda a: stop_environment(a["environment"]),
+    "logs": lambda a: show_logs(a["environment"], a["follow"], a["service"]),
+    "status": lambda a: show_status(a["environment"]),
+    "restart": lambda a: restart_environment(a["environment"]),
+    "config": lambda a: show_config(a["environment"]),
+}
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    """Main entry point."""
+    argv = sys.argv[1:] if argv is None else argv
+
+    if not argv:
+        print(HELP)
         return 1
+    if "-h" in argv or "--help" in argv:
+        print(HELP)
+        return 0
 
-    # Normalize environment names
-    env_map = {"dev": "dev", "development": "dev", "prod": "prod", "production": "prod", "stage": "stage"}
-    environment = env_map[args.environment]
+    try:
+        args = parse_cli(argv)
+    except ValueError as e:
+        print(USAGE, file=sys.stderr)
+        print_error(str(e))
+        return 2
 
-    # Execute command
+    # Execute command (parse_cli only yields commands present in _COMMANDS)
     try:
-        if args.command in ("deploy", "start", "up"):
-            if environment == "stage":
-                return deploy_stage(args.tag)
-            return deploy_environment(environment)
-        elif args.command == "stop":
-            return stop_environment(environment)
-        elif args.command == "logs":
-            return show_logs(environment, args.follow, args.service)
-        elif args.command == "status":
-            return show_status(environment)
-        elif args.command == "restart":
-            return restart_environment(environment)
-        elif args.command == "config":
-            return show_config(environment)
-        else:
-            print_error(f"Unknown command: {args.command}")
-            return 1
+        return _COMMANDS[args["command"]](args)
     except KeyboardInterrupt:
         print_warning("\nOperation cancelled by user")
         return 130
@@ -5,8 +5,12 @@ behavior: swallowed errors must be surfaced, silent sentinels must warn.
 The stage section exercises `_update_stage_image_tag` (pure logic; no mocks).
 """
 
+import json
+from typing import Optional
 from unittest import mock
 
+import pytest
+
 import cf.deploy as deploy
 
 
@@ -34,6 +38,230 @@ def test_check_tunnel_status_still_returns_error_on_oserror(capsys):
     assert "boom" in capsys.readouterr().err
 
 
+def _fake_compose(health: Optional[str]):
+    """subprocess.run stand-in answering `docker compose ps --format json`.
+
+    `health=None` means no cloudflared container; "" a container without a healthcheck.
+    """
+    ps = "" if health is None else json.dumps({"Service": "cloudflared", "State": "running", "Health": health})
+    return lambda argv, **kwargs: mock.Mock(stdout=ps, stderr="")
+
+
+def _fake_logs(lines: list[str]) -> mock.MagicMock:
+    """subprocess.Popen stand-in streaming `lines` from `docker compose logs`."""
+    popen = mock.MagicMock()
+    popen.return_value.__enter__.return_value.stdout = iter(lines)
+    return popen
+
+
+def test_check_tunnel_status_healthy_container_is_connected():
+    run = _fake_compose("healthy")
+    with mock.patch.object(deploy.subprocess, "run", side_effect=run), \
+            mock.patch.object(deploy.subprocess, "Popen") as popen:
+        assert deploy.check_tunnel_status(["cf/docker-compose.dev.yml"], "dev") == "connected"
+    popen.assert_not_called()  # no log scrape
+
+
+def test_check_tunnel_status_unhealthy_reads_log_tail_for_cause():
+    popen = _fake_logs(["INF Starting tunnel\n", "ERR Unauthorized: Invalid tunnel secret\n"])
+    with mock.patch.object(deploy.subprocess, "run", side_effect=_fake_compose("unhealthy")), \
+            mock.patch.object(deploy.subprocess, "Popen", popen):
+        assert deploy.check_tunnel_status(["cf/docker-compose.dev.yml"], "dev") == "unauthorized"
+    argv = popen.call_args.args[0]
+    assert argv[-4:] == ["logs", "--tail=200", "--no-color", "cloudflared"]
+    popen.return_value.__enter__.return_value.terminate.assert_called_once()
+
+
+def test_tunnel_health_parses_legacy_json_array_output():
+    legacy = json.dumps([{"Service": "cloudflared", "Health": "healthy"}])
+    with mock.patch.object(deploy.subprocess, "run", return_value=mock.Mock(stdout=legacy)):
+        assert deploy._tunnel_health(["docker", "compose"]) == ["healthy"]
+
+
+def test_check_tunnel_status_unhealthy_ignores_stale_connection_lines():
+    popen = _fake_logs(["INF Registered tunnel connection connIndex=0\n", "ERR lost connection\n"])
+    with mock.patch.object(deploy.subprocess, "run", side_effect=_fake_compose("unhealthy")), \
+            mock.patch.object(deploy.subprocess, "Popen", popen):
+        assert deploy.check_tunnel_status(["cf/docker-compose.dev.yml"], "dev") == "unclear"
+
+
+def test_check_tunnel_status_without_healthcheck_falls_back_to_log_markers():
+    # Container created before the healthcheck existed: the log tail decides,
+    # and a registered connection wins over an earlier Unauthorized.
+    popen = _fake_logs(["ERR Unauthorized\n", "INF Registered tunnel connection connIndex=0\n"])
+    with mock.patch.object(deploy.subprocess, "run", side_effect=_fake_compose("")), \
+            mock.patch.object(deploy.subprocess, "Popen", popen):
+        assert deploy.check_tunnel_status(["cf/docker-compose.dev.yml"], "dev") == "connected"
+
+
+def test_check_tunnel_status_log_scan_is_killed_by_watchdog(monkeypatch):
+    import threading
+
+    monkeypatch.setattr(deploy, "TUNNEL_LOG_SCAN_TIMEOUT", 0.05)
+    unblock = threading.Event()
+
+    def stalled_stream():  # a daemon that never closes the log stream
+        unblock.wait(timeout=5)
+        return iter(())
+
+    popen = mock.MagicMock()
+    proc = popen.return_value.__enter__.return_value
+    proc.stdout.__iter__.side_effect = lambda: stalled_stream()
+    proc.kill.side_effect = lambda: unblock.set()
+    with mock.patch.object(deploy.subprocess, "run", side_effect=_fake_compose("unhealthy")), \
+            mock.patch.object(deploy.subprocess, "Popen", popen):
+        assert deploy.check_tunnel_status(["cf/docker-compose.dev.yml"], "dev") == "unclear"
+    proc.kill.assert_called_once()
+
+
+def test_check_tunnel_status_without_container_is_unclear():
+    popen = _fake_logs(["INF Registered tunnel connection connIndex=0\n"])
+    with mock.patch.object(deploy.subprocess, "run", side_effect=_fake_compose(None)), \
+            mock.patch.object(deploy.subprocess, "Popen", popen):
+        assert deploy.check_tunnel_status(["cf/docker-compose.dev.yml"], "dev") == "unclear"
+
+
+@pytest.mark.parametrize("health", [None, "starting"])
+def test_check_tunnel_status_reports_rejected_token_before_unhealthy(health):
+    # Crash-looping (no running container) or still inside the start period:
+    # the log tail already shows the rejected token.
+    popen = _fake_logs(["INF Registered tunnel connection connIndex=0\n", "ERR Unauthorized\n"])
+    with mock.patch.object(deploy.subprocess, "run", side_effect=_fake_compose(health)), \
+            mock.patch.object(deploy.subprocess, "Popen", popen):
+        assert deploy.check_tunnel_status(["cf/docker-compose.dev.yml"], "dev") == "unauthorized"
+
+
+def test_wait_for_tunnel_returns_once_healthcheck_settles(monkeypatch):
+    states = iter([[], ["starting"], ["healthy"], ["healthy"]])
+    health = mock.Mock(side_effect=lambda cmd: next(states))
+    monkeypatch.setattr(deploy, "_tunnel_health", health)
+    monkeypatch.setattr(deploy, "_scan_tunnel_logs", lambda cmd, logs_can_connect: "unclear")
+    monkeypatch.setattr("time.sleep", lambda s: None)
+    deploy.wait_for_tunnel(["cf/docker-compose.dev.yml"], "dev", timeout=5)
+    assert health.call_count == 3  # stopped polling at the first "healthy"
+
+
+def test_wait_for_tunnel_returns_early_on_rejected_token(monkeypatch):
+    health = mock.Mock(return_value=["starting"])
+    scans = iter(["unclear", "unauthorized", "unclear"])
+    monkeypatch.setattr(deploy, "_tunnel_health", health)
+    monkeypatch.setattr(deploy, "_scan_tunnel_logs", lambda cmd, logs_can_connect: next(scans))
+    monkeypatch.setattr("time.sleep", lambda s: None)
+    deploy.wait_for_tunnel(["cf/docker-compose.dev.yml"], "dev", timeout=5)
+    assert health.call_count == 2  # stopped at the first Unauthorized, long before the timeout
+
+
+# ---------------------------------------------------------------------------
+# show_status — one Engine API listing instead of `docker compose ps`
+# ---------------------------------------------------------------------------
+
+def _serve_engine_api(sock_path, containers):
+    """Answer one HTTP request on a UNIX socket with `containers` as JSON."""
+    import http.server
+    import socketserver
+    import threading
+
+    class Handler(http.server.BaseHTTPRequestHandler):
+        def do_GET(self):
+            body = json.dumps(containers).encode()
+            self.send_response(200)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def address_string(self):
+            return "unix"
+
+        def log_message(self, *args):
+            pass
+
+    server = socketserver.UnixStreamServer(str(sock_path), Handler)
+    threading.Thread(target=server.handle_request, daemon=True).start()
+    return server
+
+
+def test_docker_socket_only_for_the_local_default_endpoint(tmp_path, monkeypatch):
+    monkeypatch.setenv("DOCKER_CONFIG", str(tmp_path))
+    monkeypatch.delenv("DOCKER_CONTEXT", raising=False)
+    monkeypatch.delenv("DOCKER_HOST", raising=False)
+    assert deploy._docker_socket() == "/var/run/docker.sock"
+    (tmp_path / "config.json").write_text(json.dumps({"currentContext": "remote"}))
+    assert deploy._docker_socket() is None
+    monkeypatch.setenv("DOCKER_HOST", "unix:///run/user/1000/docker.sock")
+    assert deploy._docker_socket() == "/run/user/1000/docker.sock"
+    monkeypatch.setenv("DOCKER_HOST", "tcp://10.0.0.1:2376")
+    assert deploy._docker_socket() is None
+
+
+def test_show_status_reads_engine_api_without_compose_processes(tmp_path, monkeypatch, capsys):
+    sock = tmp_path / "docker.sock"
+    server = _serve_engine_api(sock, [{
+        "Names": ["/decent-cloud-dev-cloudflared-1"],
+        "Labels": {"com.docker.compose.service": "cloudflared"},
+        "State": "running",
+        "Status": "Up 2 minutes (healthy)",
+        "Ports": [],
+    }])
+    monkeypatch.setenv("DOCKER_HOST", f"unix://{sock}")
+    monkeypatch.delenv("DOCKER_CONTEXT", raising=False)
+
+    try:
+        with mock.patch.object(deploy.subprocess, "run") as run, \
+                mock.patch.object(deploy.subprocess, "Popen") as popen:
+            assert deploy.show_status("dev") == 0
+    finally:
+        server.server_close()
+
+    run.assert_not_called()
+    popen.assert_not_called()
+    out = capsys.readouterr().out
+    assert "decent-cloud-dev-cloudflared-1" in out
+    assert "Tunnel connection: Active" in out
+
+
+def test_show_status_falls_back_to_compose_when_socket_unusable(tmp_path, monkeypatch):
+    monkeypatch.setenv("DOCKER_HOST", f"unix://{tmp_path / 'missing.sock'}")
+    with mock.patch.object(deploy.subprocess, "run", side_effect=_fake_compose("healthy")) as run:
+        assert deploy.show_status("dev") == 0
+    assert any(call.args[0][-1] == "ps" for call in run.call_args_list)
+
+
+# ---------------------------------------------------------------------------
+# check_docker / check_prerequisites — PATH lookups, minimal process spawns
+# ---------------------------------------------------------------------------
+
+def test_check_docker_finds_cli_on_path_and_probes_compose():
+    with mock.patch("shutil.which", return_value="/usr/bin/docker") as which, \
+            mock.patch.object(deploy.subprocess, "run", return_value=mock.Mock(returncode=0)) as run:
+        assert deploy.check_docker() is True
+    which.assert_called_once_with("docker")
+    assert [call.args[0] for call in run.call_args_list] == [["docker", "compose", "version"]]
+
+
+def test_check_docker_fails_when_compose_missing(capsys):
+    with mock.patch("shutil.which", return_value="/usr/bin/docker"), \
+            mock.patch.object(deploy.subprocess, "run", return_value=mock.Mock(returncode=1)):
+        assert deploy.check_docker() is False
+    assert "Docker or Docker Compose is not installed" in capsys.readouterr().err
+
+
+def test_check_docker_fails_without_spawning_when_cli_missing():
+    with mock.patch("shutil.which", return_value=None), \
+            mock.patch.object(deploy.subprocess, "run") as run:
+        assert deploy.check_docker() is False
+    run.assert_not_called()
+
+
+def test_check_prerequisites_fails_when_node_missing(capsys):
+    with mock.patch("shutil.which", side_effect=lambda tool: None if tool == "node" else f"/usr/bin/{tool}"), \
+            mock.patch.object(deploy.subprocess, "run") as run:
+        assert deploy.check_prerequisites() is False
+    captured = capsys.readouterr()
+    assert "Rust toolchain found" in captured.out
+    assert "Node.js not found" in captured.err
+    run.assert_not_called()
+
+
 # ---------------------------------------------------------------------------
 # calculate_binary_hash — silent "no-binary" sentinel must now warn loudly
 # ---------------------------------------------------------------------------
@@ -50,6 +278,147 @@ def test_calculate_binary_hash_warns_loudly_when_binary_missing(capsys):
     assert "no-binary" in out  # names the stale-cache consequence
 
 
+def test_calculate_binary_hash_is_truncated_sha256_without_blake3(tmp_path, monkeypatch):
+    import hashlib
+    import sys
+
+    monkeypatch.setitem(sys.modules, "blake3", None)  # optional dependency absent
+    binary = tmp_path / "api-server"
+    binary.write_bytes(b"\x7fELF" + bytes(range(256)) * 8192)
+    monkeypatch.setattr(deploy, "API_BINARY_PATH", binary)
+    assert deploy.calculate_binary_hash() == hashlib.sha256(binary.read_bytes()).hexdigest()[:16]
+
+
+def test_calculate_binary_hash_reuses_sidecar_until_binary_changes(tmp_path, monkeypatch):
+    binary = tmp_path / "api-server"
+    binary.write_bytes(b"v1")
+    monkeypatch.setattr(deploy, "API_BINARY_PATH", binary)
+    first = deploy.calculate_binary_hash()
+    assert (tmp_path / ".api-server.hash.json").exists()
+
+    with mock.patch.object(deploy, "_hash_file") as rehash:
+        assert deploy.calculate_binary_hash() == first  # stat matches: no rehash
+    rehash.assert_not_called()
+
+    binary.write_bytes(b"v2-rebuilt")  # new size/mtime invalidates the sidecar
+    assert deploy.calculate_binary_hash() != first
+
+
+def test_calculate_binary_hash_handles_empty_binary(tmp_path, monkeypatch):
+    # mmap rejects zero-length files; the streaming fallback must take over.
+    import sys
+
+    monkeypatch.setitem(sys.modules, "blake3", None)
+    binary = tmp_path / "api-server"
+    binary.write_bytes(b"")
+    monkeypatch.setattr(deploy, "API_BINARY_PATH", binary)
+    assert deploy.calculate_binary_hash() == "e3b0c44298fc1c14"  # sha256(b"")
+
+
+# ---------------------------------------------------------------------------
+# native builds — explicit cwd, never a process-wide os.chdir
+# ---------------------------------------------------------------------------
+
+def test_native_builds_pass_cwd_without_chdir(tmp_path, monkeypatch):
+    (tmp_path / "api").mkdir()
+    (tmp_path / "website" / "build").mkdir(parents=True)
+    binary = tmp_path / "api-server"
+    binary.write_bytes(b"elf")
+    monkeypatch.setattr(deploy, "PROJECT_ROOT", tmp_path)
+    monkeypatch.setattr(deploy, "API_BINARY_PATH", binary)
+    monkeypatch.setattr(deploy, "_probe", lambda argv, cwd=None: None)
+    cwd_before = deploy.os.getcwd()
+
+    with mock.patch.object(deploy.subprocess, "run") as run:
+        assert deploy.build_rust_binaries_natively() is True
+        assert deploy.build_website_natively("dev", {}) is True
+
+    assert deploy.os.getcwd() == cwd_before
+    cargo, npm = (call.kwargs["cwd"] for call in run.call_args_list)
+    assert cargo == tmp_path
+    assert npm == tmp_path / "website"
+    # Sequential builds stream their output instead of capturing it.
+    assert not any(call.kwargs["capture_output"] for call in run.call_args_list)
+
+
+def test_native_builds_skip_when_inputs_unchanged(tmp_path, monkeypatch):
+    (tmp_path / "api" / "src").mkdir(parents=True)
+    source = tmp_path / "api" / "src" / "main.rs"
+    source.write_text("fn main() {}")
+    binary = tmp_path / "release" / "api-server"
+    binary.parent.mkdir()
+    binary.write_bytes(b"elf")
+    binary.with_name("dc").write_bytes(b"elf")
+    (tmp_path / "website" / "build").mkdir(parents=True)
+    monkeypatch.setattr(deploy, "PROJECT_ROOT", tmp_path)
+    monkeypatch.setattr(deploy, "API_BINARY_PATH", binary)
+    monkeypatch.setattr(deploy, "_probe", lambda argv, cwd=None: None)
+
+    with mock.patch.object(deploy.subprocess, "run") as run:
+        assert deploy.build_rust_binaries_natively() is True
+        assert deploy.build_website_natively("dev", {}) is True
+        assert run.call_count == 2
+        # Second deploy with nothing changed: no cargo, no npm.
+        assert deploy.build_rust_binaries_natively() is True
+        assert deploy.build_website_natively("dev", {}) is True
+        assert run.call_count == 2
+        # An edited source or a different .env.local invalidates only its own build.
+        source.write_text("fn main() { run() }")
+        assert deploy.build_rust_binaries_natively() is True
+        assert deploy.build_website_natively("dev", {"TELEGRAM_BOT_USERNAME": "OtherBot"}) is True
+        assert run.call_count == 4
+
+
+def test_rust_build_fingerprint_covers_sqlx_and_toolchain(tmp_path, monkeypatch):
+    (tmp_path / "api" / "src" / "build").mkdir(parents=True)
+    nested = tmp_path / "api" / "src" / "build" / "mod.rs"
+    nested.write_text("// source dir named build")
+    query = tmp_path / ".sqlx" / "query-1.json"
+    query.parent.mkdir()
+    query.write_text("{}")
+    (tmp_path / "api" / "target").mkdir()
+    monkeypatch.setattr(deploy, "PROJECT_ROOT", tmp_path)
+    toolchain = "rustc 1.80.0"
+    monkeypatch.setattr(
+        deploy, "_probe", lambda argv, cwd=None: mock.Mock(stdout=toolchain) if cwd == tmp_path else None
+    )
+
+    def fingerprint():
+        return deploy._inputs_fingerprint(deploy._RUST_BUILD_INPUTS, salt=deploy._rust_build_salt({}))
+
+    base = fingerprint()
+    # Build outputs directly under an input root are not inputs.
+    (tmp_path / "api" / "target" / "out.o").write_bytes(b"obj")
+    assert fingerprint() == base
+    # Regenerated sqlx queries, nested sources named `build` and a new toolchain are.
+    query.write_text('{"changed": true}')
+    assert fingerprint() != base
+    base = fingerprint()
+    nested.write_text("// edited source")
+    assert fingerprint() != base
+    base = fingerprint()
+    toolchain = "rustc 1.80.1"
+    assert fingerprint() != base
+
+
+def test_build_website_writes_env_local(tmp_path, monkeypatch):
+    (tmp_path / "website" / "build").mkdir(parents=True)
+    monkeypatch.setattr(deploy, "PROJECT_ROOT", tmp_path)
+    env_vars = {"STRIPE_PUBLISHABLE_KEY": "pk_test_x", "CHATWOOT_WEBSITE_TOKEN": "tok"}
+
+    with mock.patch.object(deploy.subprocess, "run"):
+        assert deploy.build_website_natively("dev", env_vars) is True
+
+    lines = (tmp_path / "website" / ".env.local").read_text().splitlines()
+    assert lines[:2] == ["# Auto-generated by deploy.py - DO NOT EDIT", "# Environment: dev"]
+    assert "VITE_DECENT_CLOUD_API_URL=https://dev-api.decent-cloud.org" in lines
+    assert "VITE_STRIPE_PUBLISHABLE_KEY=pk_test_x" in lines
+    # Token without base URL keeps the widget gated off.
+    assert "VITE_CHATWOOT_WEBSITE_TOKEN=tok" in lines
+    assert "# VITE_CHATWOOT_BASE_URL=https://your-chatwoot.example.org" in lines
+    assert lines[-1] == "VITE_TELEGRAM_BOT_USERNAME=DecentCloudBot"
+
+
 # ---------------------------------------------------------------------------
 # _update_stage_image_tag — the dc-stage overlay image bumper (pure logic)
 # ---------------------------------------------------------------------------
@@ -180,3 +549,48 @@ def test_preserves_rest_of_file_byte_for_byte(tmp_path):
     out = k.read_text()
     assert "# Managed overlay" in out
     assert "patches:\n" in out
+
+
+# ---------------------------------------------------------------------------
+# parse_cli — hand-rolled dispatcher must accept exactly the documented CLI
+# ---------------------------------------------------------------------------
+
+def test_parse_cli_normalizes_aliases_and_options():
+    assert deploy.parse_cli(["up", "production"])["command"] == "deploy"
+    assert deploy.parse_cli(["up", "production"])["environment"] == "prod"
+    assert deploy.parse_cli(["deploy", "stage", "--tag", "abc123"])["tag"] == "abc123"
+    assert deploy.parse_cli(["deploy", "stage", "--tag=abc123"])["tag"] == "abc123"
+    assert deploy.parse_cli(["deploy", "stage"])["tag"] == deploy.STAGE_DEFAULT_TAG
+    args = deploy.parse_cli(["logs", "development", "-f", "website"])
+    assert (args["environment"], args["follow"], args["service"]) == ("dev", True, "website")
+
+
+@pytest.mark.parametrize("argv", [
+    ["bogus", "dev"],                # unknown command
+    ["stop"],                        # missing environment
+    ["stop", "stage"],               # stage is k8s-only: deploy/config
+    ["logs", "dev", "nginx"],        # unknown service
+    ["status", "dev", "extra"],      # stray positional
+    ["stop", "dev", "--tag", "x"],   # --tag only applies to deploy
+    ["deploy", "stage", "--tag"],    # --tag without a value
+])
+def test_parse_cli_rejects_invalid_input(argv):
+    with pytest.raises(ValueError):
+        deploy.parse_cli(argv)
+
+
+def test_main_reports_usage_errors_with_exit_code_2(capsys):
+    assert deploy.main(["stop", "stage"]) == 2
+    err = capsys.readouterr().err
+    assert err.startswith("usage: deploy.py")
+    assert "invalid environment 'stage'" in err
+
+
+def test_main_dispatches_every_command_through_the_table():
+    assert deploy._COMMANDS.keys() == deploy._COMMAND_ENVS.keys()
+    with mock.patch.object(deploy, "show_logs", return_value=0) as show_logs, \
+            mock.patch.object(deploy, "deploy_stage", return_value=0) as deploy_stage:
+        assert deploy.main(["logs", "development", "-f", "website"]) == 0
+        assert deploy.main(["up", "stage", "--tag", "abc"]) == 0
+    show_logs.assert_called_once_with("dev", True, "website")
+    deploy_stage.assert_called_once_with("abc")
@@ -1,14 +1,29 @@
 #!/usr/bin/env python3
 
 import argparse
+import functools
 import os
 import shutil
 import subprocess
 import pathlib
 import sys
+from concurrent.futures import ThreadPoolExecutor
+
+# Containers write build outputs as the invoking user (`id -u`:`id -g`); without
+# POSIX ids (Windows) the image's default user applies.
+DOCKER_USER_ARGS = ['-u', f'{os.getuid()}:{os.getgid()}'] if hasattr(os, 'getuid') else []
+
+# Files whose change triggers a PDF rebuild.
+LATEX_SOURCE_SUFFIXES = ('.tex', '.cls', '.bib', '.bbl', '.600pk')
+
+@functools.cache
+def local_tool(name: str):
+    """Path of `name` on PATH, or None — a local tool skips the docker container."""
+    return shutil.which(name)
 
 def check_dependencies():
-    dependencies = ['docker']
+    # Docker is only needed for the tools not installed locally.
+    dependencies = [] if local_tool('mmdc') and local_tool('latexmk') else ['docker']
     missing_deps = [dep for dep in dependencies if shutil.which(dep) is None]
 
     if missing_deps:
@@ -25,17 +40,20 @@ def should_rebuild(src_files, target_file):
     return any(os.path.getmtime(src) > target_mtime for src in src_files)
 
 def run_mmdc(repo_root: pathlib.Path, input_path: pathlib.Path, output_path: pathlib.Path):
-    """Build the figure using mermaid-cli docker container."""
-    # docker run --rm -u `id -u`:`id -g` -v /input_dir:/data minlag/mermaid-cli -i input_file
+    """Build the figure using a local mmdc, else the mermaid-cli docker container."""
     print(f"Building figure: {input_path.name} --> {output_path.name}")
-    subprocess.check_call([
-        'docker', 'run', '--rm',
-        '-u', f'{os.getuid()}:{os.getgid()}',
-        '-v', f'{repo_root}:/data',
-        'minlag/mermaid-cli',
-        '-i', str(input_path.relative_to(repo_root)),
-        '-o', str(output_path.relative_to(repo_root))
-    ])
+    if local_tool('mmdc'):
+        subprocess.check_call(['mmdc', '-i', str(input_path), '-o', str(output_path)])
+    else:
+        # docker run --rm -u `id -u`:`id -g` -v /input_dir:/data minlag/mermaid-cli -i input_file
+        subprocess.check_call([
+            'docker', 'run', '--rm',
+            *DOCKER_USER_ARGS,
+            '-v', f'{repo_root}:/data',
+            'minlag/mermaid-cli',
+            '-i', str(input_path.relative_to(repo_root)),
+            '-o', str(output_path.relative_to(repo_root))
+        ])
     if output_path.exists():
         output_path.touch()
     else:
@@ -43,46 +61,62 @@ def run_mmdc(repo_root: pathlib.Path, input_path: pathlib.Path, output_path: pat
         sys.exit(1)
 
 def run_latexmk(repo_root: pathlib.Path, input_path: pathlib.Path, cache_dir: pathlib.Path, watch: bool):
-    """Build the pdf using latexmk docker container."""
+    """Build the pdf using a local latexmk, else the latexmk docker container."""
     print(f"Building PDF: {input_path.name}")
     cache_subdir = input_path.parent.relative_to(repo_root)
-    args = [
-        'docker', 'run', '--rm',
-        '-u', f'{os.getuid()}:{os.getgid()}',
-        '-v', f'{repo_root}:/data',
-        '-v', f'{cache_dir}:/cache',
-        '--workdir', f'/data/{cache_subdir}',
-        'thubo/latexmk', '-pdf',
-        '-view=none', str(input_path.name),
-        f'-output-directory=/cache/{cache_subdir}'
-    ]
+    if local_tool('latexmk'):
+        args = [
+            'latexmk', '-pdf',
+            '-view=none', str(input_path.name),
+            f'-output-directory={cache_dir / cache_subdir}'
+        ]
+    else:
+        args = [
+            'docker', 'run', '--rm',
+            *DOCKER_USER_ARGS,
+            '-v', f'{repo_root}:/data',
+            '-v', f'{cache_dir}:/cache',
+            '--workdir', f'/data/{cache_subdir}',
+            'thubo/latexmk', '-pdf',
+            '-view=none', str(input_path.name),
+            f'-output-directory=/cache/{cache_subdir}'
+        ]
 
     if watch:
         args.append('-pvc')
 
     print('Running:', ' '.join(args))
-    subprocess.check_call(args)
+    # The local run needs the same working directory the container gets.
+    subprocess.check_call(args, cwd=input_path.parent)
     output_pdf = cache_dir / cache_subdir / "whitepaper.pdf"
     if not output_pdf.exists():
         print("Error: Latexmk conversion failed.")
         sys.exit(1)
 
 
-def build_figures(repo_root: pathlib.Path, figures_dir: pathlib.Path):
-    for mmd_file in figures_dir.glob('*.mmd'):
-        output_path = mmd_file.with_suffix('.png')
-        if should_rebuild([mmd_file], output_path):
-            run_mmdc(repo_root=repo_root, input_path=mmd_file, output_path=output_path)
+def build_figures(repo_root: pathlib.Path, figures_dir: pathlib.Path, jobs: int):
+    """Render stale figures, up to `jobs` mmdc containers at a time."""
+    stale = [(mmd_file, mmd_file.with_suffix('.png')) for mmd_file in figures_dir.glob('*.mmd')]
+    stale = [(src, dst) for src, dst in stale if should_rebuild([src], dst)]
+    if not stale:
+        return
+    # Each render is a container start dominated by docker's cold start, so
+    # overlapping them is what saves wall time; a failure re-raises from map().
+    with ThreadPoolExecutor(max_workers=min(jobs, len(stale))) as pool:
+        list(pool.map(lambda pair: run_mmdc(repo_root, *pair), stale))
 
 
 def build_latex(repo_root: pathlib.Path, latex_dir: pathlib.Path, cache_dir: pathlib.Path, watch: bool):
-    """Build the pdf using latexmk docker container."""
-    latex_files = list(latex_dir.glob('*.tex')) + list(latex_dir.glob('*.cls')) + list(latex_dir.glob('*.bib')) + list(latex_dir.glob('*.bbl')) + list(latex_dir.glob('*.600pk'))
+    """Build the pdf (local latexmk, else the latexmk docker container) if sources changed."""
+    # One directory pass for all source types instead of a glob per extension.
+    with os.scandir(latex_dir) as entries:
+        latex_files = [entry.path for entry in entries if entry.name.endswith(LATEX_SOURCE_SUFFIXES) and entry.is_file()]
     pdf_file = cache_dir / latex_dir.relative_to(repo_root) / "whitepaper.pdf"
 
     if should_rebuild(latex_files, pdf_file) or watch:
         run_latexmk(repo_root=repo_root, input_path=latex_dir / 'whitepaper.tex', cache_dir=cache_dir, watch=watch)
 
+@functools.cache
 def get_repo_root():
     try:
         repo_root = subprocess.check_output(['git', 'rev-parse', '--show-toplevel']).strip().decode('utf-8')
@@ -99,6 +133,8 @@ def parse_args():
     parser = argparse.ArgumentParser()
     parser.add_argument('--clean', action='store_true')
     parser.add_argument('--watch', action='store_true')
+    parser.add_argument('--jobs', '-j', type=int, default=min(4, os.cpu_count() or 1),
+                        help='max figures rendered in parallel (default: %(default)s)')
     return parser.parse_args()
 
 def main():
@@ -108,12 +144,15 @@ def main():
     cache_dir = repo_root / "build"
 
     args = parse_args()
+    if args.jobs < 1:
+        print(f"Error: --jobs must be at least 1, got {args.jobs}")
+        sys.exit(1)
     if args.clean:
         clean(cache_dir=cache_dir)
 
     cache_dir.mkdir(parents=True, exist_ok=True)
 
-    build_figures(repo_root, repo_root / "docs" / "whitepaper" / "figures")
+    build_figures(repo_root, repo_root / "docs" / "whitepaper" / "figures", args.jobs)
     build_latex(repo_root, repo_root / "docs" / "whitepaper", cache_dir, args.watch)
 
 if __name__ == '__main__':
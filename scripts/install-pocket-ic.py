@@ -3,26 +3,135 @@
 
 import os
 import sys
+import time
+import urllib.error
 import urllib.request
 import json
 import tempfile
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # Never bare — every GitHub/HTTP call carries this (connect + per-read bound).
 HTTP_TIMEOUT = 30
 
+RELEASE_URL = "https://api.github.com/repos/dfinity/pocket-ic/releases/latest"
+# Release metadata cache: reused as-is for RELEASE_CACHE_TTL seconds, then
+# revalidated with its ETag (a 304 skips the body and is not rate-limited).
+RELEASE_CACHE = Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache")) / "decent-cloud" / "pocket-ic-release.json"
+RELEASE_CACHE_TTL = 3600
+# Concurrent range requests per download, when the server supports them.
+DOWNLOAD_PARTS = 4
+
+def _read_release_cache():
+    try:
+        cached = json.loads(RELEASE_CACHE.read_text())
+        return cached if isinstance(cached, dict) and "body" in cached else None
+    except (OSError, ValueError):
+        return None
+
+def _write_release_cache(etag, body):
+    try:
+        RELEASE_CACHE.parent.mkdir(parents=True, exist_ok=True)
+        RELEASE_CACHE.write_text(json.dumps({"etag": etag, "fetched_at": time.time(), "body": body}))
+    except OSError as e:
+        print(f"Warning: could not write release cache {RELEASE_CACHE}: {e}")
+
 def get_latest_release():
-    """Get the latest release information from GitHub API."""
-    url = "https://api.github.com/repos/dfinity/pocket-ic/releases/latest"
+    """Get the latest release information from GitHub API (cached, see RELEASE_CACHE)."""
+    cached = _read_release_cache()
+    if cached and time.time() - cached.get("fetched_at", 0) < RELEASE_CACHE_TTL:
+        return cached["body"]
+
+    headers = {"If-None-Match": cached["etag"]} if cached and cached.get("etag") else {}
     try:
-        with urllib.request.urlopen(url, timeout=HTTP_TIMEOUT) as response:
+        request = urllib.request.Request(RELEASE_URL, headers=headers)
+        with urllib.request.urlopen(request, timeout=HTTP_TIMEOUT) as response:
             data = json.loads(response.read().decode())
+            _write_release_cache(response.headers.get("ETag"), data)
             return data
+    except urllib.error.HTTPError as e:
+        if e.code == 304 and cached:
+            _write_release_cache(cached["etag"], cached["body"])  # refresh fetched_at
+            return cached["body"]
+        print(f"Error fetching release info: {e}")
+        return None
     except Exception as e:
         print(f"Error fetching release info: {e}")
         return None
 
+def _probe_ranges(url):
+    """(final URL after redirects, size) if the server serves byte ranges, else None.
+
+    A one-byte ranged GET rather than HEAD: urllib turns a redirected HEAD into
+    a full GET, and the release URL always redirects.
+    """
+    try:
+        request = urllib.request.Request(url, headers={"Range": "bytes=0-0"})
+        with urllib.request.urlopen(request, timeout=HTTP_TIMEOUT) as response:
+            # Content-Range: bytes 0-0/<size>
+            total = response.headers.get("Content-Range", "").rpartition("/")[2]
+            if response.status == 206 and total.isdigit() and int(total):
+                return response.url, int(total)
+    except OSError:
+        pass  # URLError, HTTPError, timeouts — a plain GET may still work
+    return None
+
+def _download_range(url, fd, start, end):
+    """Fetch bytes [start, end] of `url` and write them at the same offset of `fd`."""
+    request = urllib.request.Request(url, headers={"Range": f"bytes={start}-{end}"})
+    with urllib.request.urlopen(request, timeout=HTTP_TIMEOUT) as response:
+        if response.status != 206:
+            raise OSError(f"expected 206 for bytes {start}-{end}, got {response.status}")
+        offset = start
+        while chunk := response.read(1 << 20):
+            os.pwrite(fd, chunk, offset)
+            offset += len(chunk)
+    if offset != end + 1:
+        raise OSError(f"short read for bytes {start}-{end}: stopped at {offset}")
+
+def _preallocate(tmp_file, size):
+    """Reserve `size` bytes up front: one extent instead of growth per write."""
+    if size and hasattr(os, "posix_fallocate"):
+        try:
+            os.posix_fallocate(tmp_file.fileno(), 0, size)
+        except OSError:
+            pass  # filesystem without fallocate support — writes still work
+
+def _download_single(url, tmp_file):
+    """Download `url` into `tmp_file` as one stream."""
+    with urllib.request.urlopen(url, timeout=HTTP_TIMEOUT) as response:
+        _preallocate(tmp_file, int(response.headers.get("Content-Length") or 0))
+        # 1 MiB copies: far fewer read/write syscalls than the 64 KiB default
+        shutil.copyfileobj(response, tmp_file, length=1 << 20)
+
+def _download(url, tmp_file):
+    """Download `url` into `tmp_file`, as parallel range requests when possible.
+
+    If any range part fails, the whole file is downloaded again as one stream.
+    """
+    probe = _probe_ranges(url) if hasattr(os, "pwrite") else None
+    if probe is None:
+        _download_single(url, tmp_file)
+        return
+
+    final_url, size = probe
+    _preallocate(tmp_file, size)
+    bounds = [size * i // DOWNLOAD_PARTS for i in range(DOWNLOAD_PARTS + 1)]
+    try:
+        with ThreadPoolExecutor(max_workers=DOWNLOAD_PARTS) as pool:
+            parts = [
+                pool.submit(_download_range, final_url, tmp_file.fileno(), start, stop - 1)
+                for start, stop in zip(bounds, bounds[1:]) if stop > start
+            ]
+            for part in parts:
+                part.result()  # re-raise the first failed part
+    except OSError as e:
+        print(f"Ranged download failed ({e}), retrying as a single stream...")
+        tmp_file.seek(0)
+        tmp_file.truncate()
+        _download_single(url, tmp_file)
+
 def download_pocket_ic():
     """Download pocket-ic binary for the current platform."""
     release_info = get_latest_release()
@@ -68,8 +177,7 @@ def download_pocket_ic():
     print(f"Downloading {asset_name}...")
     try:
         with tempfile.NamedTemporaryFile(delete=False) as tmp_file:
-            with urllib.request.urlopen(asset_url, timeout=HTTP_TIMEOUT) as response:
-                shutil.copyfileobj(response, tmp_file)
+            _download(asset_url, tmp_file)
 
             # Make executable and move to final location
             bin_dir = Path.home() / ".local" / "bin"
@@ -2,11 +2,20 @@
 """Set up Python environment for the project."""
 
 import os
+import shutil
 import sys
 import subprocess
 import venv
 from pathlib import Path
 
+# uv resolves and installs in parallel from a shared wheel cache; used when on
+# PATH, with stdlib venv + pip as the fallback.
+UV = shutil.which("uv")
+
+# Records the pyproject.toml mtime of the last successful install, so a rerun
+# with unchanged dependencies skips the resolve entirely.
+DEPS_STAMP = Path(".venv") / ".deps-stamp"
+
 def check_python_version():
     """Check if Python version meets requirements."""
     if sys.version_info < (3, 10):
@@ -24,7 +33,12 @@ def create_venv():
 
     print("Creating virtual environment...")
     try:
-        venv.create(venv_path, with_pip=True)
+        if UV:
+            # Same interpreter as the stdlib path; --seed installs pip so the
+            # pip fallback still works if uv later leaves PATH.
+            subprocess.check_call([UV, "venv", "--seed", "--python", sys.executable, str(venv_path)])
+        else:
+            venv.create(venv_path, with_pip=True)
         print("Virtual environment created successfully")
         return True
     except Exception as e:
@@ -37,17 +51,30 @@ def install_dependencies():
         print("No pyproject.toml found, skipping dependency installation")
         return True
 
+    pyproject_mtime = str(Path("pyproject.toml").stat().st_mtime_ns)
+    try:
+        if DEPS_STAMP.read_text() == pyproject_mtime:
+            print("Dependencies up to date")
+            return True
+    except OSError:
+        pass  # no stamp yet — install below
+
     print("Installing dependencies...")
 
     # Determine pip command based on platform
-    if sys.platform == "win32":
-        pip_cmd = [".venv\\Scripts\\pip.exe"]
+    if UV:
+        pip_cmd = [UV, "pip", "install", "--python", ".venv"]
+    elif sys.platform == "win32":
+        pip_cmd = [".venv\\Scripts\\pip.exe", "install"]
     else:
-        pip_cmd = ["./.venv/bin/pip"]
+        pip_cmd = ["./.venv/bin/pip", "install"]
+    # pip only: skip .pyc compilation at install time and the version check.
+    pip_env = {**os.environ, "PIP_NO_COMPILE": "1", "PIP_DISABLE_PIP_VERSION_CHECK": "1"}
 
     try:
         # Install in editable mode with dev dependencies
-        subprocess.check_call(pip_cmd + ["install", "-e", ".[dev]"])
+        subprocess.check_call(pip_cmd + ["-e", ".[dev]"], env=pip_env)
+        DEPS_STAMP.write_text(pyproject_mtime)
         print("Dependencies installed successfully")
         return True
     except subprocess.CalledProcessError as e:
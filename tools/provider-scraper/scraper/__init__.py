@@ -1,29 +1,77 @@
-"""Provider scraper framework for catalog seeding."""
-
-from scraper.base import BaseScraper
-from scraper.crawler import (
-    DEFAULT_BROWSER_CONFIG,
-    DEFAULT_PRUNING_THRESHOLD,
-    DEFAULT_WORD_THRESHOLD,
-    create_crawl_config,
-    create_markdown_generator,
-)
-from scraper.csv_writer import write_offerings_csv
-from scraper.discovery import discover_sitemap, discover_via_crawl
-from scraper.models import Offering
-from scraper.storage import CacheEntry, DocsArchive
+"""Provider scraper framework for catalog seeding.
 
+Exports are imported lazily on first access (PEP 562), so lightweight entry
+points such as ``scraper.cli help`` don't pay for importing Crawl4AI/Playwright.
+"""
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from scraper.base import BaseScraper
+    from scraper.concurrency import AIMDLimiter
+    from scraper.crawler import (
+        DEFAULT_BROWSER_CONFIG,
+        DEFAULT_CRAWL_CONFIG,
+        DEFAULT_MARKDOWN_GENERATOR,
+        DEFAULT_PRUNING_THRESHOLD,
+        DEFAULT_WORD_THRESHOLD,
+        create_crawl_config,
+        create_markdown_generator,
+    )
+    from scraper.csv_writer import write_offerings_csv
+    from scraper.discovery import discover_sitemap, discover_via_crawl
+    from scraper.models import Offering
+    from scraper.storage import CacheEntry, DocsArchive, SitemapCache
+
+# Public name -> defining module
+_EXPORTS = {
+    "AIMDLimiter": "scraper.concurrency",
+    "BaseScraper": "scraper.base",
+    "CacheEntry": "scraper.storage",
+    "DEFAULT_BROWSER_CONFIG": "scraper.crawler",
+    "DEFAULT_CRAWL_CONFIG": "scraper.crawler",
+    "DEFAULT_MARKDOWN_GENERATOR": "scraper.crawler",
+    "DEFAULT_PRUNING_THRESHOLD": "scraper.crawler",
+    "DEFAULT_WORD_THRESHOLD": "scraper.crawler",
+    "DocsArchive": "scraper.storage",
+    "Offering": "scraper.models",
+    "SitemapCache": "scraper.storage",
+    "create_crawl_config": "scraper.crawler",
+    "create_markdown_generator": "scraper.crawler",
+    "discover_sitemap": "scraper.discovery",
+    "discover_via_crawl": "scraper.discovery",
+    "write_offerings_csv": "scraper.csv_writer",
+}
+
+# Literal so linters and type checkers can read it; mirrors _EXPORTS.
 __all__ = [
-    "BaseScraper",
-    "CacheEntry",
     "DEFAULT_BROWSER_CONFIG",
+    "DEFAULT_CRAWL_CONFIG",
+    "DEFAULT_MARKDOWN_GENERATOR",
     "DEFAULT_PRUNING_THRESHOLD",
     "DEFAULT_WORD_THRESHOLD",
+    "AIMDLimiter",
+    "BaseScraper",
+    "CacheEntry",
     "DocsArchive",
     "Offering",
+    "SitemapCache",
     "create_crawl_config",
     "create_markdown_generator",
     "discover_sitemap",
     "discover_via_crawl",
     "write_offerings_csv",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_EXPORTS[name]), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_EXPORTS))
@@ -1,26 +1,64 @@
 """Base scraper class for provider scrapers."""
 
+import asyncio
 import json
 import logging
+import os
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from functools import cached_property
 from pathlib import Path
+from types import TracebackType
+from typing import Any, Self
+from urllib.parse import urlsplit
 
 import httpx
-from crawl4ai import AsyncWebCrawler
-
-from scraper.crawler import DEFAULT_BROWSER_CONFIG, create_crawl_config
+from crawl4ai import AsyncWebCrawler, CrawlerRunConfig
+
+from scraper.concurrency import AIMDLimiter
+from scraper.crawler import (
+    DEFAULT_BROWSER_CONFIG,
+    DEFAULT_CRAWL_CONFIG,
+    SharedCrawler,
+    is_rate_limited,
+)
 from scraper.csv_writer import write_offerings_csv
 from scraper.discovery import DiscoveryError, discover_sitemap, discover_via_crawl
 from scraper.models import Offering
-from scraper.storage import DocsArchive
+from scraper.storage import DocsArchive, SitemapCache
 
 logger = logging.getLogger(__name__)
 
+# Retries per doc page after a rate-limit response, with exponential backoff
+# (RATE_LIMIT_BACKOFF * 2**attempt seconds) while the crawl concurrency shrinks.
+RATE_LIMIT_RETRIES = 3
+RATE_LIMIT_BACKOFF = 2.0
+
+# Concurrent conditional HEADs asking whether archived doc pages changed.
+CONDITIONAL_CHECK_CONCURRENCY = 16
+
+# Connection pool of the shared HTTP client (HTTP/2 multiplexes requests per host).
+HTTP_LIMITS = httpx.Limits(max_connections=32, max_keepalive_connections=16)
+
+# Concurrent raw markdown fetches from GitHub (stays under its secondary rate limit).
+GITHUB_FETCH_CONCURRENCY = 8
+
 
 class DocsScrapeError(Exception):
     """Raised when docs scraping fails."""
 
 
+@dataclass
+class CrawledPage:
+    """Markdown extracted from a crawled doc page, without the heavy crawl result."""
+
+    content: str
+    topic: str
+    etag: str | None
+
+
 class BaseScraper(ABC):
     """Abstract base class for provider scrapers."""
 
@@ -35,12 +73,60 @@ class BaseScraper(ABC):
     github_docs_repo: str | None = None  # GitHub repo with markdown docs (e.g., "owner/repo")
     github_docs_path: str = "tutorials"  # Path within repo to fetch docs from
 
-    def __init__(self, output_dir: Path | None = None) -> None:
-        """Initialize the scraper with an output directory."""
+    # Doc pages crawled at once (browser tabs): starts at initial_concurrency and
+    # adapts to rate limiting (see AIMDLimiter), never exceeding max_concurrency.
+    initial_concurrency: int = 4
+    max_concurrency: int = 16
+
+    def __init__(
+        self, output_dir: Path | None = None, crawler: SharedCrawler | None = None
+    ) -> None:
+        """Initialize the scraper with an output directory.
+
+        Args:
+            output_dir: Where to write offerings, docs and metadata.
+            crawler: Browser shared with other scrapers; if None, each crawl
+                launches its own.
+        """
         self.output_dir = output_dir or Path("output") / self.provider_id
         self.archive = DocsArchive(self.output_dir)
+        self.sitemap_cache = SitemapCache(self.output_dir / "sitemaps.json")
+        self.shared_crawler = crawler
+        self._http: httpx.AsyncClient | None = None
+        # Changelog ETag seen by the last check_for_changes(), persisted after Q&A generation
+        self._changelog_etag: str | None = None
 
     @property
+    def http(self) -> httpx.AsyncClient:
+        """Shared HTTP/2 client, created on first use and closed by aclose().
+
+        Reusing one pooled client saves a TLS handshake per request; use the
+        scraper as ``async with scraper:`` to close it when done.
+        """
+        if self._http is None:
+            self._http = httpx.AsyncClient(
+                http2=True, timeout=30.0, follow_redirects=True, limits=HTTP_LIMITS
+            )
+        return self._http
+
+    async def aclose(self) -> None:
+        """Close the shared HTTP client."""
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        await self.aclose()
+
+    @cached_property
     def provider_id(self) -> str:
         """Generate a safe provider ID from the name."""
         return self.provider_name.lower().replace(" ", "-")
@@ -69,8 +155,8 @@ class BaseScraper(ABC):
         base_url = self.docs_base_url or self.provider_website
         logger.info(f"Discovering doc URLs for {self.provider_name} from {base_url}")
 
-        # Try sitemap first (may raise DiscoveryError)
-        urls = await discover_sitemap(base_url)
+        # Try sitemap first over the pooled client (may raise DiscoveryError)
+        urls = await discover_sitemap(base_url, client=self.http, cache=self.sitemap_cache)
         if urls:
             logger.info(f"Found {len(urls)} URLs via sitemap")
             return self._filter_doc_urls(urls)
@@ -93,18 +179,21 @@ class BaseScraper(ABC):
         Returns:
             Filtered list of doc URLs (deduplicated).
         """
-        base_url = self.docs_base_url or self.provider_website
-        # Normalize: ensure base_url ends without slash for consistent prefix matching
-        base_url = base_url.rstrip("/")
-
-        # Keep only URLs from the docs domain, deduplicate
-        seen = set()
-        filtered = []
+        base_url = (self.docs_base_url or self.provider_website).rstrip("/")
+        # Match on a path boundary so https://docs.x.com does not admit https://docs.x.com.evil
+        base_prefix = base_url + "/"
+
+        # Keep only URLs from the docs domain, deduplicate (ignoring a trailing slash)
+        seen: set[str] = set()
+        filtered: list[str] = []
+        append = filtered.append
         for url in urls:
-            normalized = url.rstrip("/")
-            if normalized.startswith(base_url) and normalized not in seen:
-                seen.add(normalized)
-                filtered.append(url)
+            key = url[:-1] if url.endswith("/") else url
+            if key in seen:
+                continue
+            if key == base_url or key.startswith(base_prefix):
+                seen.add(key)
+                append(url)
 
         logger.debug(f"Filtered {len(urls)} URLs down to {len(filtered)} doc URLs from {base_url}")
         return filtered
@@ -123,72 +212,184 @@ class BaseScraper(ABC):
         if not urls:
             raise DocsScrapeError(f"No doc URLs found for {self.provider_name}")
 
-        logger.info(f"Scraping {len(urls)} doc pages for {self.provider_name}")
-        config = create_crawl_config()
+        # Ask the servers first which archived pages changed (conditional HEADs in
+        # parallel), so an unchanged site is re-checked without launching a browser
+        semaphore = asyncio.Semaphore(CONDITIONAL_CHECK_CONCURRENCY)
+        unchanged = await asyncio.gather(*(self._is_not_modified(url, semaphore) for url in urls))
+        changed_urls = [
+            url for url, not_modified in zip(urls, unchanged, strict=True) if not not_modified
+        ]
+        not_modified_count = len(urls) - len(changed_urls)
+        if not changed_urls:
+            logger.info(
+                f"All {len(urls)} doc pages for {self.provider_name} not modified, skipping crawl"
+            )
+            return 0
+
+        logger.info(
+            f"Scraping {len(changed_urls)} doc pages for {self.provider_name}"
+            f" ({not_modified_count} not modified)"
+        )
+        config = DEFAULT_CRAWL_CONFIG
         written_count = 0
         error_count = 0
 
-        async with AsyncWebCrawler(config=DEFAULT_BROWSER_CONFIG) as crawler:
-            for i, url in enumerate(urls, 1):
-                try:
-                    logger.debug(f"Crawling [{i}/{len(urls)}]: {url}")
-                    result = await crawler.arun(url=url, config=config)
-
-                    # Check for rate limiting in error message
-                    if result.error_message:
-                        if "429" in result.error_message or "rate" in result.error_message.lower():
-                            raise DocsScrapeError(f"Rate limited while scraping docs: {url}")
-
-                    if not result.success:
-                        logger.warning(f"Failed to crawl {url}: {result.error_message}")
-                        error_count += 1
-                        continue
-
-                    # Extract content - prefer fit_markdown, fall back to raw
-                    fit_md = result.markdown.fit_markdown or ""
-                    raw_md = result.markdown.raw_markdown or ""
-
-                    # Use fit if it has substantial content, else fall back to raw
-                    # (fit can be empty if pruning was too aggressive)
-                    if len(fit_md.strip()) >= 100:
-                        content = fit_md
-                    elif raw_md.strip():
-                        content = raw_md
-                        logger.debug(f"Using raw markdown for {url} (fit was too short: {len(fit_md)} chars)")
-                    else:
-                        logger.warning(f"No markdown content for {url} (fit={len(fit_md)}, raw={len(raw_md)})")
-                        error_count += 1
-                        continue
-
-                    # Extract topic from URL or page title
-                    topic = self._extract_topic(url, result.metadata.get("title", ""))
-
-                    # Get ETag from response headers if available
-                    etag = result.metadata.get("etag")
+        async with self._browser() as crawler:
+            # Fetch pages concurrently (bounded), then process results in URL order
+            # so archive writes stay sequential.
+            limiter = AIMDLimiter(initial=self.initial_concurrency, maximum=self.max_concurrency)
+            tasks = [
+                asyncio.create_task(self._crawl_one(crawler, config, url, limiter))
+                for url in changed_urls
+            ]
+            try:
+                results = await asyncio.gather(*tasks)
+            except DocsScrapeError:
+                # Still rate limited after backing off: stop the remaining crawls
+                for task in tasks:
+                    task.cancel()
+                raise
 
-                    # Check if changed before writing
-                    if not self.archive.has_changed(url, etag, content):
+            for url, page in zip(changed_urls, results, strict=True):
+                if page is None:
+                    error_count += 1
+                    continue
+                try:
+                    # Write to archive unless unchanged
+                    if (
+                        self.archive.write_if_changed(url, page.content, page.topic, page.etag)
+                        is None
+                    ):
                         logger.debug(f"Skipping unchanged: {url}")
                         continue
-
-                    # Write to archive
-                    self.archive.write(url, content, topic, etag)
                     written_count += 1
 
-                except DocsScrapeError:
-                    raise
                 except Exception as e:
-                    logger.error(f"Error crawling {url}: {e}")
+                    logger.error(f"Error processing {url}: {e}")
                     error_count += 1
 
         logger.info(f"Wrote {written_count} new/changed docs for {self.provider_name}")
 
         # If all URLs failed, raise an error
         if error_count == len(urls) and written_count == 0:
-            raise DocsScrapeError(f"All {len(urls)} doc pages failed to scrape for {self.provider_name}")
+            raise DocsScrapeError(
+                f"All {len(urls)} doc pages failed to scrape for {self.provider_name}"
+            )
 
         return written_count
 
+    @asynccontextmanager
+    async def _browser(self) -> AsyncIterator[AsyncWebCrawler]:
+        """Yield the shared crawler if one was given, else a browser for this crawl only."""
+        if self.shared_crawler is not None:
+            yield await self.shared_crawler.get()
+            return
+        async with AsyncWebCrawler(config=DEFAULT_BROWSER_CONFIG) as crawler:
+            yield crawler
+
+    async def _is_not_modified(self, url: str, semaphore: asyncio.Semaphore) -> bool:
+        """Ask the server whether a doc page changed since its archived ETag.
+
+        A conditional HEAD (If-None-Match) answered with 304 means the page can be
+        skipped without a browser render. Pages without a stored ETag, and any
+        request error, count as modified.
+        """
+        etag = self.archive.etag_for(url)
+        if not etag:
+            return False
+        try:
+            async with semaphore:
+                response = await self.http.head(url, headers={"If-None-Match": etag})
+        except httpx.HTTPError as e:
+            logger.debug(f"Conditional request failed for {url}: {e}")
+            return False
+        return response.status_code == 304
+
+    async def _crawl_one(
+        self,
+        crawler: AsyncWebCrawler,
+        config: CrawlerRunConfig,
+        url: str,
+        limiter: AIMDLimiter,
+    ) -> CrawledPage | None:
+        """Crawl a single doc page while holding a concurrency slot.
+
+        A rate-limited attempt halves the shared concurrency limit and is
+        retried after a backoff; a 5xx response halves it too but is not retried.
+
+        Returns:
+            The extracted CrawledPage, or None if the page failed (logged).
+
+        Raises:
+            DocsScrapeError: If the provider still rate limits us after all retries.
+        """
+        for attempt in range(RATE_LIMIT_RETRIES + 1):
+            async with limiter:
+                logger.debug(f"Crawling: {url}")
+                try:
+                    result = await crawler.arun(url=url, config=config)
+                except Exception as e:
+                    logger.error(f"Error crawling {url}: {e}")
+                    return None
+
+                # Check for rate limiting in error message; a 5xx also means the
+                # server is struggling, so it shrinks the limit without a retry
+                rate_limited = is_rate_limited(result.error_message)
+                status = result.status_code
+                limiter.record(overloaded=rate_limited or (status is not None and status >= 500))
+
+            if not rate_limited:
+                # Keep only the markdown so the rendered page is freed right away
+                return self._extract_page(url, result)
+            if attempt < RATE_LIMIT_RETRIES:
+                delay = RATE_LIMIT_BACKOFF * 2**attempt
+                logger.warning(
+                    f"Rate limited on {url}, retrying in {delay:.0f}s (concurrency now {limiter.limit})"
+                )
+                await asyncio.sleep(delay)
+
+        raise DocsScrapeError(f"Rate limited while scraping docs: {url}")
+
+    def _extract_page(self, url: str, result: Any) -> CrawledPage | None:
+        """Extract the markdown to archive from a crawl result.
+
+        Returns:
+            The extracted page, or None if the crawl failed or has no content (logged).
+        """
+        try:
+            if not result.success:
+                logger.warning(f"Failed to crawl {url}: {result.error_message}")
+                return None
+
+            # Extract content - prefer fit_markdown, fall back to raw
+            fit_md = result.markdown.fit_markdown or ""
+            raw_md = result.markdown.raw_markdown or ""
+
+            # Use fit if it has substantial content, else fall back to raw
+            # (fit can be empty if pruning was too aggressive)
+            if len(fit_md.strip()) >= 100:
+                content = fit_md
+            elif raw_md.strip():
+                content = raw_md
+                logger.debug(
+                    f"Using raw markdown for {url} (fit was too short: {len(fit_md)} chars)"
+                )
+            else:
+                logger.warning(
+                    f"No markdown content for {url} (fit={len(fit_md)}, raw={len(raw_md)})"
+                )
+                return None
+
+            # Extract topic from URL or page title; ETag from the HTTP response headers
+            # (metadata only holds the page's <head> meta tags, never an ETag)
+            topic = self._extract_topic(url, result.metadata.get("title", ""))
+            etag = (result.response_headers or {}).get("etag")
+            return CrawledPage(content=content, topic=topic, etag=etag)
+
+        except Exception as e:
+            logger.error(f"Error processing {url}: {e}")
+            return None
+
     def _extract_topic(self, url: str, title: str) -> str:
         """Extract topic from URL or page title.
 
@@ -199,23 +400,20 @@ class BaseScraper(ABC):
         Returns:
             Topic string for filename generation.
         """
-        # Use title if available and reasonable length
+        # Use title if available and reasonable length (whitespace-only titles don't count)
+        title = title.strip()
         if title and len(title) < 100:
             return title
 
-        # Extract last path segment from URL
-        parts = url.rstrip("/").split("/")
-        if len(parts) > 3:
-            return parts[-1]
-
-        return "index"
+        # Extract last path segment from URL (query and fragment ignored)
+        return urlsplit(url).path.rstrip("/").rpartition("/")[2] or "index"
 
     async def run(
         self,
         skip_offerings: bool = False,
         skip_docs: bool = False,
         keep_local: bool = False,
-    ) -> tuple[Path | None, int]:
+    ) -> tuple[Path | None, int, int]:
         """Run the full scraping process and write output files.
 
         Args:
@@ -224,7 +422,8 @@ class BaseScraper(ABC):
             keep_local: If True, keep local docs/ directory for troubleshooting.
 
         Returns:
-            Tuple of (csv_path, docs_count). csv_path is None if offerings skipped.
+            Tuple of (csv_path, offerings_count, docs_count). csv_path is None if
+            offerings skipped.
 
         Raises:
             Exception: If scraping fails and skip_* is False.
@@ -232,23 +431,46 @@ class BaseScraper(ABC):
         logger.info(f"Starting scrape for {self.provider_name}")
 
         csv_path = None
+        offerings_count = 0
         docs_count = 0
 
-        # Scrape offerings
+        # Offerings and docs come from different endpoints and write different
+        # files, so scrape both concurrently. A failure that may not be skipped
+        # cancels the other stage right away instead of waiting for it.
+        offerings_task = asyncio.create_task(self.scrape_offerings())
+        docs_task = asyncio.create_task(self.scrape_docs())
+        skippable: dict[asyncio.Task[Any], bool] = {
+            offerings_task: skip_offerings,
+            docs_task: skip_docs,
+        }
+        pending: set[asyncio.Task[Any]] = set(skippable)
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_EXCEPTION)
+                for task in done:
+                    error = task.exception()
+                    if error is not None and not skippable[task]:
+                        raise error
+        finally:
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+
+        # Write offerings
         try:
-            offerings = await self.scrape_offerings()
+            offerings = offerings_task.result()
             csv_path = self.output_dir / "offerings.csv"
-            write_offerings_csv(offerings, csv_path)
-            logger.info(f"Wrote {len(offerings)} offerings to {csv_path}")
+            offerings_count = write_offerings_csv(offerings, csv_path)
+            logger.info(f"Wrote {offerings_count} offerings to {csv_path}")
         except Exception as e:
             if skip_offerings:
                 logger.warning(f"Offerings scrape failed (skipped): {e}")
             else:
                 raise
 
-        # Scrape docs
+        # Count docs
         try:
-            docs_count = await self.scrape_docs()
+            docs_count = docs_task.result()
         except Exception as e:
             if skip_docs:
                 logger.warning(f"Docs scrape failed (skipped): {e}")
@@ -258,7 +480,7 @@ class BaseScraper(ABC):
         # Finalize: create ZIP from local docs
         self.archive.finalize(keep_local=keep_local)
 
-        return csv_path, docs_count
+        return csv_path, offerings_count, docs_count
 
     # --- Q&A Generation Methods ---
 
@@ -284,11 +506,14 @@ class BaseScraper(ABC):
     async def check_for_changes(self) -> bool:
         """Check if content has changed since last scrape.
 
-        Uses ETag from changelog_url if available.
+        Sends a conditional HEAD (If-None-Match) to changelog_url if available,
+        remembering the current ETag so generate_qa can persist it without
+        another request.
 
         Returns:
             True if changes detected or no previous metadata exists.
         """
+        self._changelog_etag = None
         if not self.changelog_url:
             logger.debug(f"No changelog_url for {self.provider_name}, assuming changed")
             return True
@@ -296,26 +521,33 @@ class BaseScraper(ABC):
         metadata = self._load_metadata()
         stored_etag = metadata.get("changelog_etag")
 
+        # Conditional request: an unchanged changelog is answered with an empty 304
+        headers = {"If-None-Match": stored_etag} if stored_etag else {}
+
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.head(self.changelog_url)
-                current_etag = response.headers.get("etag")
+            response = await self.http.head(self.changelog_url, headers=headers)
+        except httpx.HTTPError as e:
+            logger.warning(f"Failed to check changelog: {e}, assuming changed")
+            return True
 
-                if not current_etag:
-                    logger.debug(f"No ETag from {self.changelog_url}, assuming changed")
-                    return True
+        if response.status_code == 304:
+            self._changelog_etag = response.headers.get("etag") or stored_etag
+            logger.info(f"No changes detected for {self.provider_name} (304 Not Modified)")
+            return False
 
-                if current_etag != stored_etag:
-                    logger.info(f"ETag changed for {self.provider_name}: {stored_etag} -> {current_etag}")
-                    return True
+        current_etag = self._changelog_etag = response.headers.get("etag")
 
-                logger.info(f"No changes detected for {self.provider_name} (ETag: {current_etag})")
-                return False
+        if not current_etag:
+            logger.debug(f"No ETag from {self.changelog_url}, assuming changed")
+            return True
 
-        except httpx.HTTPError as e:
-            logger.warning(f"Failed to check changelog: {e}, assuming changed")
+        if current_etag != stored_etag:
+            logger.info(f"ETag changed for {self.provider_name}: {stored_etag} -> {current_etag}")
             return True
 
+        logger.info(f"No changes detected for {self.provider_name} (ETag: {current_etag})")
+        return False
+
     async def fetch_github_docs(self, max_files: int = 30) -> str:
         """Fetch markdown docs from GitHub repository.
 
@@ -328,62 +560,84 @@ class BaseScraper(ABC):
         if not self.github_docs_repo:
             return ""
 
-        contents: list[str] = []
-        api_url = f"https://api.github.com/repos/{self.github_docs_repo}/contents/{self.github_docs_path}"
+        api_url = (
+            f"https://api.github.com/repos/{self.github_docs_repo}/contents/{self.github_docs_path}"
+        )
+        headers = {"Accept": "application/vnd.github+json"}
+        # Authenticated requests get 5000/h instead of the anonymous 60/h
+        if token := os.environ.get("GITHUB_TOKEN"):
+            headers["Authorization"] = f"Bearer {token}"
 
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            # List directory contents
-            try:
-                response = await client.get(api_url)
-                if response.status_code != 200:
-                    logger.warning(f"Failed to list GitHub docs: {response.status_code}")
-                    return ""
-
-                items = response.json()
-                if not isinstance(items, list):
-                    logger.warning(f"Unexpected GitHub API response: {type(items)}")
-                    return ""
-
-            except httpx.HTTPError as e:
-                logger.warning(f"GitHub API error: {e}")
+        # List directory contents
+        try:
+            response = await self.http.get(api_url, headers=headers)
+            if response.status_code != 200:
+                logger.warning(f"Failed to list GitHub docs: {response.status_code}")
+                return ""
+
+            items = response.json()
+            if not isinstance(items, list):
+                logger.warning(f"Unexpected GitHub API response: {type(items)}")
                 return ""
 
-            # Fetch markdown files (look for .md files or directories with 01.en.md)
-            fetched = 0
-            for item in items:
-                if fetched >= max_files:
-                    break
-
-                if item.get("type") == "dir":
-                    # Check for tutorial format: {name}/01.en.md
-                    md_url = f"https://raw.githubusercontent.com/{self.github_docs_repo}/master/{self.github_docs_path}/{item['name']}/01.en.md"
-                    try:
-                        md_response = await client.get(md_url)
-                        if md_response.status_code == 200:
-                            content = md_response.text
-                            if content.strip():
-                                contents.append(f"## Tutorial: {item['name']}\n\n{content[:4000]}")
-                                fetched += 1
-                                logger.debug(f"Fetched GitHub doc: {item['name']}")
-                    except httpx.HTTPError:
-                        pass
-
-                elif item.get("name", "").endswith(".md"):
-                    # Direct markdown file
-                    try:
-                        md_response = await client.get(item["download_url"])
-                        if md_response.status_code == 200:
-                            content = md_response.text
-                            if content.strip():
-                                contents.append(f"## Doc: {item['name']}\n\n{content[:4000]}")
-                                fetched += 1
-                    except httpx.HTTPError:
-                        pass
-
-            logger.info(f"Fetched {fetched} docs from GitHub repo {self.github_docs_repo}")
+        except httpx.HTTPError as e:
+            logger.warning(f"GitHub API error: {e}")
+            return ""
+
+        # Fetch markdown files (look for .md files or directories with 01.en.md).
+        # Fetch in concurrent batches of the files still needed, keeping listing
+        # order, so at most max_files docs are kept without fetching every item.
+        semaphore = asyncio.Semaphore(GITHUB_FETCH_CONCURRENCY)
+        pending = [
+            item
+            for item in items
+            if item.get("type") == "dir" or item.get("name", "").endswith(".md")
+        ]
+        contents: list[str] = []
+        while pending and len(contents) < max_files:
+            batch, pending = (
+                pending[: max_files - len(contents)],
+                pending[max_files - len(contents) :],
+            )
+            docs = await asyncio.gather(
+                *(self._fetch_github_doc(item, headers, semaphore) for item in batch)
+            )
+            contents.extend(doc for doc in docs if doc)
+
+        logger.info(f"Fetched {len(contents)} docs from GitHub repo {self.github_docs_repo}")
 
         return "\n\n---\n\n".join(contents)
 
+    async def _fetch_github_doc(
+        self,
+        item: dict[str, Any],
+        headers: dict[str, str],
+        semaphore: asyncio.Semaphore,
+    ) -> str | None:
+        """Fetch one markdown doc from a GitHub directory listing item.
+
+        Returns:
+            Formatted doc section, or None if missing, empty or failed.
+        """
+        if item.get("type") == "dir":
+            # Tutorial format: {name}/01.en.md
+            md_url = f"https://raw.githubusercontent.com/{self.github_docs_repo}/master/{self.github_docs_path}/{item['name']}/01.en.md"
+            heading = "Tutorial"
+        else:
+            md_url = item["download_url"]
+            heading = "Doc"
+
+        async with semaphore:
+            try:
+                md_response = await self.http.get(md_url, headers=headers)
+            except httpx.HTTPError:
+                return None
+
+        if md_response.status_code != 200 or not md_response.text.strip():
+            return None
+        logger.debug(f"Fetched GitHub doc: {item['name']}")
+        return f"## {heading}: {item['name']}\n\n{md_response.text[:4000]}"
+
     async def fetch_faq_content(self) -> str:
         """Fetch content from faq_urls and github_docs_repo for Q&A generation.
 
@@ -397,28 +651,49 @@ class BaseScraper(ABC):
         if github_content:
             contents.append(github_content)
 
-        # Fetch from FAQ URLs using Crawl4AI
+        # Fetch from FAQ URLs using Crawl4AI, concurrently but keeping faq_urls order
         if self.faq_urls:
-            config = create_crawl_config()
-            async with AsyncWebCrawler(config=DEFAULT_BROWSER_CONFIG) as crawler:
-                for url in self.faq_urls:
-                    try:
-                        logger.debug(f"Fetching FAQ content from {url}")
-                        result = await crawler.arun(url=url, config=config)
+            config = DEFAULT_CRAWL_CONFIG
+            semaphore = asyncio.BoundedSemaphore(self.initial_concurrency)
+            async with self._browser() as crawler:
+                pages = await asyncio.gather(
+                    *(
+                        self._fetch_faq_page(crawler, config, url, semaphore)
+                        for url in self.faq_urls
+                    )
+                )
+            contents.extend(page for page in pages if page)
 
-                        if not result.success:
-                            logger.warning(f"Failed to fetch {url}: {result.error_message}")
-                            continue
+        return "\n\n---\n\n".join(contents)
 
-                        # Prefer fit_markdown, fall back to raw
-                        content = result.markdown.fit_markdown or result.markdown.raw_markdown or ""
-                        if content.strip():
-                            contents.append(f"## Source: {url}\n\n{content}")
+    async def _fetch_faq_page(
+        self,
+        crawler: AsyncWebCrawler,
+        config: CrawlerRunConfig,
+        url: str,
+        semaphore: asyncio.BoundedSemaphore,
+    ) -> str | None:
+        """Crawl one FAQ page.
 
-                    except Exception as e:
-                        logger.warning(f"Error fetching {url}: {e}")
+        Returns:
+            Formatted page section, or None if failed or empty (logged).
+        """
+        try:
+            async with semaphore:
+                logger.debug(f"Fetching FAQ content from {url}")
+                result = await crawler.arun(url=url, config=config)
 
-        return "\n\n---\n\n".join(contents)
+            if not result.success:
+                logger.warning(f"Failed to fetch {url}: {result.error_message}")
+                return None
+
+            # Prefer fit_markdown, fall back to raw
+            content = result.markdown.fit_markdown or result.markdown.raw_markdown or ""
+            return f"## Source: {url}\n\n{content}" if content.strip() else None
+
+        except Exception as e:
+            logger.warning(f"Error fetching {url}: {e}")
+            return None
 
     async def generate_qa(
         self,
@@ -436,20 +711,21 @@ class BaseScraper(ABC):
         """
         from scraper.qa_generator import QAGenerator, QAGeneratorError
 
-        # Check for changes unless forced
-        if not force:
-            has_changes = await self.check_for_changes()
-            if not has_changes:
-                logger.info(f"Skipping Q&A generation for {self.provider_name} (no changes)")
-                return None
+        # Check for changes (also when forced, to learn the ETag to store afterwards)
+        has_changes = await self.check_for_changes()
+        if not force and not has_changes:
+            logger.info(f"Skipping Q&A generation for {self.provider_name} (no changes)")
+            return None
 
         # Fetch FAQ content
         docs_content = await self.fetch_faq_content()
 
-        # Generate Q&A
+        # Generate Q&A. The Anthropic client is synchronous: run it in a worker
+        # thread so providers scraping concurrently keep their event loop.
         try:
             generator = QAGenerator()
-            qa_pairs = generator.generate_qa(
+            qa_pairs = await asyncio.to_thread(
+                generator.generate_qa,
                 provider_name=self.provider_name,
                 provider_website=self.provider_website,
                 offerings=offerings,
@@ -465,17 +741,10 @@ class BaseScraper(ABC):
         qa_path.write_text(json.dumps(qa_pairs, indent=2))
         logger.info(f"Wrote {len(qa_pairs)} Q&A pairs to {qa_path}")
 
-        # Update metadata with current ETag
-        if self.changelog_url:
-            try:
-                async with httpx.AsyncClient(timeout=30.0) as client:
-                    response = await client.head(self.changelog_url)
-                    etag = response.headers.get("etag")
-                    if etag:
-                        metadata = self._load_metadata()
-                        metadata["changelog_etag"] = etag
-                        self._save_metadata(metadata)
-            except httpx.HTTPError:
-                pass
+        # Update metadata with the ETag seen before fetching content
+        if self._changelog_etag:
+            metadata = self._load_metadata()
+            metadata["changelog_etag"] = self._changelog_etag
+            self._save_metadata(metadata)
 
         return qa_path
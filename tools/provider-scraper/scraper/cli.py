@@ -1,23 +1,33 @@
 """CLI for running provider scrapers."""
 
 import asyncio
+import importlib
 import logging
 import sys
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-from scraper.providers.contabo import ContaboScraper
-from scraper.providers.hetzner import HetznerScraper
-from scraper.providers.ovh import OvhScraper
+if TYPE_CHECKING:
+    from scraper.base import BaseScraper
+    from scraper.crawler import SharedCrawler
 
+# Provider name -> "module:class", imported only when that provider runs so
+# `help` and `setup` don't load Crawl4AI/Playwright
 SCRAPERS = {
-    "hetzner": HetznerScraper,
-    "contabo": ContaboScraper,
-    "ovh": OvhScraper,
+    "hetzner": "scraper.providers.hetzner:HetznerScraper",
+    "contabo": "scraper.providers.contabo:ContaboScraper",
+    "ovh": "scraper.providers.ovh:OvhScraper",
 }
 
 logger = logging.getLogger(__name__)
 
 
+def load_scraper(name: str) -> "type[BaseScraper]":
+    """Import and return the scraper class registered for a provider."""
+    module_name, class_name = SCRAPERS[name].split(":")
+    return getattr(importlib.import_module(module_name), class_name)
+
+
 async def run_scraper(
     name: str,
     output_base: Path,
@@ -26,6 +36,7 @@ async def run_scraper(
     keep_local: bool = False,
     generate_qa: bool = False,
     force_qa: bool = False,
+    crawler: "SharedCrawler | None" = None,
 ) -> tuple[int, int, int, bool]:
     """Run single scraper and return counts.
 
@@ -37,57 +48,54 @@ async def run_scraper(
         keep_local: If True, keep local docs/ directory for troubleshooting
         generate_qa: If True, generate Q&A content using LLM
         force_qa: If True, force Q&A regeneration even if no changes detected
+        crawler: Browser shared across providers (each scraper launches its own if None)
 
     Returns:
         Tuple of (offerings_count, docs_count, qa_count, success)
     """
     print(f"\n=== Scraping {name} ===")
-    scraper_cls = SCRAPERS[name]
+    scraper_cls = load_scraper(name)
     output_dir = output_base / name
 
     try:
-        scraper = scraper_cls(output_dir=output_dir)
-        csv_path, docs_count = await scraper.run(
-            skip_offerings=skip_offerings,
-            skip_docs=skip_docs,
-            keep_local=keep_local,
-        )
-
-        # Count offerings from CSV
-        offerings_count = 0
-        offerings = []
-        if csv_path and csv_path.exists():
-            with csv_path.open() as f:
-                offerings_count = sum(1 for _ in f) - 1  # subtract header
+        scraper = scraper_cls(output_dir=output_dir, crawler=crawler)
+        async with scraper:
+            csv_path, offerings_count, docs_count = await scraper.run(
+                skip_offerings=skip_offerings,
+                skip_docs=skip_docs,
+                keep_local=keep_local,
+            )
 
             # Re-scrape offerings for Q&A generation (already cached by API)
-            if generate_qa:
+            offerings = []
+            if generate_qa and csv_path:
                 offerings = await scraper.scrape_offerings()
 
-        print(f"  Offerings: {offerings_count}")
-        print(f"  Docs: {docs_count} new/changed")
-
-        # Generate Q&A if requested
-        qa_count = 0
-        if generate_qa and offerings:
-            try:
-                qa_path = await scraper.generate_qa(offerings, force=force_qa)
-                if qa_path and qa_path.exists():
-                    import json
-                    qa_data = json.loads(qa_path.read_text())
-                    qa_count = len(qa_data)
-                    print(f"  Q&A: {qa_count} pairs generated")
-                else:
-                    print("  Q&A: skipped (no changes)")
-            except Exception as e:
-                logger.warning(f"Q&A generation failed: {e}")
-                print(f"  Q&A: failed ({e})")
-
-        return offerings_count, docs_count, qa_count, True
+            print(f"  [{name}] Offerings: {offerings_count}")
+            print(f"  [{name}] Docs: {docs_count} new/changed")
+
+            # Generate Q&A if requested
+            qa_count = 0
+            if generate_qa and offerings:
+                try:
+                    qa_path = await scraper.generate_qa(offerings, force=force_qa)
+                    if qa_path and qa_path.exists():
+                        import json
+
+                        qa_data = json.loads(qa_path.read_text())
+                        qa_count = len(qa_data)
+                        print(f"  [{name}] Q&A: {qa_count} pairs generated")
+                    else:
+                        print(f"  [{name}] Q&A: skipped (no changes)")
+                except Exception as e:
+                    logger.warning(f"Q&A generation failed: {e}")
+                    print(f"  [{name}] Q&A: failed ({e})")
+
+            return offerings_count, docs_count, qa_count, True
 
     except Exception as e:
         logger.error(f"Failed to scrape {name}: {e}")
-        print(f"  ERROR: {e}")
+        print(f"  [{name}] ERROR: {e}")
         return 0, 0, 0, False
 
 
@@ -211,16 +219,37 @@ async def main() -> None:
             print("Run with -h for help.")
             sys.exit(1)
 
-    # Run scrapers
+    # Imported here so help/setup don't load Crawl4AI
+    from scraper.crawler import SharedCrawler
+
+    # Run scrapers concurrently: providers share no hosts or output files, and one
+    # browser (launched on first use) serves them all.
+    # (run_scraper reports failures in its result instead of raising)
+    async with SharedCrawler() as crawler:
+        results = await asyncio.gather(
+            *(
+                run_scraper(
+                    provider,
+                    output_base,
+                    skip_offerings,
+                    skip_docs,
+                    keep_local,
+                    generate_qa,
+                    force_qa,
+                    crawler=crawler,
+                )
+                for provider in providers
+            )
+        )
+
     total_offerings = 0
     total_docs = 0
     total_qa = 0
     failed_providers = []
 
-    for provider in providers:
-        offerings_count, docs_count, qa_count, success = await run_scraper(
-            provider, output_base, skip_offerings, skip_docs, keep_local, generate_qa, force_qa
-        )
+    for provider, (offerings_count, docs_count, qa_count, success) in zip(
+        providers, results, strict=True
+    ):
         total_offerings += offerings_count
         total_docs += docs_count
         total_qa += qa_count
@@ -0,0 +1,50 @@
+"""Adaptive concurrency limiting for crawls (TCP-style AIMD)."""
+
+import asyncio
+from types import TracebackType
+
+
+class AIMDLimiter:
+    """Async concurrency limit that adapts to how much load a provider tolerates.
+
+    Grows additively (about +1 slot per full window of successes) and halves on
+    overload, like TCP congestion control. Use as ``async with limiter:`` around
+    each request and report the outcome with ``record()`` before leaving the block.
+    """
+
+    def __init__(self, initial: int = 4, minimum: int = 1, maximum: int = 32) -> None:
+        """Initialize with a starting limit, clamped to [minimum, maximum]."""
+        if not 1 <= minimum <= maximum:
+            raise ValueError(f"Invalid limiter bounds: minimum={minimum}, maximum={maximum}")
+        self.minimum = minimum
+        self.maximum = maximum
+        self._limit = float(min(max(initial, minimum), maximum))
+        self._in_flight = 0
+        self._cond = asyncio.Condition()
+
+    @property
+    def limit(self) -> int:
+        """Current number of requests allowed in flight."""
+        return int(self._limit)
+
+    def record(self, overloaded: bool) -> None:
+        """Adjust the limit after a request: halve on overload, else grow by 1/limit."""
+        if overloaded:
+            self._limit = max(float(self.minimum), self._limit / 2)
+        else:
+            self._limit = min(float(self.maximum), self._limit + 1 / self._limit)
+
+    async def __aenter__(self) -> None:
+        async with self._cond:
+            await self._cond.wait_for(lambda: self._in_flight < self.limit)
+            self._in_flight += 1
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        async with self._cond:
+            self._in_flight -= 1
+            self._cond.notify_all()
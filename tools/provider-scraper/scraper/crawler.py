@@ -1,6 +1,11 @@
 """Core crawler module wrapping Crawl4AI with project-specific defaults."""
 
-from crawl4ai import BrowserConfig, CrawlerRunConfig, CacheMode
+import asyncio
+import re
+from types import TracebackType
+from typing import Self
+
+from crawl4ai import AsyncWebCrawler, BrowserConfig, CrawlerRunConfig, CacheMode
 from crawl4ai.content_filter_strategy import PruningContentFilter
 from crawl4ai.markdown_generation_strategy import DefaultMarkdownGenerator
 
@@ -14,6 +19,54 @@ DEFAULT_BROWSER_CONFIG = BrowserConfig(
     verbose=False,
 )
 
+# Crawl error messages meaning the site is rate limiting us. A bare "rate"
+# would also match words like "generate" or "separate".
+RATE_LIMIT_RE = re.compile(r"\b429\b|rate[ -]?limit|too many requests|throttl", re.IGNORECASE)
+
+
+def is_rate_limited(error_message: str | None) -> bool:
+    """Check whether a crawl error message reports rate limiting (HTTP 429 or similar)."""
+    return bool(error_message and RATE_LIMIT_RE.search(error_message))
+
+
+class SharedCrawler:
+    """One AsyncWebCrawler (browser) shared by several scrapers in a run.
+
+    The browser is launched on first use, so a run where every page is
+    unchanged never starts it. Use as ``async with SharedCrawler() as shared:``
+    and ``crawler = await shared.get()``.
+    """
+
+    def __init__(self) -> None:
+        self._crawler: AsyncWebCrawler | None = None
+        self._lock = asyncio.Lock()
+
+    async def get(self) -> AsyncWebCrawler:
+        """Return the shared crawler, launching the browser if needed."""
+        async with self._lock:
+            if self._crawler is None:
+                crawler = AsyncWebCrawler(config=DEFAULT_BROWSER_CONFIG)
+                await crawler.start()
+                self._crawler = crawler
+        return self._crawler
+
+    async def close(self) -> None:
+        """Close the browser if it was launched."""
+        if self._crawler is not None:
+            await self._crawler.close()
+            self._crawler = None
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        await self.close()
+
 
 def create_markdown_generator(
     threshold: float = DEFAULT_PRUNING_THRESHOLD,
@@ -69,3 +122,9 @@ def create_crawl_config(
         markdown_generator=markdown_generator,
         verbose=False,
     )
+
+
+# Default-path configs, built once per process and shared by every crawl
+# (use the factories above for custom overrides)
+DEFAULT_MARKDOWN_GENERATOR = create_markdown_generator()
+DEFAULT_CRAWL_CONFIG = create_crawl_config(markdown_generator=DEFAULT_MARKDOWN_GENERATOR)
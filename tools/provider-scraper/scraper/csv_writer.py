@@ -1,8 +1,11 @@
 """CSV writer matching the API import schema exactly."""
 
 import csv
+import operator
+from collections.abc import Callable
 from io import StringIO
 from pathlib import Path
+from typing import Any, TextIO
 
 from scraper.models import Offering
 
@@ -51,42 +54,71 @@ CSV_HEADERS = [
 ]
 
 
+def _format_none(value: None) -> str:
+    return ""
+
+
+def _format_bool(value: bool) -> str:
+    return "true" if value else "false"
+
+
+def _format_float(value: float) -> str:
+    # Avoid scientific notation, remove trailing zeros
+    int_val = int(value)
+    if value == float(int_val):
+        return str(int_val)
+    return f"{value:.2f}".rstrip("0").rstrip(".")
+
+
+# Formatter per exact value type (one dict lookup instead of an isinstance chain;
+# exact types also keep bool, an int subclass, apart from int). Others use str().
+_FORMATTERS: dict[type, Callable[[Any], str]] = {
+    type(None): _format_none,
+    bool: _format_bool,
+    float: _format_float,
+}
+
+
 def _format_value(value: object) -> str:
     """Format a value for CSV output."""
-    if value is None:
-        return ""
-    if isinstance(value, bool):
-        return "true" if value else "false"
-    if isinstance(value, float):
-        # Avoid scientific notation, remove trailing zeros
-        int_val = int(value)
-        if value == float(int_val):
-            return str(int_val)
-        return f"{value:.2f}".rstrip("0").rstrip(".")
-    return str(value)
+    return _FORMATTERS.get(type(value), str)(value)
+
+
+# Reads every CSV column off an Offering in header order, in one C-level call
+# (skips model_dump's per-row dict build; every header is an Offering field)
+_get_columns = operator.attrgetter(*CSV_HEADERS)
 
 
 def offering_to_row(offering: Offering) -> list[str]:
     """Convert an Offering to a CSV row in the correct column order."""
-    data = offering.model_dump()
-    return [_format_value(data.get(header)) for header in CSV_HEADERS]
+    return [_format_value(value) for value in _get_columns(offering)]
+
+
+def _write_rows(f: TextIO, offerings: list[Offering]) -> int:
+    """Write the header and one row per offering to an open text stream.
+
+    Returns:
+        Number of offering rows written (excluding the header).
+    """
+    writer = csv.writer(f)
+    writer.writerow(CSV_HEADERS)
+    writer.writerows(offering_to_row(offering) for offering in offerings)
+    return len(offerings)
 
 
-def write_offerings_csv(offerings: list[Offering], path: Path) -> None:
-    """Write offerings to a CSV file matching the API import schema."""
+def write_offerings_csv(offerings: list[Offering], path: Path) -> int:
+    """Write offerings to a CSV file matching the API import schema.
+
+    Returns:
+        Number of offering rows written (excluding the header).
+    """
     path.parent.mkdir(parents=True, exist_ok=True)
     with path.open("w", newline="", encoding="utf-8") as f:
-        writer = csv.writer(f)
-        writer.writerow(CSV_HEADERS)
-        for offering in offerings:
-            writer.writerow(offering_to_row(offering))
+        return _write_rows(f, offerings)
 
 
 def offerings_to_csv_string(offerings: list[Offering]) -> str:
     """Convert offerings to a CSV string for testing."""
     output = StringIO()
-    writer = csv.writer(output)
-    writer.writerow(CSV_HEADERS)
-    for offering in offerings:
-        writer.writerow(offering_to_row(offering))
+    _write_rows(output, offerings)
     return output.getvalue()
@@ -1,5 +1,6 @@
 """URL discovery via sitemap parsing and deep crawl fallback."""
 
+import asyncio
 import logging
 import xml.etree.ElementTree as ET
 from urllib.parse import urljoin
@@ -8,7 +9,8 @@ import httpx
 from crawl4ai import AsyncWebCrawler
 from crawl4ai.deep_crawling import BFSDeepCrawlStrategy
 
-from scraper.crawler import DEFAULT_BROWSER_CONFIG
+from scraper.crawler import DEFAULT_BROWSER_CONFIG, is_rate_limited
+from scraper.storage import SitemapCache
 
 logger = logging.getLogger(__name__)
 
@@ -25,15 +27,67 @@ SITEMAP_PATHS = [
     "/robots.txt",  # Parse robots.txt for sitemap location
 ]
 
+# Child sitemaps of an index fetched at once (they share the client's connections)
+CHILD_SITEMAP_CONCURRENCY = 10
 
-def parse_sitemap_xml(xml_content: str) -> list[str]:
+
+class SitemapStream:
+    """Incremental sitemap parser that keeps memory flat on huge sitemaps.
+
+    Feed raw chunks as they arrive; each call returns the <loc> URLs of the
+    <url>/<sitemap> entries completed so far. Parsed entries are cleared right
+    away, so neither the document nor its tree is ever held in full.
+
+    Attributes:
+        is_index: True once the root element is known to be <sitemapindex>.
+
+    Raises:
+        ET.ParseError: From feed() or close() if the XML is malformed.
+    """
+
+    def __init__(self) -> None:
+        self._parser: ET.XMLPullParser[ET.Element] = ET.XMLPullParser(events=("start", "end"))
+        self._root: ET.Element | None = None
+        self.is_index = False
+
+    def feed(self, data: str | bytes) -> list[str]:
+        """Parse another chunk and return the URLs it completed."""
+        self._parser.feed(data)
+        return self._drain()
+
+    def close(self) -> list[str]:
+        """Finish parsing and return any remaining URLs."""
+        self._parser.close()
+        return self._drain()
+
+    def _drain(self) -> list[str]:
+        urls: list[str] = []
+        for item in self._parser.read_events():
+            # Only "start"/"end" events are requested, and both carry an Element
+            event, elem = item[0], item[-1]
+            assert isinstance(elem, ET.Element)
+            if self._root is None:
+                self._root = elem
+                self.is_index = elem.tag.rpartition("}")[2] == "sitemapindex"
+            # Handle both <sitemapindex><sitemap><loc> and <urlset><url><loc>
+            if event == "end" and elem.tag.rpartition("}")[2] in ("url", "sitemap"):
+                loc = elem.find("{*}loc")
+                if loc is not None and loc.text and loc.text.strip():
+                    urls.append(loc.text.strip())
+                elem.clear()
+                self._root.clear()
+        return urls
+
+
+def parse_sitemap_xml(xml_content: str | bytes) -> list[str]:
     """Parse sitemap XML and extract URLs.
 
     Handles both sitemap index format (with <sitemap> tags) and
     urlset format (with <url> tags).
 
     Args:
-        xml_content: Raw XML content from sitemap.
+        xml_content: Raw XML content from sitemap. Prefer the undecoded
+            response bytes; the parser honours the XML encoding declaration.
 
     Returns:
         List of URLs found in sitemap. Empty list if XML is invalid or empty.
@@ -41,27 +95,18 @@ def parse_sitemap_xml(xml_content: str) -> list[str]:
     if not xml_content:
         return []
 
+    stream = SitemapStream()
     try:
-        root = ET.fromstring(xml_content)
+        return stream.feed(xml_content) + stream.close()
     except ET.ParseError:
         return []
 
-    urls = []
-
-    # Handle sitemap index format: <sitemapindex><sitemap><loc>
-    for sitemap in root.findall(".//{*}sitemap/{*}loc"):
-        if sitemap.text and sitemap.text.strip():
-            urls.append(sitemap.text.strip())
 
-    # Handle urlset format: <urlset><url><loc>
-    for url in root.findall(".//{*}url/{*}loc"):
-        if url.text and url.text.strip():
-            urls.append(url.text.strip())
-
-    return urls
-
-
-async def discover_sitemap(base_url: str) -> list[str] | None:
+async def discover_sitemap(
+    base_url: str,
+    client: httpx.AsyncClient | None = None,
+    cache: SitemapCache | None = None,
+) -> list[str] | None:
     """Try to find and parse sitemap for a website.
 
     Tries common sitemap locations in order. If sitemap index is found,
@@ -69,6 +114,12 @@ async def discover_sitemap(base_url: str) -> list[str] | None:
 
     Args:
         base_url: Base URL of the website (e.g., "https://example.com").
+        client: Pooled HTTP client to reuse (e.g. BaseScraper.http). If omitted,
+            a client is opened for this call only.
+        cache: Sitemap cache for conditional requests; unchanged sitemaps (304)
+            are served from it. It also orders the probes by the path that
+            worked last time, and skips probing a site recently found to have
+            no sitemap. Saved before returning.
 
     Returns:
         List of URLs from sitemap(s), or None if no sitemap found.
@@ -76,152 +127,228 @@ async def discover_sitemap(base_url: str) -> list[str] | None:
     Raises:
         DiscoveryError: If rate limited (429) or server error (5xx).
     """
-    async with httpx.AsyncClient(timeout=30.0, follow_redirects=True) as client:
-        for path in SITEMAP_PATHS:
-            sitemap_url = urljoin(base_url, path)
-
-            # Fetch sitemap content
-            content, status = await _fetch_sitemap_content(client, sitemap_url, path)
-
-            # Check for rate limiting or server errors
-            if status == 429:
-                raise DiscoveryError(f"Rate limited while fetching sitemap from {base_url}")
-            if status and status >= 500:
-                raise DiscoveryError(f"Server error ({status}) while fetching sitemap from {base_url}")
-
-            if not content:
-                continue
-
-            # Parse URLs from sitemap
-            urls = parse_sitemap_xml(content)
-            if not urls:
-                logger.debug(f"No URLs found in {sitemap_url}")
-                continue
-
-            # Check if this is a sitemap index (all URLs are .xml files)
-            if all(url.endswith(".xml") for url in urls):
-                logger.debug(f"Found sitemap index at {sitemap_url}, fetching {len(urls)} child sitemaps")
-                return await _fetch_child_sitemaps(client, urls)
-
-            logger.info(f"Found {len(urls)} URLs in sitemap: {sitemap_url}")
-            return urls
+    try:
+        if client is None:
+            async with httpx.AsyncClient(
+                http2=True, timeout=30.0, follow_redirects=True
+            ) as own_client:
+                return await _discover_sitemap(own_client, base_url, cache)
+        return await _discover_sitemap(client, base_url, cache)
+    finally:
+        if cache is not None:
+            cache.save()
+
+
+async def _discover_sitemap(
+    client: httpx.AsyncClient, base_url: str, cache: SitemapCache | None
+) -> list[str] | None:
+    """Probe SITEMAP_PATHS on base_url with the given client (see discover_sitemap)."""
+    paths = SITEMAP_PATHS
+    if cache is not None:
+        if cache.is_known_missing(base_url):
+            logger.info(f"No sitemap at {base_url} on the last probe, skipping sitemap discovery")
+            return None
+        # Try the path that worked last time first
+        hit_path = cache.sitemap_path(base_url)
+        if hit_path in SITEMAP_PATHS:
+            paths = [hit_path] + [path for path in SITEMAP_PATHS if path != hit_path]
+
+    for path in paths:
+        sitemap_url = urljoin(base_url, path)
+
+        # Fetch and parse sitemap
+        urls, status, is_index = await _fetch_sitemap_urls(client, sitemap_url, path, cache)
+
+        # Check for rate limiting or server errors
+        if status == 429:
+            raise DiscoveryError(f"Rate limited while fetching sitemap from {base_url}")
+        if status and status >= 500:
+            raise DiscoveryError(f"Server error ({status}) while fetching sitemap from {base_url}")
+
+        if not urls:
+            logger.debug(f"No URLs found in {sitemap_url}")
+            continue
+
+        if cache is not None:
+            cache.record_sitemap_path(base_url, path)
+
+        if is_index:
+            logger.debug(
+                f"Found sitemap index at {sitemap_url}, fetching {len(urls)} child sitemaps"
+            )
+            return await _fetch_child_sitemaps(client, urls, cache)
+
+        logger.info(f"Found {len(urls)} URLs in sitemap: {sitemap_url}")
+        return urls
 
     logger.warning(f"No sitemap found for {base_url}")
+    if cache is not None:
+        cache.record_sitemap_path(base_url, None)
     return None
 
 
-async def _fetch_sitemap_content(
-    client: httpx.AsyncClient, sitemap_url: str, path: str
-) -> tuple[str | None, int | None]:
-    """Fetch sitemap content from URL.
+def _is_rate_limit_page(head: bytes) -> bool:
+    """Check the start of a response body for a rate limit error page."""
+    return b"429" in head or b"Too Many Requests" in head
+
+
+async def _stream_sitemap(
+    client: httpx.AsyncClient, sitemap_url: str, cache: SitemapCache | None = None
+) -> tuple[list[str] | None, int | None, bool]:
+    """Download a sitemap and parse it while it streams in.
 
     Args:
         client: HTTP client to use for fetching.
         sitemap_url: Full URL to sitemap.
-        path: Original path (used for robots.txt detection).
+        cache: Sitemap cache; if it has validators for the URL the request is
+            conditional, and a 304 returns the cached URLs.
 
     Returns:
-        Tuple of (content, status_code). Content is None if fetch failed.
+        Tuple of (urls, status_code, is_index). URLs are None if the fetch
+        failed and empty if the body is not a valid sitemap; is_index tells a
+        <sitemapindex> (URLs are child sitemaps) from a <urlset>.
     """
-    try:
-        response = await client.get(sitemap_url)
-
-        # Return status for rate limit/error detection
-        if response.status_code == 429:
-            return None, 429
-        if response.status_code >= 500:
-            return None, response.status_code
+    cached = cache.get(sitemap_url) if cache else None
+    headers = cached.conditional_headers() if cached else None
+    async with client.stream("GET", sitemap_url, headers=headers) as response:
+        if response.status_code == 304 and cached:
+            logger.debug(
+                f"Sitemap not modified, using {len(cached.urls)} cached URLs: {sitemap_url}"
+            )
+            return cached.urls, 200, cached.is_index
         if response.status_code != 200:
             logger.debug(f"Sitemap not found at {sitemap_url} (status: {response.status_code})")
-            return None, response.status_code
+            return None, response.status_code, False
 
-        content = response.text
+        stream = SitemapStream()
+        urls: list[str] = []
+        head = b""
+        try:
+            async for chunk in response.aiter_bytes():
+                # Check if we got an error page instead of XML
+                if len(head) < 500:
+                    head += chunk[: 500 - len(head)]
+                    if _is_rate_limit_page(head):
+                        logger.warning(f"Rate limit page returned for {sitemap_url}")
+                        return None, 429, False
+                urls.extend(stream.feed(chunk))
+            urls.extend(stream.close())
+        except ET.ParseError:
+            logger.debug(f"Invalid sitemap XML at {sitemap_url}")
+            return [], 200, False
+
+        if cache is not None:
+            cache.put(
+                sitemap_url,
+                response.headers.get("etag"),
+                response.headers.get("last-modified"),
+                urls,
+                stream.is_index,
+            )
+        return urls, 200, stream.is_index
+
+
+async def _fetch_sitemap_urls(
+    client: httpx.AsyncClient, sitemap_url: str, path: str, cache: SitemapCache | None = None
+) -> tuple[list[str] | None, int | None, bool]:
+    """Fetch and parse the sitemap at a URL.
 
-        # Check if we got an error page instead of XML
-        if "429" in content[:500] or "Too Many Requests" in content[:500]:
-            logger.warning(f"Rate limit page returned for {sitemap_url}")
-            return None, 429
+    Args:
+        client: HTTP client to use for fetching.
+        sitemap_url: Full URL to sitemap.
+        path: Original path (used for robots.txt detection).
+        cache: Sitemap cache for conditional requests.
 
+    Returns:
+        Tuple of (urls, status_code, is_index). URLs are None if fetch failed.
+    """
+    try:
         # Special handling for robots.txt
         if path == "/robots.txt":
-            sitemap_urls = _extract_sitemaps_from_robots(content)
+            response = await client.get(sitemap_url)
+            if response.status_code != 200:
+                logger.debug(
+                    f"robots.txt not found at {sitemap_url} (status: {response.status_code})"
+                )
+                return None, response.status_code, False
+            if _is_rate_limit_page(response.content[:500]):
+                logger.warning(f"Rate limit page returned for {sitemap_url}")
+                return None, 429, False
+
+            sitemap_urls = _extract_sitemaps_from_robots(response.text)
             if not sitemap_urls:
                 logger.debug(f"No sitemap URLs found in robots.txt at {sitemap_url}")
-                return None, None
+                return None, None, False
 
             # Fetch first sitemap from robots.txt
-            first_sitemap_url = sitemap_urls[0]
-            logger.debug(f"Found sitemap URL in robots.txt: {first_sitemap_url}")
-            response = await client.get(first_sitemap_url)
-
-            if response.status_code == 429:
-                return None, 429
-            if response.status_code >= 500:
-                return None, response.status_code
-            if response.status_code != 200:
-                logger.warning(f"Failed to fetch sitemap from robots.txt: {first_sitemap_url} (status: {response.status_code})")
-                return None, response.status_code
-
-            content = response.text
+            sitemap_url = sitemap_urls[0]
+            logger.debug(f"Found sitemap URL in robots.txt: {sitemap_url}")
 
-            # Check for rate limit in response body
-            if "429" in content[:500] or "Too Many Requests" in content[:500]:
-                return None, 429
-
-        return content, 200
+        return await _stream_sitemap(client, sitemap_url, cache)
 
     except httpx.HTTPError as e:
         logger.debug(f"HTTP error fetching {sitemap_url}: {e}")
-        return None, None
+        return None, None, False
     except Exception as e:
         logger.warning(f"Unexpected error fetching {sitemap_url}: {e}")
-        return None, None
+        return None, None, False
 
 
 async def _fetch_child_sitemaps(
-    client: httpx.AsyncClient, sitemap_urls: list[str]
+    client: httpx.AsyncClient, sitemap_urls: list[str], cache: SitemapCache | None = None
 ) -> list[str] | None:
-    """Fetch and parse child sitemaps from a sitemap index.
+    """Fetch and parse child sitemaps from a sitemap index, concurrently.
 
     Args:
         client: HTTP client to use for fetching.
         sitemap_urls: List of child sitemap URLs to fetch.
+        cache: Sitemap cache for conditional requests.
 
     Returns:
-        Combined list of URLs from all child sitemaps, or None if all fetches failed.
+        Combined list of URLs from all child sitemaps (in index order), or None
+        if all fetches failed.
 
     Raises:
         DiscoveryError: If rate limited.
     """
-    all_urls = []
-
-    for child_sitemap_url in sitemap_urls:
-        try:
-            response = await client.get(child_sitemap_url)
-
-            if response.status_code == 429:
-                raise DiscoveryError(f"Rate limited while fetching child sitemap: {child_sitemap_url}")
-
-            if response.status_code != 200:
-                logger.warning(f"Failed to fetch child sitemap: {child_sitemap_url} (status: {response.status_code})")
-                continue
+    semaphore = asyncio.Semaphore(CHILD_SITEMAP_CONCURRENCY)
+    results = await asyncio.gather(
+        *(_fetch_child_sitemap(client, url, semaphore, cache) for url in sitemap_urls)
+    )
+    all_urls = [url for child_urls in results if child_urls for url in child_urls]
+    return all_urls if all_urls else None
 
-            # Check for rate limit in body
-            if "429" in response.text[:500] or "Too Many Requests" in response.text[:500]:
-                raise DiscoveryError(f"Rate limited while fetching child sitemap: {child_sitemap_url}")
 
-            child_urls = parse_sitemap_xml(response.text)
-            all_urls.extend(child_urls)
-            logger.debug(f"Fetched {len(child_urls)} URLs from {child_sitemap_url}")
+async def _fetch_child_sitemap(
+    client: httpx.AsyncClient,
+    child_sitemap_url: str,
+    semaphore: asyncio.Semaphore,
+    cache: SitemapCache | None,
+) -> list[str] | None:
+    """Fetch and parse one child sitemap, returning None if it failed.
 
-        except DiscoveryError:
-            raise
+    Raises:
+        DiscoveryError: If rate limited.
+    """
+    async with semaphore:
+        try:
+            child_urls, status, _ = await _stream_sitemap(client, child_sitemap_url, cache)
         except httpx.HTTPError as e:
             logger.warning(f"HTTP error fetching child sitemap {child_sitemap_url}: {e}")
+            return None
         except Exception as e:
             logger.error(f"Unexpected error fetching child sitemap {child_sitemap_url}: {e}")
+            return None
 
-    return all_urls if all_urls else None
+    if status == 429:
+        raise DiscoveryError(f"Rate limited while fetching child sitemap: {child_sitemap_url}")
+
+    if child_urls is None:
+        logger.warning(f"Failed to fetch child sitemap: {child_sitemap_url} (status: {status})")
+        return None
+
+    logger.debug(f"Fetched {len(child_urls)} URLs from {child_sitemap_url}")
+    return child_urls
 
 
 def _extract_sitemaps_from_robots(robots_content: str) -> list[str]:
@@ -242,9 +369,7 @@ def _extract_sitemaps_from_robots(robots_content: str) -> list[str]:
     return sitemaps
 
 
-async def discover_via_crawl(
-    base_url: str, max_depth: int = 2, max_pages: int = 50
-) -> list[str]:
+async def discover_via_crawl(base_url: str, max_depth: int = 2, max_pages: int = 50) -> list[str]:
     """Discover URLs via deep crawl using BFS strategy.
 
     Fallback method when sitemap is not available. Uses Crawl4AI's
@@ -285,9 +410,8 @@ async def discover_via_crawl(
 
     # Check for errors in results
     for result in results:
-        if result.error_message:
-            if "429" in result.error_message or "rate" in result.error_message.lower():
-                raise DiscoveryError(f"Rate limited during deep crawl of {base_url}")
+        if is_rate_limited(result.error_message):
+            raise DiscoveryError(f"Rate limited during deep crawl of {base_url}")
 
     # Extract URLs from results
     urls = []
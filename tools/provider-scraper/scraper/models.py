@@ -1,11 +1,14 @@
 """Offering model matching the API CSV import schema."""
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class Offering(BaseModel):
     """Provider offering matching the 41-field CSV schema for import_offerings_csv."""
 
+    # Immutable once scraped (hashable, safe to share), and misspelled fields fail loudly
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     # Required fields
     offering_id: str = Field(description="Unique ID (provider SKU or generated)")
     offer_name: str = Field(description="Product name")
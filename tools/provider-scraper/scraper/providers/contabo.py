@@ -36,15 +36,21 @@ class ContaboScraper(BaseScraper):
         {"code": "uk-lon-1", "city": "London", "country": "GB"},
     ]
 
+    # Patterns matched against every plan card, compiled once
+    PRICE_HINT_RE = re.compile(r"€\s*\d+[.,]\d{2}")
+    PRICE_RE = re.compile(r"€?\s*(\d+)[.,](\d{2})")
+    VCPU_RE = re.compile(r"(\d+)\s*(?:vCPU|CPU|Core)", re.I)
+    RAM_RE = re.compile(r"(\d+)\s*GB\s*(?:RAM|Memory)", re.I)
+    STORAGE_RE = re.compile(r"(\d+)\s*GB\s*(?:SSD|NVMe|Storage)", re.I)
+
     async def scrape_offerings(self) -> list[Offering]:
         """Scrape offerings from Contabo website.
 
         Raises:
             ContaboScrapeError: If web scraping fails.
         """
-        async with httpx.AsyncClient(timeout=30.0, follow_redirects=True) as client:
-            vps_plans = await self._scrape_plans(client, self.VPS_URL, "compute")
-            vds_plans = await self._scrape_plans(client, self.VDS_URL, "dedicated")
+        vps_plans = await self._scrape_plans(self.http, self.VPS_URL, "compute")
+        vds_plans = await self._scrape_plans(self.http, self.VDS_URL, "dedicated")
 
         all_plans = vps_plans + vds_plans
         if not all_plans:
@@ -61,11 +67,10 @@ class ContaboScraper(BaseScraper):
         if response.status_code == 429:
             raise ContaboScrapeError(f"Rate limited by Contabo - try again later ({url})")
         if response.status_code != 200:
-            raise ContaboScrapeError(
-                f"Failed to fetch {url}: HTTP {response.status_code}"
-            )
+            raise ContaboScrapeError(f"Failed to fetch {url}: HTTP {response.status_code}")
 
-        soup = BeautifulSoup(response.text, "html.parser")
+        # lxml (C parser) is several times faster than html.parser
+        soup = BeautifulSoup(response.text, "lxml")
         plans = []
 
         # Look for pricing cards - Contabo uses various class patterns
@@ -74,7 +79,7 @@ class ContaboScraper(BaseScraper):
 
         if not plan_cards:
             # Try alternative: look for price elements
-            price_elements = soup.find_all(string=re.compile(r"€\s*\d+[.,]\d{2}"))
+            price_elements = soup.find_all(string=self.PRICE_HINT_RE)
             if not price_elements:
                 raise ContaboScrapeError(
                     f"Could not parse pricing structure from {url} - page format may have changed"
@@ -106,16 +111,16 @@ class ContaboScraper(BaseScraper):
             if not price_elem:
                 return None
             price_text = price_elem.get_text(strip=True)
-            price_match = re.search(r"€?\s*(\d+)[.,](\d{2})", price_text)
+            price_match = self.PRICE_RE.search(price_text)
             if not price_match:
                 return None
             price = float(f"{price_match.group(1)}.{price_match.group(2)}")
 
             # Look for specs (vCPU, RAM, storage)
             specs_text = card.get_text()
-            vcpu_match = re.search(r"(\d+)\s*(?:vCPU|CPU|Core)", specs_text, re.I)
-            ram_match = re.search(r"(\d+)\s*GB\s*(?:RAM|Memory)", specs_text, re.I)
-            storage_match = re.search(r"(\d+)\s*GB\s*(?:SSD|NVMe|Storage)", specs_text, re.I)
+            vcpu_match = self.VCPU_RE.search(specs_text)
+            ram_match = self.RAM_RE.search(specs_text)
+            storage_match = self.STORAGE_RE.search(specs_text)
 
             return {
                 "name": name,
@@ -136,6 +141,7 @@ class ContaboScraper(BaseScraper):
         for script in soup.find_all("script", type="application/ld+json"):
             try:
                 import json
+
                 data = json.loads(script.string)
                 if isinstance(data, dict) and data.get("@type") == "Product":
                     offers = data.get("offers", {})
@@ -144,14 +150,16 @@ class ContaboScraper(BaseScraper):
                     for offer in offers:
                         price = offer.get("price")
                         if price:
-                            plans.append({
-                                "name": data.get("name", "Unknown"),
-                                "price_eur": float(price),
-                                "vcpu": 0,
-                                "ram": 0,
-                                "storage": 0,
-                                "product_type": product_type,
-                            })
+                            plans.append(
+                                {
+                                    "name": data.get("name", "Unknown"),
+                                    "price_eur": float(price),
+                                    "vcpu": 0,
+                                    "ram": 0,
+                                    "storage": 0,
+                                    "product_type": product_type,
+                                }
+                            )
             except Exception:
                 continue
 
@@ -167,7 +175,9 @@ class ContaboScraper(BaseScraper):
                     offering_id=f"contabo-{plan['name'].lower().replace(' ', '-')}-{loc['code']}",
                     offer_name=f"Contabo {plan['name']} - {loc['city']}",
                     description=f"Contabo {plan['name']} in {loc['city']}, {loc['country']}",
-                    product_page_url=self.VPS_URL if plan["product_type"] == "compute" else self.VDS_URL,
+                    product_page_url=self.VPS_URL
+                    if plan["product_type"] == "compute"
+                    else self.VDS_URL,
                     currency="EUR",
                     monthly_price=plan["price_eur"],
                     setup_fee=0.0,
@@ -196,12 +206,13 @@ async def main() -> None:
 
     output_dir = Path(__file__).parent.parent.parent / "output" / "contabo"
 
-    scraper = ContaboScraper(output_dir)
-    csv_path, docs_count = await scraper.run()
-    print(f"CSV written to: {csv_path}")
+    async with ContaboScraper(output_dir) as scraper:
+        csv_path, offerings_count, docs_count = await scraper.run()
+    print(f"CSV written to: {csv_path} ({offerings_count} offerings)")
     print(f"Docs written: {docs_count}")
 
 
 if __name__ == "__main__":
     import asyncio
+
     asyncio.run(main())
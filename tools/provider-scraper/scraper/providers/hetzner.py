@@ -65,11 +65,10 @@ class HetznerScraper(BaseScraper):
 
         headers = {"Authorization": f"Bearer {api_token}"}
 
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            # Fetch server types
-            server_types = await self._fetch_server_types(client, headers)
-            # Fetch locations
-            locations = await self._fetch_locations(client, headers)
+        # Fetch server types
+        server_types = await self._fetch_server_types(self.http, headers)
+        # Fetch locations
+        locations = await self._fetch_locations(self.http, headers)
 
         return self._build_offerings(server_types, locations)
 
@@ -86,9 +85,7 @@ class HetznerScraper(BaseScraper):
             )
 
             if response.status_code == 401:
-                raise HetznerScrapeError(
-                    "Invalid Hetzner API token - authentication failed"
-                )
+                raise HetznerScrapeError("Invalid Hetzner API token - authentication failed")
             if response.status_code == 429:
                 raise HetznerScrapeError("Rate limited by Hetzner API - try again later")
             if response.status_code != 200:
@@ -190,9 +187,9 @@ async def main() -> None:
 
     output_dir = Path(__file__).parent.parent.parent / "output" / "hetzner"
 
-    scraper = HetznerScraper(output_dir)
-    csv_path, docs_count = await scraper.run()
-    print(f"CSV written to: {csv_path}")
+    async with HetznerScraper(output_dir) as scraper:
+        csv_path, offerings_count, docs_count = await scraper.run()
+    print(f"CSV written to: {csv_path} ({offerings_count} offerings)")
     print(f"Docs written: {docs_count}")
 
 
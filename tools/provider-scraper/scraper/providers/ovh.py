@@ -25,24 +25,27 @@ class OvhScraper(BaseScraper):
     # Subsidiaries to fetch pricing from (affects currency and availability)
     SUBSIDIARIES = ["FR", "DE", "GB", "US"]
 
+    # Base plan info at the start of a plan code: vps-{tier}-{vcpu}-{ram}-{disk}-...
+    PLAN_CODE_RE = re.compile(r"vps-(\w+)-(\d+)-(\d+)-(\d+)")
+
     async def scrape_offerings(self) -> list[Offering]:
         """Fetch offerings from OVH public catalog API.
 
         Raises:
             OvhScrapeError: If API request fails.
         """
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            all_offerings = []
-
-            # Fetch VPS catalog
-            for subsidiary in self.SUBSIDIARIES:
-                try:
-                    vps_offerings = await self._fetch_vps_catalog(client, subsidiary)
-                    all_offerings.extend(vps_offerings)
-                except OvhScrapeError as e:
-                    # Log but continue with other subsidiaries
-                    import logging
-                    logging.warning(f"Failed to fetch VPS catalog for {subsidiary}: {e}")
+        all_offerings = []
+
+        # Fetch VPS catalog
+        for subsidiary in self.SUBSIDIARIES:
+            try:
+                vps_offerings = await self._fetch_vps_catalog(self.http, subsidiary)
+                all_offerings.extend(vps_offerings)
+            except OvhScrapeError as e:
+                # Log but continue with other subsidiaries
+                import logging
+
+                logging.warning(f"Failed to fetch VPS catalog for {subsidiary}: {e}")
 
         if not all_offerings:
             raise OvhScrapeError("No offerings fetched from any OVH subsidiary")
@@ -84,9 +87,7 @@ class OvhScraper(BaseScraper):
             # Extract base plan info from plan code
             # Format: vps-{tier}-{vcpu}-{ram}-{disk}-vps-{year}-{model}-{options}
             # Example: vps-essential-2-4-160-vps-2025-model3-degressivity12-10percent
-            base_match = re.match(
-                r"vps-(\w+)-(\d+)-(\d+)-(\d+)", plan_code
-            )
+            base_match = self.PLAN_CODE_RE.match(plan_code)
             if not base_match:
                 continue
 
@@ -104,7 +105,9 @@ class OvhScraper(BaseScraper):
                 continue
 
             # Determine currency based on subsidiary
-            currency = "EUR" if subsidiary in ("FR", "DE") else "GBP" if subsidiary == "GB" else "USD"
+            currency = (
+                "EUR" if subsidiary in ("FR", "DE") else "GBP" if subsidiary == "GB" else "USD"
+            )
 
             # Determine datacenter info
             country, city = self._subsidiary_to_location(subsidiary)
@@ -167,12 +170,13 @@ async def main() -> None:
 
     output_dir = Path(__file__).parent.parent.parent / "output" / "ovh"
 
-    scraper = OvhScraper(output_dir)
-    csv_path, docs_count = await scraper.run()
-    print(f"CSV written to: {csv_path}")
+    async with OvhScraper(output_dir) as scraper:
+        csv_path, offerings_count, docs_count = await scraper.run()
+    print(f"CSV written to: {csv_path} ({offerings_count} offerings)")
     print(f"Docs written: {docs_count}")
 
 
 if __name__ == "__main__":
     import asyncio
+
     asyncio.run(main())
@@ -1,6 +1,12 @@
 """ZIP archive storage with ETag/content-hash caching for incremental crawls.
 
 Uses local directory during scraping for efficiency, zips only when finalized.
+Cache updates are appended to a JSONL journal and compacted into cache.json
+on finalize, so each write costs one line instead of a full cache rewrite.
+
+SitemapCache keeps sitemap validators and parsed URLs so discovery can send
+conditional requests and skip unchanged sitemaps. It also remembers which path
+each site serves its sitemap from, and which sites have none.
 """
 
 import hashlib
@@ -8,13 +14,21 @@ import json
 import logging
 import re
 import shutil
+import time
 import zipfile
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
 from datetime import datetime, timezone
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
+# Runs of anything but ASCII letters, digits and underscores (hyphens included),
+# so one substitution both replaces unsafe chars and collapses hyphens
+_UNSAFE_FILENAME_RUN_RE = re.compile(r"[^a-zA-Z0-9_]+")
+
+# How long a site found to have no sitemap is not probed again (seconds)
+SITEMAP_MISS_TTL = 3600
+
 
 @dataclass
 class CacheEntry:
@@ -36,6 +50,7 @@ class DocsArchive:
 
         self.zip_path = self.output_dir / "docs.zip"
         self.cache_path = self.output_dir / "cache.json"
+        self.journal_path = self.output_dir / "cache.jsonl"
         self.docs_dir = self.output_dir / "docs"
 
         self._cache: dict[str, CacheEntry] = self._load_cache()
@@ -43,7 +58,9 @@ class DocsArchive:
         # Unpack existing ZIP to local dir for incremental updates
         self._unpack_zip()
 
-        logger.debug(f"Initialized DocsArchive at {output_dir} with {len(self._cache)} cached entries")
+        logger.debug(
+            f"Initialized DocsArchive at {output_dir} with {len(self._cache)} cached entries"
+        )
 
     def _unpack_zip(self) -> None:
         """Unpack existing ZIP to docs/ directory if it exists."""
@@ -59,31 +76,62 @@ class DocsArchive:
         try:
             with zipfile.ZipFile(self.zip_path, "r") as zf:
                 zf.extractall(self.docs_dir)
-            logger.debug(f"Unpacked {len(list(self.docs_dir.iterdir()))} files from {self.zip_path}")
+            logger.debug(
+                f"Unpacked {len(list(self.docs_dir.iterdir()))} files from {self.zip_path}"
+            )
         except zipfile.BadZipFile as e:
             logger.warning(f"Corrupted ZIP at {self.zip_path}, starting fresh: {e}")
             # Keep empty docs dir
 
     def _load_cache(self) -> dict[str, CacheEntry]:
-        """Load cache.json, return empty dict if not exists."""
-        if not self.cache_path.exists():
+        """Load cache.json plus any journaled updates, return empty dict if neither exists."""
+        cache: dict[str, CacheEntry] = {}
+        if self.cache_path.exists():
+            try:
+                with open(self.cache_path, encoding="utf-8") as f:
+                    data = json.load(f)
+
+                # Convert dict to CacheEntry objects
+                for url, entry_dict in data.items():
+                    cache[url] = CacheEntry(**entry_dict)
+            except (json.JSONDecodeError, TypeError, KeyError) as e:
+                logger.error(f"Failed to load cache from {self.cache_path}: {e}")
+                raise
+        else:
             logger.debug(f"No cache found at {self.cache_path}")
-            return {}
-
-        try:
-            with open(self.cache_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
 
-            # Convert dict to CacheEntry objects
-            cache = {}
-            for url, entry_dict in data.items():
-                cache[url] = CacheEntry(**entry_dict)
-
-            logger.debug(f"Loaded {len(cache)} entries from cache")
-            return cache
-        except (json.JSONDecodeError, TypeError, KeyError) as e:
-            logger.error(f"Failed to load cache from {self.cache_path}: {e}")
-            raise
+        if self.journal_path.exists():
+            self._replay_journal(cache)
+
+        logger.debug(f"Loaded {len(cache)} entries from cache")
+        return cache
+
+    def _replay_journal(self, cache: dict[str, CacheEntry]) -> None:
+        """Apply journaled cache updates (from a run that was not finalized), last wins."""
+        lines = self.journal_path.read_text(encoding="utf-8").splitlines()
+        for i, line in enumerate(lines):
+            try:
+                record = json.loads(line)
+                url = record.pop("url")
+                cache[url] = CacheEntry(**record)
+            except (json.JSONDecodeError, TypeError, KeyError) as e:
+                # A crash mid-append leaves a torn last line; anything else is corruption
+                if i == len(lines) - 1:
+                    logger.warning(f"Dropping incomplete last line of {self.journal_path}: {e}")
+                    # Truncate it so later appends start on a fresh line
+                    self.journal_path.write_text(
+                        "".join(f"{kept}\n" for kept in lines[:-1]), encoding="utf-8"
+                    )
+                    return
+                logger.error(
+                    f"Failed to load cache journal {self.journal_path} (line {i + 1}): {e}"
+                )
+                raise
+
+    def _append_journal(self, url: str, entry: CacheEntry) -> None:
+        """Append one cache update to the journal."""
+        with open(self.journal_path, "a", encoding="utf-8") as f:
+            f.write(json.dumps({"url": url, **asdict(entry)}) + "\n")
 
     def _save_cache(self) -> None:
         """Save cache to cache.json."""
@@ -100,15 +148,18 @@ class DocsArchive:
 
             with open(self.cache_path, "w", encoding="utf-8") as f:
                 json.dump(data, f, indent=2)
+            # The snapshot now includes every journaled update
+            self.journal_path.unlink(missing_ok=True)
 
             logger.debug(f"Saved {len(self._cache)} entries to cache")
         except (OSError, TypeError) as e:
             logger.error(f"Failed to save cache to {self.cache_path}: {e}")
             raise
 
-    def _content_hash(self, content: str) -> str:
-        """Compute SHA256 hash of content (first 16 chars)."""
-        return hashlib.sha256(content.encode("utf-8")).hexdigest()[:16]
+    def _content_hash(self, content: str | bytes) -> str:
+        """Compute SHA256 hash of content (first 16 chars); str is hashed as UTF-8."""
+        data = content.encode("utf-8") if isinstance(content, str) else content
+        return hashlib.sha256(data).hexdigest()[:16]
 
     def _safe_filename(self, url: str, topic: str) -> str:
         """Generate safe filename from URL/topic for ZIP entry.
@@ -135,10 +186,8 @@ class DocsArchive:
                 # No path, use 'index'
                 base = "index"
 
-        # Replace non-alphanumeric chars with hyphens
-        safe = re.sub(r"[^a-zA-Z0-9_-]", "-", base)
-        # Collapse multiple hyphens
-        safe = re.sub(r"-+", "-", safe)
+        # Replace non-alphanumeric chars with hyphens, collapsing runs into one
+        safe = _UNSAFE_FILENAME_RUN_RE.sub("-", base)
         # Strip leading/trailing hyphens
         safe = safe.strip("-")
 
@@ -148,6 +197,18 @@ class DocsArchive:
 
         return f"{safe}.md"
 
+    def etag_for(self, url: str) -> str | None:
+        """Return the stored ETag for a URL, or None if unknown.
+
+        Args:
+            url: The URL to look up.
+
+        Returns:
+            ETag recorded at the last write, for conditional requests.
+        """
+        entry = self._cache.get(url)
+        return entry.etag if entry else None
+
     def has_changed(self, url: str, etag: str | None, content: str) -> bool:
         """Check if content changed. Uses ETag if available, falls back to content hash.
 
@@ -159,6 +220,10 @@ class DocsArchive:
         Returns:
             True if content changed or URL is new, False if unchanged.
         """
+        return self._has_changed(url, etag, self._content_hash(content))
+
+    def _has_changed(self, url: str, etag: str | None, content_hash: str) -> bool:
+        """has_changed() against an already computed content hash."""
         # New URL, always changed
         if url not in self._cache:
             logger.debug(f"URL not in cache (new): {url}")
@@ -173,8 +238,7 @@ class DocsArchive:
             return changed
 
         # Fall back to content hash comparison
-        new_hash = self._content_hash(content)
-        changed = new_hash != entry.content_hash
+        changed = content_hash != entry.content_hash
         logger.debug(f"Content hash comparison for {url}: {'changed' if changed else 'unchanged'}")
         return changed
 
@@ -190,24 +254,49 @@ class DocsArchive:
         Returns:
             The filename used.
         """
+        data = content.encode("utf-8")
+        return self._write(url, data, topic, etag, self._content_hash(data))
+
+    def write_if_changed(
+        self, url: str, content: str, topic: str, etag: str | None = None
+    ) -> str | None:
+        """Write markdown unless unchanged (see has_changed), encoding and hashing it once.
+
+        Args:
+            url: The URL being crawled.
+            content: The markdown content to store.
+            topic: The topic/section identifier.
+            etag: Optional ETag from HTTP response.
+
+        Returns:
+            The filename used, or None if the content is unchanged and nothing was written.
+        """
+        data = content.encode("utf-8")
+        content_hash = self._content_hash(data)
+        if not self._has_changed(url, etag, content_hash):
+            return None
+        return self._write(url, data, topic, etag, content_hash)
+
+    def _write(self, url: str, data: bytes, topic: str, etag: str | None, content_hash: str) -> str:
+        """Write encoded markdown and its cache entry; see write()."""
         filename = self._safe_filename(url, topic)
-        content_hash = self._content_hash(content)
         crawled_at = datetime.now(timezone.utc).isoformat()
 
         # Update cache entry
-        self._cache[url] = CacheEntry(
+        entry = CacheEntry(
             filename=filename,
             etag=etag,
             content_hash=content_hash,
             crawled_at=crawled_at,
         )
+        self._cache[url] = entry
 
         # Write directly to local dir (fast!)
         file_path = self.docs_dir / filename
-        file_path.write_text(content, encoding="utf-8")
+        file_path.write_bytes(data)
 
-        # Save cache
-        self._save_cache()
+        # Journal the cache update (compacted into cache.json on finalize)
+        self._append_journal(url, entry)
 
         logger.info(f"Wrote {filename} to {self.docs_dir} (URL: {url})")
         return filename
@@ -218,6 +307,10 @@ class DocsArchive:
         Args:
             keep_local: If True, keep the docs/ directory for troubleshooting.
         """
+        # Compact the cache journal into cache.json
+        if self.journal_path.exists():
+            self._save_cache()
+
         if not self.docs_dir.exists():
             logger.warning(f"No docs directory to finalize at {self.docs_dir}")
             return
@@ -277,3 +370,118 @@ class DocsArchive:
         except (zipfile.BadZipFile, OSError) as e:
             logger.error(f"Failed to read {filename} from {self.zip_path}: {e}")
             raise
+
+
+@dataclass
+class SitemapEntry:
+    """Validators and parsed URLs of a fetched sitemap."""
+
+    etag: str | None
+    last_modified: str | None
+    urls: list[str]
+    is_index: bool = False  # <sitemapindex>: urls are child sitemaps
+
+    def conditional_headers(self) -> dict[str, str]:
+        """Request headers asking the server for 304 if the sitemap is unchanged."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+@dataclass
+class SitemapProbe:
+    """Where a site's sitemap was last found (path None: no sitemap at all)."""
+
+    path: str | None
+    checked_at: float
+
+
+class SitemapCache:
+    """JSON-backed cache of sitemap validators, parsed URLs and per-site sitemap paths."""
+
+    def __init__(self, path: Path):
+        """Initialize with the cache file path, loading it if present."""
+        self.path = Path(path)
+        self._entries: dict[str, SitemapEntry] = {}
+        self._probes: dict[str, SitemapProbe] = {}
+        self._load()
+        self._dirty = False
+
+    def _load(self) -> None:
+        """Load entries and probes from disk, if the file exists."""
+        if not self.path.exists():
+            return
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                data = json.load(f)
+            self._entries = {url: SitemapEntry(**entry) for url, entry in data["sitemaps"].items()}
+            self._probes = {url: SitemapProbe(**probe) for url, probe in data["probes"].items()}
+        except (json.JSONDecodeError, TypeError, KeyError) as e:
+            logger.error(f"Failed to load sitemap cache from {self.path}: {e}")
+            raise
+
+    def get(self, url: str) -> SitemapEntry | None:
+        """Return the cached entry for a sitemap URL, or None if unknown."""
+        return self._entries.get(url)
+
+    def put(
+        self,
+        url: str,
+        etag: str | None,
+        last_modified: str | None,
+        urls: list[str],
+        is_index: bool = False,
+    ) -> None:
+        """Record a freshly fetched sitemap.
+
+        Sitemaps served without validators can't be revalidated, so they are not stored.
+
+        Args:
+            url: The sitemap URL.
+            etag: ETag response header, if any.
+            last_modified: Last-Modified response header, if any.
+            urls: URLs parsed from the sitemap.
+            is_index: Whether the sitemap is a <sitemapindex>.
+        """
+        if not etag and not last_modified:
+            return
+        self._entries[url] = SitemapEntry(
+            etag=etag, last_modified=last_modified, urls=urls, is_index=is_index
+        )
+        self._dirty = True
+
+    def sitemap_path(self, base_url: str) -> str | None:
+        """Return the path the site's sitemap was last found at, or None if unknown."""
+        probe = self._probes.get(base_url)
+        return probe.path if probe else None
+
+    def is_known_missing(self, base_url: str) -> bool:
+        """Check whether the site was found to have no sitemap within SITEMAP_MISS_TTL."""
+        probe = self._probes.get(base_url)
+        return (
+            probe is not None
+            and probe.path is None
+            and time.time() - probe.checked_at < SITEMAP_MISS_TTL
+        )
+
+    def record_sitemap_path(self, base_url: str, path: str | None) -> None:
+        """Record where the site's sitemap was found, or None if no path had one."""
+        self._probes[base_url] = SitemapProbe(path=path, checked_at=time.time())
+        self._dirty = True
+
+    def save(self) -> None:
+        """Write the cache to disk if anything changed since loading."""
+        if not self._dirty:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        data = {
+            "sitemaps": {url: asdict(entry) for url, entry in self._entries.items()},
+            "probes": {url: asdict(probe) for url, probe in self._probes.items()},
+        }
+        with open(self.path, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        self._dirty = False
+        logger.debug(f"Saved {len(self._entries)} sitemap entries to {self.path}")
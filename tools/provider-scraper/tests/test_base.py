@@ -1,10 +1,15 @@
 """Tests for async base scraper class."""
 
+import asyncio
+import threading
+
+import httpx
 import pytest
 from pathlib import Path
 from unittest.mock import AsyncMock, Mock, patch
 
 from scraper.base import BaseScraper, DocsScrapeError
+from scraper.concurrency import AIMDLimiter
 from scraper.models import Offering
 
 
@@ -30,6 +35,16 @@ class ConcreteTestScraper(BaseScraper):
         ]
 
 
+def mock_http(handler):
+    """Patch httpx.AsyncClient in scraper.base to answer every request with `handler`."""
+    real_client = httpx.AsyncClient
+
+    def make_client(**kwargs):
+        return real_client(transport=httpx.MockTransport(handler), **kwargs)
+
+    return patch("scraper.base.httpx.AsyncClient", side_effect=make_client)
+
+
 @pytest.fixture
 def temp_output_dir(tmp_path):
     """Create temp output directory."""
@@ -70,6 +85,18 @@ class TestInitialization:
         assert scraper.provider_id == "multi-word-provider"
 
 
+class TestHttpClient:
+    """Test the shared HTTP client lifecycle."""
+
+    @pytest.mark.asyncio
+    async def test_http_client_is_shared_and_closed_on_exit(self, scraper):
+        async with scraper:
+            client = scraper.http
+            assert scraper.http is client
+        assert client.is_closed
+        assert scraper._http is None
+
+
 class TestDocURLDiscovery:
     """Test documentation URL discovery."""
 
@@ -84,7 +111,9 @@ class TestDocURLDiscovery:
             urls = await scraper.discover_doc_urls()
 
             # Verify docs_base_url was used
-            mock_sitemap.assert_called_once_with("https://docs.test.com")
+            mock_sitemap.assert_called_once_with(
+                "https://docs.test.com", client=scraper.http, cache=scraper.sitemap_cache
+            )
             assert len(urls) == 2
 
     @pytest.mark.asyncio
@@ -101,7 +130,9 @@ class TestDocURLDiscovery:
             urls = await scraper.discover_doc_urls()
 
             # Verify provider_website was used
-            mock_sitemap.assert_called_once_with("https://test.com")
+            mock_sitemap.assert_called_once_with(
+                "https://test.com", client=scraper.http, cache=scraper.sitemap_cache
+            )
             assert len(urls) == 1
 
     @pytest.mark.asyncio
@@ -172,6 +203,15 @@ class TestFilterDocURLs:
         filtered = scraper._filter_doc_urls(urls)
         assert len(filtered) == 1
 
+    def test_filter_doc_urls_requires_path_boundary(self, scraper):
+        """Hosts that merely share the base URL as a string prefix are external."""
+        urls = [
+            "https://docs.test.com",
+            "https://docs.test.com.evil.com/page",
+            "https://docs.test.comics/page",
+        ]
+        assert scraper._filter_doc_urls(urls) == ["https://docs.test.com"]
+
     def test_filter_doc_urls_empty_list(self, scraper):
         filtered = scraper._filter_doc_urls([])
         assert filtered == []
@@ -197,6 +237,14 @@ class TestExtractTopic:
         topic = scraper._extract_topic("https://test.com", "")
         assert topic == "index"
 
+    def test_extract_topic_ignores_whitespace_title(self, scraper):
+        topic = scraper._extract_topic("https://test.com/docs/page", "   ")
+        assert topic == "page"
+
+    def test_extract_topic_ignores_query_string(self, scraper):
+        topic = scraper._extract_topic("https://test.com/docs/page/?lang=en#top", "")
+        assert topic == "page"
+
     def test_extract_topic_extracts_last_path_segment(self, scraper):
         topic = scraper._extract_topic("https://test.com/docs/api/reference", "")
         assert topic == "reference"
@@ -209,6 +257,7 @@ class TestScrapeOfferings:
     async def test_scrape_offerings_is_abstract(self):
         # Verify that BaseScraper cannot be instantiated without implementing scrape_offerings
         with pytest.raises(TypeError, match="Can't instantiate abstract class.*scrape_offerings"):
+
             class NoImplementation(BaseScraper):
                 provider_name = "Test"
                 provider_website = "https://test.com"
@@ -235,9 +284,11 @@ class TestScrapeDocs:
         mock_result = Mock()
         mock_result.success = True
         mock_result.error_message = None
+        mock_result.status_code = 200
         mock_result.markdown.fit_markdown = fit_content
         mock_result.markdown.raw_markdown = "# Raw Content"
-        mock_result.metadata = {"title": "Test Page", "etag": "abc123"}
+        mock_result.metadata = {"title": "Test Page"}
+        mock_result.response_headers = {"etag": "abc123"}
 
         with (
             patch.object(scraper, "discover_doc_urls", new_callable=AsyncMock) as mock_discover,
@@ -250,14 +301,12 @@ class TestScrapeDocs:
             mock_crawler_class.return_value.__aenter__.return_value = mock_crawler
 
             # Mock archive methods
-            scraper.archive.has_changed = Mock(return_value=True)
-            scraper.archive.write = Mock(return_value="test-page.md")
+            scraper.archive.write_if_changed = Mock(return_value="test-page.md")
 
             count = await scraper.scrape_docs()
 
             assert count == 1
-            scraper.archive.has_changed.assert_called_once()
-            scraper.archive.write.assert_called_once_with(
+            scraper.archive.write_if_changed.assert_called_once_with(
                 "https://docs.test.com/page1",
                 fit_content,
                 "Test Page",
@@ -271,9 +320,11 @@ class TestScrapeDocs:
         mock_result = Mock()
         mock_result.success = True
         mock_result.error_message = None
+        mock_result.status_code = 200
         mock_result.markdown.fit_markdown = fit_content
         mock_result.markdown.raw_markdown = "# Raw Content"
         mock_result.metadata = {"title": "Test Page"}
+        mock_result.response_headers = {}
 
         with (
             patch.object(scraper, "discover_doc_urls", new_callable=AsyncMock) as mock_discover,
@@ -286,14 +337,12 @@ class TestScrapeDocs:
             mock_crawler_class.return_value.__aenter__.return_value = mock_crawler
 
             # Mock archive to say content unchanged
-            scraper.archive.has_changed = Mock(return_value=False)
-            scraper.archive.write = Mock()
+            scraper.archive.write_if_changed = Mock(return_value=None)
 
             count = await scraper.scrape_docs()
 
             assert count == 0
-            scraper.archive.has_changed.assert_called_once()
-            scraper.archive.write.assert_not_called()
+            scraper.archive.write_if_changed.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_scrape_docs_raises_when_all_pages_fail(self, scraper):
@@ -301,6 +350,7 @@ class TestScrapeDocs:
         mock_result = Mock()
         mock_result.success = False
         mock_result.error_message = "Connection timeout"
+        mock_result.status_code = None
 
         with (
             patch.object(scraper, "discover_doc_urls", new_callable=AsyncMock) as mock_discover,
@@ -312,7 +362,7 @@ class TestScrapeDocs:
             mock_crawler.arun = AsyncMock(return_value=mock_result)
             mock_crawler_class.return_value.__aenter__.return_value = mock_crawler
 
-            scraper.archive.write = Mock()
+            scraper.archive.write_if_changed = Mock()
 
             with pytest.raises(DocsScrapeError, match="All 1 doc pages failed"):
                 await scraper.scrape_docs()
@@ -323,6 +373,7 @@ class TestScrapeDocs:
         mock_result = Mock()
         mock_result.success = True
         mock_result.error_message = None
+        mock_result.status_code = 200
         mock_result.markdown.fit_markdown = None
         mock_result.markdown.raw_markdown = None
 
@@ -336,7 +387,7 @@ class TestScrapeDocs:
             mock_crawler.arun = AsyncMock(return_value=mock_result)
             mock_crawler_class.return_value.__aenter__.return_value = mock_crawler
 
-            scraper.archive.write = Mock()
+            scraper.archive.write_if_changed = Mock()
 
             with pytest.raises(DocsScrapeError, match="All 1 doc pages failed"):
                 await scraper.scrape_docs()
@@ -346,9 +397,11 @@ class TestScrapeDocs:
         mock_result = Mock()
         mock_result.success = True
         mock_result.error_message = None
+        mock_result.status_code = 200
         mock_result.markdown.fit_markdown = None
         mock_result.markdown.raw_markdown = "# Raw Content"
         mock_result.metadata = {"title": "Test Page"}
+        mock_result.response_headers = {}
 
         with (
             patch.object(scraper, "discover_doc_urls", new_callable=AsyncMock) as mock_discover,
@@ -360,13 +413,12 @@ class TestScrapeDocs:
             mock_crawler.arun = AsyncMock(return_value=mock_result)
             mock_crawler_class.return_value.__aenter__.return_value = mock_crawler
 
-            scraper.archive.has_changed = Mock(return_value=True)
-            scraper.archive.write = Mock(return_value="test-page.md")
+            scraper.archive.write_if_changed = Mock(return_value="test-page.md")
 
             count = await scraper.scrape_docs()
 
             assert count == 1
-            scraper.archive.write.assert_called_once_with(
+            scraper.archive.write_if_changed.assert_called_once_with(
                 "https://docs.test.com/page1",
                 "# Raw Content",
                 "Test Page",
@@ -390,20 +442,289 @@ class TestScrapeDocs:
             mock_result = Mock()
             mock_result.success = True
             mock_result.error_message = None
+            mock_result.status_code = 200
             mock_result.markdown.fit_markdown = "# Content"
             mock_result.metadata = {"title": "Page 2"}
+            mock_result.response_headers = {}
 
             mock_crawler.arun = AsyncMock(side_effect=[Exception("Network error"), mock_result])
             mock_crawler_class.return_value.__aenter__.return_value = mock_crawler
 
-            scraper.archive.has_changed = Mock(return_value=True)
-            scraper.archive.write = Mock(return_value="page2.md")
+            scraper.archive.write_if_changed = Mock(return_value="page2.md")
 
             count = await scraper.scrape_docs()
 
             # Should continue after exception and process page2
             assert count == 1
 
+    @pytest.mark.asyncio
+    async def test_scrape_docs_crawls_concurrently_up_to_limit(self, scraper):
+        """Pages are crawled in parallel, never more than max_concurrency at once."""
+        scraper.max_concurrency = 2
+        in_flight = 0
+        peak = 0
+
+        async def fake_arun(url, config):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            result = Mock()
+            result.success = True
+            result.error_message = None
+            result.status_code = 200
+            result.markdown.fit_markdown = f"# {url}"
+            result.metadata = {"title": url}
+            result.response_headers = {}
+            return result
+
+        urls = [f"https://docs.test.com/page{i}" for i in range(6)]
+        with (
+            patch.object(scraper, "discover_doc_urls", new_callable=AsyncMock) as mock_discover,
+            patch("scraper.base.AsyncWebCrawler") as mock_crawler_class,
+        ):
+            mock_discover.return_value = urls
+            mock_crawler = AsyncMock()
+            mock_crawler.arun = fake_arun
+            mock_crawler_class.return_value.__aenter__.return_value = mock_crawler
+
+            scraper.archive.write_if_changed = Mock()
+
+            count = await scraper.scrape_docs()
+
+        assert count == 6
+        assert peak == 2
+        # Archive writes still happen in discovery order
+        assert [c.args[0] for c in scraper.archive.write_if_changed.call_args_list] == urls
+
+    @pytest.mark.asyncio
+    async def test_scrape_docs_retries_rate_limited_page(self, scraper):
+        """A rate-limited page is retried after backing off instead of aborting."""
+        limited = Mock()
+        limited.success = False
+        limited.error_message = "HTTP 429 Too Many Requests"
+        limited.status_code = 429
+        ok = Mock()
+        ok.success = True
+        ok.error_message = None
+        ok.status_code = 200
+        ok.markdown.fit_markdown = "# Content"
+        ok.metadata = {"title": "Page"}
+        ok.response_headers = {}
+
+        with (
+            patch.object(scraper, "discover_doc_urls", new_callable=AsyncMock) as mock_discover,
+            patch("scraper.base.AsyncWebCrawler") as mock_crawler_class,
+            patch("scraper.base.RATE_LIMIT_BACKOFF", 0),
+        ):
+            mock_discover.return_value = ["https://docs.test.com/page1"]
+            mock_crawler = AsyncMock()
+            mock_crawler.arun = AsyncMock(side_effect=[limited, ok])
+            mock_crawler_class.return_value.__aenter__.return_value = mock_crawler
+
+            scraper.archive.write_if_changed = Mock()
+
+            assert await scraper.scrape_docs() == 1
+            assert mock_crawler.arun.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_server_error_halves_limit_without_retry(self, scraper):
+        """A 5xx counts as overload for the limiter but is not retried."""
+        failed = Mock()
+        failed.success = False
+        failed.error_message = "Internal Server Error"
+        failed.status_code = 503
+        crawler = AsyncMock()
+        crawler.arun = AsyncMock(return_value=failed)
+        limiter = AIMDLimiter(initial=8)
+
+        page = await scraper._crawl_one(crawler, Mock(), "https://docs.test.com/page1", limiter)
+
+        assert page is None
+        assert limiter.limit == 4
+        crawler.arun.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_scrape_docs_raises_on_rate_limit(self, scraper):
+        """A page still rate limited after all retries aborts the whole scrape."""
+        mock_result = Mock()
+        mock_result.success = False
+        mock_result.error_message = "HTTP 429 Too Many Requests"
+        mock_result.status_code = 429
+
+        with (
+            patch.object(scraper, "discover_doc_urls", new_callable=AsyncMock) as mock_discover,
+            patch("scraper.base.AsyncWebCrawler") as mock_crawler_class,
+            patch("scraper.base.RATE_LIMIT_BACKOFF", 0),
+        ):
+            mock_discover.return_value = [
+                "https://docs.test.com/page1",
+                "https://docs.test.com/page2",
+            ]
+            mock_crawler = AsyncMock()
+            mock_crawler.arun = AsyncMock(return_value=mock_result)
+            mock_crawler_class.return_value.__aenter__.return_value = mock_crawler
+
+            scraper.archive.write_if_changed = Mock()
+
+            with pytest.raises(DocsScrapeError, match="Rate limited"):
+                await scraper.scrape_docs()
+
+            scraper.archive.write_if_changed.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_scrape_docs_skips_browser_when_nothing_modified(self, scraper):
+        """Pages whose archived ETag the server confirms with 304 are not crawled."""
+        url = "https://docs.test.com/page1"
+        scraper.archive.write(url, "# Archived", "page1", '"v1"')
+        seen_headers = []
+
+        def handler(request):
+            seen_headers.append(request.headers.get("if-none-match"))
+            return httpx.Response(304)
+
+        with (
+            patch.object(scraper, "discover_doc_urls", new_callable=AsyncMock) as mock_discover,
+            patch("scraper.base.AsyncWebCrawler") as mock_crawler_class,
+            mock_http(handler),
+        ):
+            mock_discover.return_value = [url]
+            mock_crawler = AsyncMock()
+            mock_crawler_class.return_value.__aenter__.return_value = mock_crawler
+
+            count = await scraper.scrape_docs()
+
+            assert count == 0
+            assert seen_headers == ['"v1"']
+            mock_crawler_class.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_scrape_docs_uses_shared_crawler(self, temp_output_dir):
+        mock_result = Mock()
+        mock_result.success = True
+        mock_result.error_message = None
+        mock_result.status_code = 200
+        mock_result.markdown.fit_markdown = "# Page\n\n" + "Shared browser content. " * 10
+        mock_result.metadata = {"title": "Page"}
+        mock_result.response_headers = {}
+        shared_crawler = AsyncMock()
+        shared_crawler.arun = AsyncMock(return_value=mock_result)
+        shared = Mock(get=AsyncMock(return_value=shared_crawler))
+        scraper = ConcreteTestScraper(output_dir=temp_output_dir, crawler=shared)
+
+        with (
+            patch.object(scraper, "discover_doc_urls", new_callable=AsyncMock) as mock_discover,
+            patch("scraper.base.AsyncWebCrawler") as mock_crawler_class,
+        ):
+            mock_discover.return_value = ["https://docs.test.com/page1"]
+            count = await scraper.scrape_docs()
+
+        assert count == 1
+        shared_crawler.arun.assert_awaited_once()
+        mock_crawler_class.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_scrape_docs_crawls_only_modified_pages(self, scraper):
+        unchanged, changed = "https://docs.test.com/same", "https://docs.test.com/new"
+        scraper.archive.write(unchanged, "# Archived", "same", '"v1"')
+        mock_result = Mock()
+        mock_result.success = True
+        mock_result.error_message = None
+        mock_result.status_code = 200
+        mock_result.markdown.fit_markdown = "# New\n\n" + "Fresh content. " * 10
+        mock_result.metadata = {"title": "New"}
+        mock_result.response_headers = {}
+
+        with (
+            patch.object(scraper, "discover_doc_urls", new_callable=AsyncMock) as mock_discover,
+            patch("scraper.base.AsyncWebCrawler") as mock_crawler_class,
+            mock_http(lambda request: httpx.Response(304)),
+        ):
+            mock_discover.return_value = [unchanged, changed]
+            mock_crawler = AsyncMock()
+            mock_crawler.arun = AsyncMock(return_value=mock_result)
+            mock_crawler_class.return_value.__aenter__.return_value = mock_crawler
+
+            count = await scraper.scrape_docs()
+
+        assert count == 1
+        mock_crawler.arun.assert_called_once()
+        assert mock_crawler.arun.call_args.kwargs["url"] == changed
+
+
+class TestCheckForChanges:
+    """Tests for the conditional changelog check."""
+
+    @pytest.mark.asyncio
+    async def test_not_modified_response_means_no_changes(self, scraper):
+        scraper.changelog_url = "https://test.com/changelog"
+        scraper._save_metadata({"changelog_etag": '"v1"'})
+        seen_headers = []
+
+        def handler(request):
+            seen_headers.append(request.headers.get("if-none-match"))
+            return httpx.Response(304)
+
+        with mock_http(handler):
+            assert await scraper.check_for_changes() is False
+
+        assert seen_headers == ['"v1"']
+
+    @pytest.mark.asyncio
+    async def test_new_etag_means_changes(self, scraper):
+        scraper.changelog_url = "https://test.com/changelog"
+        scraper._save_metadata({"changelog_etag": '"v1"'})
+
+        with mock_http(lambda request: httpx.Response(200, headers={"etag": '"v2"'})):
+            assert await scraper.check_for_changes() is True
+
+    @pytest.mark.asyncio
+    async def test_generate_qa_stores_etag_from_single_check(self, scraper):
+        scraper.changelog_url = "https://test.com/changelog"
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(200, headers={"etag": '"v2"'})
+
+        with (
+            mock_http(handler),
+            patch.object(scraper, "fetch_faq_content", new_callable=AsyncMock, return_value="docs"),
+            patch("scraper.qa_generator.QAGenerator") as mock_generator,
+        ):
+            mock_generator.return_value.generate_qa.return_value = [{"q": "?", "a": "!"}]
+            qa_path = await scraper.generate_qa(offerings=[])
+
+        assert qa_path is not None
+        assert qa_path.exists()
+        assert len(requests) == 1
+        assert scraper._load_metadata()["changelog_etag"] == '"v2"'
+
+    @pytest.mark.asyncio
+    async def test_generate_qa_does_not_block_other_providers(self, scraper):
+        released = threading.Event()
+
+        def slow_generate(**kwargs):
+            # Only returns once another provider made progress on the event loop
+            assert released.wait(timeout=2), "generate_qa blocked the event loop"
+            return [{"q": "?", "a": "!"}]
+
+        async def other_provider():
+            await asyncio.sleep(0.01)
+            released.set()
+
+        with (
+            patch.object(scraper, "check_for_changes", new_callable=AsyncMock, return_value=True),
+            patch.object(scraper, "fetch_faq_content", new_callable=AsyncMock, return_value="docs"),
+            patch("scraper.qa_generator.QAGenerator") as mock_generator,
+        ):
+            mock_generator.return_value.generate_qa.side_effect = slow_generate
+            qa_path, _ = await asyncio.gather(scraper.generate_qa(offerings=[]), other_provider())
+
+        assert qa_path is not None
+        assert qa_path.exists()
+
 
 class TestRun:
     """Test full scraping workflow."""
@@ -427,21 +748,45 @@ class TestRun:
             ]
             mock_docs.return_value = 5
 
-            csv_path, docs_count = await scraper.run()
+            csv_path, offerings_count, docs_count = await scraper.run()
 
             assert csv_path == scraper.output_dir / "offerings.csv"
             assert csv_path.exists()
+            assert offerings_count == 1
             assert docs_count == 5
 
             mock_offerings.assert_called_once()
             mock_docs.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_run_scrapes_offerings_and_docs_concurrently(self, scraper):
+        both_started = asyncio.Event()
+        started = 0
+
+        async def stage(result):
+            nonlocal started
+            started += 1
+            if started == 2:
+                both_started.set()
+            # Deadlocks (times out) if the stages run one after the other
+            await asyncio.wait_for(both_started.wait(), timeout=1)
+            return result
+
+        with (
+            patch.object(scraper, "scrape_offerings", new=lambda: stage([])),
+            patch.object(scraper, "scrape_docs", new=lambda: stage(3)),
+        ):
+            csv_path, _, docs_count = await scraper.run()
+
+        assert csv_path == scraper.output_dir / "offerings.csv"
+        assert docs_count == 3
+
     @pytest.mark.asyncio
     async def test_run_creates_valid_csv(self, scraper):
         with patch.object(scraper, "scrape_docs", new_callable=AsyncMock) as mock_docs:
             mock_docs.return_value = 0
 
-            csv_path, _ = await scraper.run()
+            csv_path, _, _ = await scraper.run()
 
             # Verify CSV was created
             assert csv_path.exists()
@@ -463,11 +808,35 @@ class TestRun:
             mock_offerings.side_effect = RuntimeError("API error")
             mock_docs.return_value = 3
 
-            csv_path, docs_count = await scraper.run(skip_offerings=True)
+            csv_path, offerings_count, docs_count = await scraper.run(skip_offerings=True)
 
             assert csv_path is None
+            assert offerings_count == 0
             assert docs_count == 3
 
+    @pytest.mark.asyncio
+    async def test_run_offerings_failure_cancels_docs(self, scraper):
+        docs_cancelled = False
+
+        async def slow_docs():
+            nonlocal docs_cancelled
+            try:
+                await asyncio.sleep(60)
+            except asyncio.CancelledError:
+                docs_cancelled = True
+                raise
+
+        with (
+            patch.object(scraper, "scrape_offerings", new_callable=AsyncMock) as mock_offerings,
+            patch.object(scraper, "scrape_docs", new=slow_docs),
+        ):
+            mock_offerings.side_effect = RuntimeError("API error")
+
+            with pytest.raises(RuntimeError, match="API error"):
+                await asyncio.wait_for(scraper.run(), timeout=5)
+
+        assert docs_cancelled
+
     @pytest.mark.asyncio
     async def test_run_skip_docs_on_failure(self, scraper):
         """Test run with skip_docs=True continues on failure."""
@@ -488,7 +857,90 @@ class TestRun:
             ]
             mock_docs.side_effect = RuntimeError("Docs error")
 
-            csv_path, docs_count = await scraper.run(skip_docs=True)
+            csv_path, _, docs_count = await scraper.run(skip_docs=True)
 
             assert csv_path is not None
             assert docs_count == 0
+
+
+class TestFetchFaqContent:
+    """Test FAQ page fetching."""
+
+    @pytest.mark.asyncio
+    async def test_fetches_pages_concurrently_in_order(self, scraper):
+        scraper.faq_urls = [
+            "https://test.com/faq1",
+            "https://test.com/faq2",
+            "https://test.com/faq3",
+        ]
+        in_flight = 0
+        peak = 0
+
+        async def arun(url, config):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            # Finish in reverse order to prove results keep faq_urls order
+            await asyncio.sleep(0.01 * (3 - int(url[-1])))
+            in_flight -= 1
+            result = Mock()
+            result.success = url != "https://test.com/faq2"
+            result.error_message = "HTTP 404"
+            result.status_code = None
+            result.markdown.fit_markdown = f"FAQ {url[-1]}"
+            return result
+
+        with patch("scraper.base.AsyncWebCrawler") as mock_crawler_class:
+            mock_crawler = AsyncMock()
+            mock_crawler.arun = arun
+            mock_crawler_class.return_value.__aenter__.return_value = mock_crawler
+
+            content = await scraper.fetch_faq_content()
+
+        assert peak == 3
+        assert content == (
+            "## Source: https://test.com/faq1\n\nFAQ 1\n\n---\n\n"
+            "## Source: https://test.com/faq3\n\nFAQ 3"
+        )
+
+
+class TestFetchGithubDocs:
+    """Test GitHub markdown docs fetching."""
+
+    @pytest.mark.asyncio
+    async def test_fetches_in_listing_order_up_to_max_files(self, scraper, monkeypatch):
+        scraper.github_docs_repo = "owner/repo"
+        monkeypatch.setenv("GITHUB_TOKEN", "secret-token")
+        listing = [
+            {"type": "dir", "name": "empty-tutorial"},
+            {"type": "file", "name": "a.md", "download_url": "https://raw.test/a.md"},
+            {"type": "file", "name": "image.png", "download_url": "https://raw.test/image.png"},
+            {"type": "dir", "name": "setup"},
+            {"type": "file", "name": "b.md", "download_url": "https://raw.test/b.md"},
+        ]
+        requested = []
+
+        def handler(request):
+            requested.append(str(request.url))
+            assert request.headers["Authorization"] == "Bearer secret-token"
+            if request.url.host == "api.github.com":
+                return httpx.Response(200, json=listing)
+            if "empty-tutorial" in request.url.path:
+                return httpx.Response(404)
+            return httpx.Response(200, text=f"content of {request.url.path}")
+
+        with mock_http(handler):
+            result = await scraper.fetch_github_docs(max_files=2)
+
+        sections = result.split("\n\n---\n\n")
+        assert [section.splitlines()[0] for section in sections] == [
+            "## Doc: a.md",
+            "## Tutorial: setup",
+        ]
+        assert not any("image.png" in url or "b.md" in url for url in requested)
+
+    @pytest.mark.asyncio
+    async def test_returns_empty_on_listing_failure(self, scraper):
+        scraper.github_docs_repo = "owner/repo"
+        with mock_http(lambda request: httpx.Response(403)):
+            assert await scraper.fetch_github_docs() == ""
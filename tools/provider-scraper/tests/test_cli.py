@@ -3,9 +3,10 @@
 import pytest
 from pathlib import Path
 from unittest.mock import AsyncMock, patch, MagicMock
+import subprocess
 import sys
 
-from scraper.cli import run_scraper, main, cli, SCRAPERS
+from scraper.cli import run_scraper, main, cli, load_scraper
 
 
 @pytest.fixture
@@ -27,11 +28,10 @@ class TestRunScraper:
         csv_path.write_text("header\noffering1\noffering2\noffering3\n")
 
         mock_scraper = AsyncMock()
-        mock_scraper.run = AsyncMock(return_value=(csv_path, 5))
+        mock_scraper.run = AsyncMock(return_value=(csv_path, 3, 5))
 
-        with patch("scraper.cli.SCRAPERS") as mock_scrapers:
-            mock_scrapers.__getitem__ = MagicMock(return_value=MagicMock(return_value=mock_scraper))
-            offerings_count, docs_count, success = await run_scraper("hetzner", temp_output_base)
+        with patch("scraper.cli.load_scraper", return_value=MagicMock(return_value=mock_scraper)):
+            offerings_count, docs_count, _, success = await run_scraper("hetzner", temp_output_base)
 
         assert offerings_count == 3
         assert docs_count == 5
@@ -43,18 +43,15 @@ class TestRunScraper:
         assert "Docs: 5 new/changed" in captured.out
 
     @pytest.mark.asyncio
-    async def test_csv_does_not_exist(self, temp_output_base, capsys):
-        """Test scraper run when CSV doesn't exist yet."""
-        csv_path = temp_output_base / "hetzner" / "offerings.csv"
-
+    async def test_offerings_skipped(self, temp_output_base, capsys):
+        """Test scraper run when offerings were skipped (no CSV written)."""
         mock_scraper = AsyncMock()
-        mock_scraper.run = AsyncMock(return_value=(csv_path, 3))
+        mock_scraper.run = AsyncMock(return_value=(None, 0, 3))
 
-        with patch("scraper.cli.SCRAPERS") as mock_scrapers:
-            mock_scrapers.__getitem__ = MagicMock(return_value=MagicMock(return_value=mock_scraper))
-            offerings_count, docs_count, success = await run_scraper("hetzner", temp_output_base)
+        with patch("scraper.cli.load_scraper", return_value=MagicMock(return_value=mock_scraper)):
+            offerings_count, docs_count, _, success = await run_scraper("hetzner", temp_output_base)
 
-        assert offerings_count == 0  # CSV doesn't exist
+        assert offerings_count == 0
         assert docs_count == 3
         assert success is True
 
@@ -68,9 +65,8 @@ class TestRunScraper:
         mock_scraper = AsyncMock()
         mock_scraper.run = AsyncMock(side_effect=RuntimeError("Network error"))
 
-        with patch("scraper.cli.SCRAPERS") as mock_scrapers:
-            mock_scrapers.__getitem__ = MagicMock(return_value=MagicMock(return_value=mock_scraper))
-            offerings_count, docs_count, success = await run_scraper("hetzner", temp_output_base)
+        with patch("scraper.cli.load_scraper", return_value=MagicMock(return_value=mock_scraper)):
+            offerings_count, docs_count, _, success = await run_scraper("hetzner", temp_output_base)
 
         assert offerings_count == 0
         assert docs_count == 0
@@ -87,11 +83,10 @@ class TestRunScraper:
         csv_path.write_text("header\noffering1\n")
 
         mock_scraper = AsyncMock()
-        mock_scraper.run = AsyncMock(return_value=(csv_path, 0))
+        mock_scraper.run = AsyncMock(return_value=(csv_path, 1, 0))
 
-        with patch("scraper.cli.SCRAPERS") as mock_scrapers:
-            mock_scrapers.__getitem__ = MagicMock(return_value=MagicMock(return_value=mock_scraper))
-            offerings_count, docs_count, success = await run_scraper("contabo", temp_output_base)
+        with patch("scraper.cli.load_scraper", return_value=MagicMock(return_value=mock_scraper)):
+            offerings_count, docs_count, _, success = await run_scraper("contabo", temp_output_base)
 
         assert offerings_count == 1
         assert docs_count == 0
@@ -112,10 +107,10 @@ class TestMain:
         csv_path.write_text("header\noffering1\noffering2\n")
 
         mock_scraper = AsyncMock()
-        mock_scraper.run = AsyncMock(return_value=(csv_path, 3))
+        mock_scraper.run = AsyncMock(return_value=(csv_path, 2, 3))
         mock_cls = MagicMock(return_value=mock_scraper)
 
-        with patch.dict(SCRAPERS, {"hetzner": mock_cls}):
+        with patch("scraper.cli.load_scraper", return_value=mock_cls):
             with patch.object(sys, "argv", ["cli.py", "hetzner"]):
                 with patch("scraper.cli.Path") as mock_path:
                     mock_path.return_value.parent.parent.__truediv__.return_value = temp_output_base
@@ -139,7 +134,7 @@ class TestMain:
             """Create mock for specific provider."""
             mock_scraper = AsyncMock()
             csv_path = temp_output_base / provider_name / "offerings.csv"
-            mock_scraper.run = AsyncMock(return_value=(csv_path, 2))
+            mock_scraper.run = AsyncMock(return_value=(csv_path, 1, 2))
             return MagicMock(return_value=mock_scraper)
 
         mock_scrapers = {
@@ -148,7 +143,7 @@ class TestMain:
             "ovh": create_mock("ovh"),
         }
 
-        with patch.dict(SCRAPERS, mock_scrapers):
+        with patch("scraper.cli.load_scraper", side_effect=mock_scrapers.__getitem__):
             with patch.object(sys, "argv", ["cli.py"]):
                 with patch("scraper.cli.Path") as mock_path:
                     mock_path.return_value.parent.parent.__truediv__.return_value = temp_output_base
@@ -185,15 +180,15 @@ class TestMain:
         ovh_scraper = AsyncMock()
         hetzner_csv = temp_output_base / "hetzner" / "offerings.csv"
         ovh_csv = temp_output_base / "ovh" / "offerings.csv"
-        hetzner_scraper.run = AsyncMock(return_value=(hetzner_csv, 1))
-        ovh_scraper.run = AsyncMock(return_value=(ovh_csv, 1))
+        hetzner_scraper.run = AsyncMock(return_value=(hetzner_csv, 2, 1))
+        ovh_scraper.run = AsyncMock(return_value=(ovh_csv, 2, 1))
 
         mock_scrapers = {
             "hetzner": MagicMock(return_value=hetzner_scraper),
             "ovh": MagicMock(return_value=ovh_scraper),
         }
 
-        with patch.dict(SCRAPERS, mock_scrapers, clear=False):
+        with patch("scraper.cli.load_scraper", side_effect=mock_scrapers.__getitem__):
             with patch.object(sys, "argv", ["cli.py", "hetzner", "ovh"]):
                 with patch("scraper.cli.Path") as mock_path:
                     mock_path.return_value.parent.parent.__truediv__.return_value = temp_output_base
@@ -204,6 +199,52 @@ class TestMain:
         assert "=== Scraping ovh ===" in captured.out
         assert "=== Scraping contabo ===" not in captured.out
 
+    @pytest.mark.asyncio
+    async def test_providers_run_concurrently(self, temp_output_base, capsys):
+        """Providers are scraped at the same time, not one after another."""
+        import asyncio
+
+        both_started = asyncio.Event()
+        started = []
+
+        def create_mock(provider_name):
+            async def run(**kwargs):
+                started.append(provider_name)
+                if len(started) == 2:
+                    both_started.set()
+                # Times out if the providers run sequentially
+                await asyncio.wait_for(both_started.wait(), timeout=1)
+                return None, 0, 1
+
+            mock_scraper = AsyncMock()
+            mock_scraper.run = run
+            return MagicMock(return_value=mock_scraper)
+
+        mock_scrapers = {"hetzner": create_mock("hetzner"), "ovh": create_mock("ovh")}
+
+        with patch("scraper.cli.load_scraper", side_effect=mock_scrapers.__getitem__):
+            with patch.object(sys, "argv", ["cli.py", "hetzner", "ovh"]):
+                with patch("scraper.cli.Path") as mock_path:
+                    mock_path.return_value.parent.parent.__truediv__.return_value = temp_output_base
+                    await main()
+
+        assert sorted(started) == ["hetzner", "ovh"]
+        assert "Total: 0 offerings, 2 docs" in capsys.readouterr().out
+
+
+class TestLoadScraper:
+    """Test lazy provider loading."""
+
+    def test_load_scraper_imports_registered_class(self):
+        from scraper.providers.hetzner import HetznerScraper
+
+        assert load_scraper("hetzner") is HetznerScraper
+
+    def test_cli_import_does_not_load_crawler(self):
+        """help/setup must not pay for importing Crawl4AI/Playwright."""
+        code = "import sys, scraper.cli; sys.exit('crawl4ai' in sys.modules)"
+        assert subprocess.run([sys.executable, "-c", code]).returncode == 0
+
 
 class TestCLI:
     """Test CLI entry point."""
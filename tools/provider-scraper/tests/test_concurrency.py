@@ -0,0 +1,54 @@
+"""Tests for the adaptive concurrency limiter."""
+
+import asyncio
+
+import pytest
+
+from scraper.concurrency import AIMDLimiter
+
+
+class TestAIMDLimiter:
+    """Tests for AIMD limit adjustment and slot accounting."""
+
+    def test_initial_limit_is_clamped_to_bounds(self):
+        assert AIMDLimiter(initial=50, maximum=8).limit == 8
+        assert AIMDLimiter(initial=0, minimum=2).limit == 2
+
+    def test_rejects_invalid_bounds(self):
+        with pytest.raises(ValueError, match="Invalid limiter bounds"):
+            AIMDLimiter(minimum=5, maximum=2)
+
+    def test_halves_on_overload_down_to_minimum(self):
+        limiter = AIMDLimiter(initial=8)
+        limiter.record(overloaded=True)
+        assert limiter.limit == 4
+        for _ in range(5):
+            limiter.record(overloaded=True)
+        assert limiter.limit == 1
+
+    def test_grows_about_one_per_window_of_successes(self):
+        limiter = AIMDLimiter(initial=4)
+        for _ in range(3):
+            limiter.record(overloaded=False)
+        assert limiter.limit == 4  # not yet a full window
+        for _ in range(2):
+            limiter.record(overloaded=False)
+        assert limiter.limit == 5
+
+    @pytest.mark.asyncio
+    async def test_never_exceeds_limit_in_flight(self):
+        limiter = AIMDLimiter(initial=2, maximum=2)
+        in_flight = 0
+        peak = 0
+
+        async def work():
+            nonlocal in_flight, peak
+            async with limiter:
+                in_flight += 1
+                peak = max(peak, in_flight)
+                await asyncio.sleep(0.01)
+                in_flight -= 1
+                limiter.record(overloaded=False)
+
+        await asyncio.gather(*(work() for _ in range(6)))
+        assert peak == 2
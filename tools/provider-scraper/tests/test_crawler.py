@@ -1,5 +1,7 @@
 """Tests for crawler module."""
 
+from unittest.mock import AsyncMock, patch
+
 import pytest
 from crawl4ai import BrowserConfig, CacheMode, CrawlerRunConfig
 from crawl4ai.content_filter_strategy import PruningContentFilter
@@ -7,10 +9,14 @@ from crawl4ai.markdown_generation_strategy import DefaultMarkdownGenerator
 
 from scraper.crawler import (
     DEFAULT_BROWSER_CONFIG,
+    DEFAULT_CRAWL_CONFIG,
+    DEFAULT_MARKDOWN_GENERATOR,
     DEFAULT_PRUNING_THRESHOLD,
     DEFAULT_WORD_THRESHOLD,
+    SharedCrawler,
     create_crawl_config,
     create_markdown_generator,
+    is_rate_limited,
 )
 
 
@@ -140,6 +146,72 @@ class TestCreateCrawlConfig:
         assert config.verbose is False
 
 
+class TestDefaultCrawlConfig:
+    """Tests for DEFAULT_CRAWL_CONFIG."""
+
+    def test_is_crawler_run_config_instance(self):
+        """Verify DEFAULT_CRAWL_CONFIG is a CrawlerRunConfig instance."""
+        assert isinstance(DEFAULT_CRAWL_CONFIG, CrawlerRunConfig)
+
+    def test_uses_default_markdown_generator(self):
+        """Verify the shared markdown generator is reused, not rebuilt."""
+        assert DEFAULT_CRAWL_CONFIG.markdown_generator is DEFAULT_MARKDOWN_GENERATOR
+
+    def test_default_cache_mode_bypass(self):
+        """Verify default cache mode is BYPASS."""
+        assert DEFAULT_CRAWL_CONFIG.cache_mode == CacheMode.BYPASS
+
+
+class TestIsRateLimited:
+    """Tests for rate limit detection in crawl error messages."""
+
+    @pytest.mark.parametrize(
+        "message",
+        [
+            "HTTP 429 Too Many Requests",
+            "Rate limit exceeded",
+            "rate-limited by upstream",
+            "Request throttled",
+        ],
+    )
+    def test_detects_rate_limiting(self, message):
+        assert is_rate_limited(message)
+
+    @pytest.mark.parametrize(
+        "message",
+        [None, "", "Connection timeout", "Failed to generate markdown", "HTTP 4290 bytes"],
+    )
+    def test_ignores_other_errors(self, message):
+        assert not is_rate_limited(message)
+
+
+class TestSharedCrawler:
+    """Tests for the browser shared across scrapers."""
+
+    @pytest.mark.asyncio
+    async def test_launches_once_on_first_use_and_closes(self):
+        with patch("scraper.crawler.AsyncWebCrawler") as mock_crawler_class:
+            mock_crawler = mock_crawler_class.return_value
+            mock_crawler.start = AsyncMock()
+            mock_crawler.close = AsyncMock()
+
+            async with SharedCrawler() as shared:
+                mock_crawler_class.assert_not_called()
+                assert await shared.get() is mock_crawler
+                assert await shared.get() is mock_crawler
+
+        mock_crawler_class.assert_called_once()
+        mock_crawler.start.assert_awaited_once()
+        mock_crawler.close.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_close_without_use_does_not_launch(self):
+        with patch("scraper.crawler.AsyncWebCrawler") as mock_crawler_class:
+            async with SharedCrawler():
+                pass
+        mock_crawler_class.assert_not_called()
+
+
 class TestIntegration:
     """Integration tests combining multiple components."""
 
@@ -31,6 +31,11 @@ def test_csv_headers_required_fields() -> None:
         assert field in CSV_HEADERS
 
 
+def test_csv_headers_match_offering_fields() -> None:
+    """Test that every header is an Offering field, since rows read them as attributes."""
+    assert set(CSV_HEADERS) == set(Offering.model_fields)
+
+
 def test_offerings_to_csv_string_minimal() -> None:
     """Test CSV output with minimal offering."""
     offering = Offering(
@@ -83,7 +88,7 @@ def test_write_offerings_csv_creates_file() -> None:
     )
     with TemporaryDirectory() as tmpdir:
         path = Path(tmpdir) / "output" / "test.csv"
-        write_offerings_csv([offering], path)
+        assert write_offerings_csv([offering], path) == 1
 
         assert path.exists()
         content = path.read_text()
@@ -1,8 +1,20 @@
 """Tests for discovery module."""
 
+import asyncio
+from unittest.mock import patch
+
+import httpx
 import pytest
 
-from scraper.discovery import parse_sitemap_xml, _extract_sitemaps_from_robots
+from scraper.discovery import (
+    SITEMAP_PATHS,
+    DiscoveryError,
+    SitemapStream,
+    _extract_sitemaps_from_robots,
+    discover_sitemap,
+    parse_sitemap_xml,
+)
+from scraper.storage import SitemapCache
 
 
 class TestParseSitemapXml:
@@ -169,6 +181,266 @@ class TestParseSitemapXml:
         assert urls[0] == "https://example.com/test"
 
 
+class TestSitemapStream:
+    """Tests for incremental sitemap parsing."""
+
+    def test_urls_split_across_chunks(self):
+        xml = (
+            b'<?xml version="1.0"?><urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">'
+            b"<url><loc>https://example.com/a</loc></url>"
+            b"<url><loc>https://example.com/b</loc></url></urlset>"
+        )
+        stream = SitemapStream()
+        urls = []
+        for i in range(0, len(xml), 7):
+            urls.extend(stream.feed(xml[i : i + 7]))
+        urls.extend(stream.close())
+        assert urls == ["https://example.com/a", "https://example.com/b"]
+        assert stream.is_index is False
+
+    def test_detects_sitemap_index_from_root(self):
+        stream = SitemapStream()
+        stream.feed(b'<sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">')
+        assert stream.is_index is True
+
+    def test_ignores_nested_non_entry_locs(self):
+        """Image <loc> tags inside an <url> entry are not page URLs."""
+        xml = """<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9"
+        xmlns:image="http://www.google.com/schemas/sitemap-image/1.1">
+  <url>
+    <loc>https://example.com/page</loc>
+    <image:image><image:loc>https://example.com/pic.png</image:loc></image:image>
+  </url>
+</urlset>"""
+        assert parse_sitemap_xml(xml) == ["https://example.com/page"]
+
+    def test_accepts_undecoded_bytes(self):
+        """Raw response bytes parse without decoding first, per the XML declaration."""
+        xml = """<?xml version="1.0" encoding="UTF-8"?>
+<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">
+  <url><loc>https://example.com/caf\u00e9</loc></url>
+</urlset>""".encode("utf-8")
+        assert parse_sitemap_xml(xml) == ["https://example.com/caf\u00e9"]
+
+
+def mock_http(routes):
+    """Patch httpx.AsyncClient in scraper.discovery to serve `routes` (url -> response)."""
+    real_client = httpx.AsyncClient
+
+    def handler(request):
+        return routes.get(str(request.url), httpx.Response(404))
+
+    def make_client(**kwargs):
+        return real_client(transport=httpx.MockTransport(handler), **kwargs)
+
+    return patch("scraper.discovery.httpx.AsyncClient", side_effect=make_client)
+
+
+def urlset(*urls):
+    locs = "".join(f"<url><loc>{url}</loc></url>" for url in urls)
+    return f"<urlset>{locs}</urlset>"
+
+
+class TestDiscoverSitemap:
+    """Tests for sitemap discovery over HTTP."""
+
+    @pytest.mark.asyncio
+    async def test_follows_sitemap_index_to_children(self):
+        index = (
+            "<sitemapindex>"
+            "<sitemap><loc>https://example.com/docs.xml</loc></sitemap>"
+            "<sitemap><loc>https://example.com/blog.xml</loc></sitemap>"
+            "</sitemapindex>"
+        )
+        routes = {
+            "https://example.com/sitemap.xml": httpx.Response(200, text=index),
+            "https://example.com/docs.xml": httpx.Response(
+                200, text=urlset("https://example.com/docs/a")
+            ),
+            "https://example.com/blog.xml": httpx.Response(
+                200, text=urlset("https://example.com/blog/b")
+            ),
+        }
+        with mock_http(routes):
+            urls = await discover_sitemap("https://example.com")
+
+        assert urls == ["https://example.com/docs/a", "https://example.com/blog/b"]
+
+    @pytest.mark.asyncio
+    async def test_fetches_child_sitemaps_concurrently(self):
+        children = [f"https://example.com/part{i}.xml" for i in range(3)]
+        locs = "".join(f"<sitemap><loc>{url}</loc></sitemap>" for url in children)
+        in_flight = 0
+        max_in_flight = 0
+
+        async def handler(request):
+            nonlocal in_flight, max_in_flight
+            url = str(request.url)
+            if url == "https://example.com/sitemap.xml":
+                return httpx.Response(200, text=f"<sitemapindex>{locs}</sitemapindex>")
+            if url not in children:
+                return httpx.Response(404)
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return httpx.Response(200, text=urlset(url.replace(".xml", "/page")))
+
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            urls = await discover_sitemap("https://example.com", client=client)
+
+        assert urls == [url.replace(".xml", "/page") for url in children]
+        assert max_in_flight == 3
+
+    @pytest.mark.asyncio
+    async def test_raises_when_child_sitemap_rate_limited(self):
+        routes = {
+            "https://example.com/sitemap.xml": httpx.Response(
+                200,
+                text="<sitemapindex><sitemap><loc>https://example.com/docs.xml</loc></sitemap></sitemapindex>",
+            ),
+            "https://example.com/docs.xml": httpx.Response(
+                200, text="<html>429 Too Many Requests</html>"
+            ),
+        }
+        with mock_http(routes), pytest.raises(DiscoveryError, match="child sitemap"):
+            await discover_sitemap("https://example.com")
+
+    @pytest.mark.asyncio
+    async def test_detects_index_by_root_not_extension(self):
+        index = "<sitemapindex><sitemap><loc>https://example.com/sitemap?page=1</loc></sitemap></sitemapindex>"
+        routes = {
+            "https://example.com/sitemap.xml": httpx.Response(200, text=index),
+            "https://example.com/sitemap?page=1": httpx.Response(
+                200, text=urlset("https://example.com/feed.xml")
+            ),
+        }
+        with mock_http(routes):
+            urls = await discover_sitemap("https://example.com")
+
+        # Followed as an index although the child URL has no .xml suffix
+        assert urls == ["https://example.com/feed.xml"]
+
+    @pytest.mark.asyncio
+    async def test_urlset_of_xml_pages_is_not_an_index(self):
+        routes = {
+            "https://example.com/sitemap.xml": httpx.Response(
+                200, text=urlset("https://example.com/feed.xml")
+            )
+        }
+        with mock_http(routes):
+            assert await discover_sitemap("https://example.com") == ["https://example.com/feed.xml"]
+
+    @pytest.mark.asyncio
+    async def test_uses_sitemap_from_robots_txt(self):
+        routes = {
+            "https://example.com/robots.txt": httpx.Response(
+                200, text="User-agent: *\nSitemap: https://example.com/custom.xml\n"
+            ),
+            "https://example.com/custom.xml": httpx.Response(
+                200, text=urlset("https://example.com/page")
+            ),
+        }
+        with mock_http(routes):
+            assert await discover_sitemap("https://example.com") == ["https://example.com/page"]
+
+    @pytest.mark.asyncio
+    async def test_returns_none_without_sitemap(self):
+        with mock_http({}):
+            assert await discover_sitemap("https://example.com") is None
+
+    @pytest.mark.asyncio
+    async def test_raises_on_rate_limit_page(self):
+        routes = {
+            "https://example.com/sitemap.xml": httpx.Response(
+                200, text="<html>429 Too Many Requests</html>"
+            ),
+        }
+        with mock_http(routes), pytest.raises(DiscoveryError, match="Rate limited"):
+            await discover_sitemap("https://example.com")
+
+    @pytest.mark.asyncio
+    async def test_reuses_given_client(self):
+        routes = {
+            "https://example.com/sitemap.xml": httpx.Response(
+                200, text=urlset("https://example.com/page")
+            )
+        }
+        transport = httpx.MockTransport(
+            lambda request: routes.get(str(request.url), httpx.Response(404))
+        )
+        async with httpx.AsyncClient(transport=transport) as client:
+            with patch("scraper.discovery.httpx.AsyncClient") as client_cls:
+                urls = await discover_sitemap("https://example.com", client=client)
+            assert not client.is_closed
+
+        assert urls == ["https://example.com/page"]
+        client_cls.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_serves_unchanged_sitemap_from_cache(self, tmp_path):
+        cache = SitemapCache(tmp_path / "sitemaps.json")
+        sitemap = urlset("https://example.com/page")
+        routes = {
+            "https://example.com/sitemap.xml": httpx.Response(
+                200, text=sitemap, headers={"ETag": '"v1"'}
+            )
+        }
+        with mock_http(routes):
+            assert await discover_sitemap("https://example.com", cache=cache) == [
+                "https://example.com/page"
+            ]
+
+        seen_headers = []
+
+        def handler(request):
+            seen_headers.append(request.headers.get("if-none-match"))
+            return httpx.Response(304)
+
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            urls = await discover_sitemap(
+                "https://example.com", client=client, cache=SitemapCache(cache.path)
+            )
+
+        assert urls == ["https://example.com/page"]
+        assert seen_headers == ['"v1"']
+
+    @pytest.mark.asyncio
+    async def test_probes_last_hit_path_first(self, tmp_path):
+        cache = SitemapCache(tmp_path / "sitemaps.json")
+        cache.record_sitemap_path("https://example.com", "/sitemap1.xml")
+        requested = []
+
+        def handler(request):
+            requested.append(request.url.path)
+            if request.url.path == "/sitemap1.xml":
+                return httpx.Response(200, text=urlset("https://example.com/page"))
+            return httpx.Response(404)
+
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            urls = await discover_sitemap("https://example.com", client=client, cache=cache)
+
+        assert urls == ["https://example.com/page"]
+        assert requested == ["/sitemap1.xml"]
+
+    @pytest.mark.asyncio
+    async def test_skips_probes_for_site_known_without_sitemap(self, tmp_path):
+        cache = SitemapCache(tmp_path / "sitemaps.json")
+        requested = []
+
+        def handler(request):
+            requested.append(request.url.path)
+            return httpx.Response(404)
+
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            assert await discover_sitemap("https://example.com", client=client, cache=cache) is None
+            probes = len(requested)
+            assert await discover_sitemap("https://example.com", client=client, cache=cache) is None
+
+        assert probes == len(SITEMAP_PATHS)
+        assert len(requested) == probes
+
+
 class TestExtractSitemapsFromRobots:
     """Tests for _extract_sitemaps_from_robots function."""
 
@@ -91,3 +91,32 @@ def test_offering_missing_required_field() -> None:
             offer_name="Incomplete",
             # missing: monthly_price, product_type, datacenter_country, datacenter_city
         )  # type: ignore[call-arg]
+
+
+def test_offering_unknown_field_rejected() -> None:
+    """Test that misspelled or unknown fields raise validation errors."""
+    with pytest.raises(ValidationError):
+        Offering(
+            offering_id="typo-1",
+            offer_name="Typo Server",
+            monthly_price=10.0,
+            product_type="compute",
+            datacenter_country="US",
+            datacenter_city="NYC",
+            memory_amout=16,  # typo of memory_amount
+        )  # type: ignore[call-arg]
+
+
+def test_offering_is_frozen() -> None:
+    """Test that offerings can't be modified after creation and are hashable."""
+    offering = Offering(
+        offering_id="frozen-1",
+        offer_name="Frozen Server",
+        monthly_price=10.0,
+        product_type="compute",
+        datacenter_country="US",
+        datacenter_city="NYC",
+    )
+    with pytest.raises(ValidationError):
+        offering.monthly_price = 5.0  # type: ignore[misc]
+    assert len({offering, offering.model_copy()}) == 1
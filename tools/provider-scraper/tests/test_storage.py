@@ -1,13 +1,16 @@
 """Tests for storage module."""
 
+import hashlib
 import json
+import time
 import zipfile
 from datetime import datetime, timezone
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
-from scraper.storage import CacheEntry, DocsArchive
+from scraper.storage import SITEMAP_MISS_TTL, CacheEntry, DocsArchive, SitemapCache, SitemapEntry
 
 
 @pytest.fixture
@@ -61,7 +64,7 @@ class TestCacheLoadSave:
         archive._save_cache()
 
         assert archive.cache_path.exists()
-        with open(archive.cache_path, "r") as f:
+        with open(archive.cache_path) as f:
             data = json.load(f)
 
         assert "https://example.com/page1" in data
@@ -117,6 +120,27 @@ class TestContentHash:
         hash2 = archive._content_hash(content)
         assert hash1 == hash2
 
+    def test_write_if_changed_hashes_once(self, archive):
+        """Verify write_if_changed() checks and writes with a single hash."""
+        url = "https://example.com/page"
+        archive.write(url, "old content", "page")
+
+        with patch("scraper.storage.hashlib.sha256", wraps=hashlib.sha256) as sha256:
+            assert archive.write_if_changed(url, "new content", "page") == "page.md"
+
+        assert sha256.call_count == 1
+        assert archive.read(url) == "new content"
+
+    def test_write_if_changed_skips_unchanged(self, archive):
+        """Verify write_if_changed() writes nothing for unchanged content."""
+        url = "https://example.com/page"
+        archive.write(url, "same content", "page")
+        journal_before = archive.journal_path.read_text(encoding="utf-8")
+
+        assert archive.write_if_changed(url, "same content", "other-topic") is None
+        assert archive.journal_path.read_text(encoding="utf-8") == journal_before
+        assert not (archive.docs_dir / "other-topic.md").exists()
+
     def test_content_hash_different_for_different_content(self, archive):
         """Verify _content_hash returns different hash for different content."""
         hash1 = archive._content_hash("content 1")
@@ -191,7 +215,10 @@ class TestHasChanged:
         }
 
         # ETag matches - not changed
-        assert archive.has_changed("https://example.com/page", '"abc123"', "different content") is False
+        assert (
+            archive.has_changed("https://example.com/page", '"abc123"', "different content")
+            is False
+        )
 
     def test_has_changed_etag_mismatch_returns_true(self, archive):
         """Verify has_changed returns True when ETags differ."""
@@ -250,7 +277,21 @@ class TestHasChanged:
         }
 
         # ETag matches - not changed (even though content hash would differ)
-        assert archive.has_changed("https://example.com/page", '"abc123"', "different content") is False
+        assert (
+            archive.has_changed("https://example.com/page", '"abc123"', "different content")
+            is False
+        )
+
+
+class TestEtagFor:
+    """Tests for stored ETag lookup."""
+
+    def test_etag_for_unknown_url_is_none(self, archive):
+        assert archive.etag_for("https://example.com/new") is None
+
+    def test_etag_for_returns_etag_from_last_write(self, archive):
+        archive.write("https://example.com/page", "content", "page", '"abc123"')
+        assert archive.etag_for("https://example.com/page") == '"abc123"'
 
 
 class TestWrite:
@@ -273,6 +314,18 @@ class TestWrite:
         assert local_path.exists()
         assert local_path.read_text(encoding="utf-8") == content
 
+    def test_write_stores_utf8(self, archive):
+        """Verify non-ASCII content is written as UTF-8 and hashed from the same bytes."""
+        content = "# Preise\n\nAb 4,99 € im Monat"
+        archive.write("https://example.com/page", content, "preise")
+
+        data = (archive.docs_dir / "preise.md").read_bytes()
+        assert data == content.encode("utf-8")
+        assert (
+            archive._cache["https://example.com/page"].content_hash
+            == hashlib.sha256(data).hexdigest()[:16]
+        )
+
     def test_write_updates_cache(self, archive):
         """Verify write updates cache with correct entry."""
         content = "# Test"
@@ -290,15 +343,41 @@ class TestWrite:
         assert (datetime.now(timezone.utc) - crawled_dt).total_seconds() < 5
 
     def test_write_saves_cache_to_disk(self, archive):
-        """Verify write persists cache to cache.json."""
+        """Verify write journals the cache update and finalize compacts it into cache.json."""
         archive.write("https://example.com/page", "# Test", "test-page")
 
-        assert archive.cache_path.exists()
-        with open(archive.cache_path, "r") as f:
+        lines = archive.journal_path.read_text().splitlines()
+        assert len(lines) == 1
+        assert json.loads(lines[0])["url"] == "https://example.com/page"
+
+        archive.finalize()
+
+        assert not archive.journal_path.exists()
+        with open(archive.cache_path) as f:
             data = json.load(f)
 
         assert "https://example.com/page" in data
 
+    def test_unfinalized_journal_is_replayed_on_load(self, tmp_output_dir):
+        """Verify cache updates survive a run that never reached finalize."""
+        archive = DocsArchive(tmp_output_dir)
+        archive.write("https://example.com/page", "# Version 1", "page", '"v1"')
+        archive.write("https://example.com/page", "# Version 2", "page", '"v2"')
+        # Simulate a crash mid-append
+        with open(archive.journal_path, "a") as f:
+            f.write('{"url": "https://example.com/torn", "filen')
+
+        reloaded = DocsArchive(tmp_output_dir)
+
+        assert list(reloaded._cache) == ["https://example.com/page"]
+        assert reloaded.etag_for("https://example.com/page") == '"v2"'
+
+        reloaded.write("https://example.com/other", "# Other", "other")
+        assert set(DocsArchive(tmp_output_dir)._cache) == {
+            "https://example.com/page",
+            "https://example.com/other",
+        }
+
     def test_write_updates_existing_file_in_local_dir(self, archive):
         """Verify write updates existing file in local docs/ dir."""
         # Write initial content
@@ -393,6 +472,7 @@ class TestRead:
         }
         # Remove docs dir content (file doesn't exist)
         import shutil
+
         shutil.rmtree(archive.docs_dir)
         archive.docs_dir.mkdir()
 
@@ -488,3 +568,64 @@ class TestIntegration:
         archive2 = DocsArchive(tmp_output_dir)
         assert archive2.has_changed(url, etag, content) is False
         assert archive2.read(url) == content
+
+
+class TestSitemapCache:
+    """Tests for SitemapCache."""
+
+    def test_persists_entries_across_instances(self, tmp_output_dir):
+        """Verify saved entries are loaded by a new instance."""
+        path = tmp_output_dir / "sitemaps.json"
+        cache = SitemapCache(path)
+        cache.put("https://example.com/sitemap.xml", '"v1"', None, ["https://example.com/a"])
+        cache.save()
+
+        entry = SitemapCache(path).get("https://example.com/sitemap.xml")
+        assert entry == SitemapEntry(
+            etag='"v1"', last_modified=None, urls=["https://example.com/a"]
+        )
+
+    def test_skips_sitemaps_without_validators(self, tmp_output_dir):
+        """Verify sitemaps that can't be revalidated are not stored."""
+        cache = SitemapCache(tmp_output_dir / "sitemaps.json")
+        cache.put("https://example.com/sitemap.xml", None, None, ["https://example.com/a"])
+        cache.save()
+
+        assert cache.get("https://example.com/sitemap.xml") is None
+        assert not cache.path.exists()
+
+    def test_conditional_headers(self):
+        """Verify both validators become conditional request headers."""
+        entry = SitemapEntry(etag='"v1"', last_modified="Wed, 01 Jan 2025 00:00:00 GMT", urls=[])
+        assert entry.conditional_headers() == {
+            "If-None-Match": '"v1"',
+            "If-Modified-Since": "Wed, 01 Jan 2025 00:00:00 GMT",
+        }
+
+    def test_raises_on_corrupted_file(self, tmp_output_dir):
+        """Verify a corrupted cache file fails loudly."""
+        path = tmp_output_dir / "sitemaps.json"
+        path.write_text("not json", encoding="utf-8")
+
+        with pytest.raises(json.JSONDecodeError):
+            SitemapCache(path)
+
+    def test_remembers_sitemap_path_across_instances(self, tmp_output_dir):
+        """Verify the path a site's sitemap was found at is persisted."""
+        path = tmp_output_dir / "sitemaps.json"
+        cache = SitemapCache(path)
+        cache.record_sitemap_path("https://example.com", "/sitemap_index.xml")
+        cache.save()
+
+        reloaded = SitemapCache(path)
+        assert reloaded.sitemap_path("https://example.com") == "/sitemap_index.xml"
+        assert reloaded.is_known_missing("https://example.com") is False
+
+    def test_known_missing_expires(self, tmp_output_dir):
+        """Verify a site without sitemap is only skipped within SITEMAP_MISS_TTL."""
+        cache = SitemapCache(tmp_output_dir / "sitemaps.json")
+        cache.record_sitemap_path("https://example.com", None)
+        assert cache.is_known_missing("https://example.com") is True
+
+        with patch("scraper.storage.time.time", return_value=time.time() + SITEMAP_MISS_TTL + 1):
+            assert cache.is_known_missing("https://example.com") is False